@@ -0,0 +1,27 @@
+"""Optional-dependency shims shared across the SDK - December 2025 State of Art.
+
+Resolves optional speedups once so modules that need them import one
+typed name instead of repeating the detection.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# httpx supports HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# JSON decoder for fetched and shared key sets
+json_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    import json
+
+    json_loads = json.loads
@@ -9,9 +9,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Self
 
 import jwt
-from jwt import algorithms
 
 from .config import AuthPlatformConfig
+from .core.claims_cache import ClaimsCache
+from .core.refresh_coalescer import RefreshCoalescer
+from .core.token_validator import unverified_key_id
 from .dpop import DPoPKeyPair
 from .errors import (
     TokenExpiredError,
@@ -47,6 +49,11 @@ class AsyncAuthPlatformClient:
             config.jwks_uri or f"{config.base_url_str}/.well-known/jwks.json",
             ttl_seconds=config.cache.jwks_ttl,
             refresh_ahead_seconds=config.cache.jwks_refresh_ahead,
+            shared_cache_dir=config.cache.jwks_shared_dir,
+        )
+        self._claims_cache = ClaimsCache(
+            ttl_seconds=config.cache.claims_ttl,
+            max_size=config.cache.claims_max_size,
         )
         self._tokens: TokenData | None = None
         self._circuit_breaker = CircuitBreaker()
@@ -57,6 +64,9 @@ class AsyncAuthPlatformClient:
         if config.dpop.enabled:
             self._dpop_key = DPoPKeyPair(algorithm=config.dpop.algorithm)
 
+        # Coalesces concurrent refreshes of the stored token
+        self._refresh_coalescer: RefreshCoalescer[TokenResponse] = RefreshCoalescer()
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -64,7 +74,8 @@ class AsyncAuthPlatformClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and stop background JWKS refresh."""
+        await self._jwks_cache.close()
         await self._http.aclose()
 
     async def validate_token(self, token: str) -> TokenClaims:
@@ -79,34 +90,31 @@ class AsyncAuthPlatformClient:
         Raises:
             ValidationError: If token is invalid.
         """
+        # A token validated moments ago needs no second signature check
+        claims = self._claims_cache.get(token)
+        if claims is not None:
+            return claims
+
         with trace_operation("validate_token"):
             try:
                 # Get key ID from token header
-                header = jwt.get_unverified_header(token)
-                kid = header.get("kid")
+                kid = unverified_key_id(token)
 
                 if not kid:
                     raise ValidationError("Token missing kid header")
 
-                # Get key from cache
-                jwk = await self._jwks_cache.get_signing_key(kid)
-
-                # Build key from JWK
-                key: Any
-                if jwk.kty == "EC":
-                    key = algorithms.ECAlgorithm.from_jwk(jwk.model_dump())
-                elif jwk.kty == "RSA":
-                    key = algorithms.RSAAlgorithm.from_jwk(jwk.model_dump())
-                else:
-                    raise ValidationError(f"Unsupported key type: {jwk.kty}")
+                # Prepared key object from cache
+                signing_key = await self._jwks_cache.get_verification_key(kid)
 
                 decoded = jwt.decode(
                     token,
-                    key,
+                    signing_key.key,
                     algorithms=["ES256", "ES384", "RS256", "RS384", "RS512"],
                     audience=self.config.client_id,
                 )
-                return TokenClaims(**decoded)
+                claims = TokenClaims(**decoded)
+                self._claims_cache.put(token, claims)
+                return claims
 
             except jwt.exceptions.ExpiredSignatureError as e:
                 raise TokenExpiredError() from e
@@ -151,6 +159,9 @@ class AsyncAuthPlatformClient:
     async def refresh_token(self, refresh_token: str | None = None) -> TokenResponse:
         """Refresh access token.
 
+        Concurrent refreshes of the stored token share one request to the
+        token endpoint.
+
         Args:
             refresh_token: Refresh token (uses stored token if not provided).
 
@@ -160,7 +171,16 @@ class AsyncAuthPlatformClient:
         Raises:
             TokenRefreshError: If refresh fails.
         """
-        token = refresh_token or (self._tokens.refresh_token if self._tokens else None)
+        if refresh_token:
+            return await self._refresh(refresh_token)
+        return await self._refresh_coalescer.run(self._refresh_stored_token)
+
+    async def _refresh_stored_token(self) -> TokenResponse:
+        """Refresh using the stored refresh token."""
+        return await self._refresh(self._tokens.refresh_token if self._tokens else None)
+
+    async def _refresh(self, token: str | None) -> TokenResponse:
+        """Exchange a refresh token for new tokens."""
         if not token:
             raise TokenRefreshError("No refresh token available")
 
@@ -320,4 +340,4 @@ class AsyncAuthPlatformClient:
                 return await self._token_request(data)
 
         response.raise_for_status()
-        return TokenResponse(**response.json())
+        return TokenResponse.from_json(response.content)
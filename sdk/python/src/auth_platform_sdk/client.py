@@ -13,6 +13,8 @@ import jwt
 from jwt import algorithms
 
 from .config import AuthPlatformConfig
+from .core.claims_cache import ClaimsCache
+from .core.refresh_coalescer import RefreshCoalescer
 from .dpop import DPoPKeyPair
 from .errors import (
     DPoPError,
@@ -53,6 +55,11 @@ class AuthPlatformClient:
             config.jwks_uri or f"{config.base_url_str}/.well-known/jwks.json",
             ttl_seconds=config.cache.jwks_ttl,
             refresh_ahead_seconds=config.cache.jwks_refresh_ahead,
+            shared_cache_dir=config.cache.jwks_shared_dir,
+        )
+        self._claims_cache = ClaimsCache(
+            ttl_seconds=config.cache.claims_ttl,
+            max_size=config.cache.claims_max_size,
         )
         self._tokens: TokenData | None = None
         self._circuit_breaker = CircuitBreaker()
@@ -63,6 +70,9 @@ class AuthPlatformClient:
         if config.dpop.enabled:
             self._dpop_key = DPoPKeyPair(algorithm=config.dpop.algorithm)
 
+        # Coalesces concurrent refreshes of the stored token
+        self._refresh_coalescer: RefreshCoalescer[TokenResponse] = RefreshCoalescer()
+
     def __enter__(self) -> Self:
         return self
 
@@ -70,7 +80,8 @@ class AuthPlatformClient:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and stop background JWKS refresh."""
+        self._jwks_cache.close()
         self._http.close()
 
     def validate_token(self, token: str) -> TokenClaims:
@@ -85,6 +96,11 @@ class AuthPlatformClient:
         Raises:
             ValidationError: If token is invalid.
         """
+        # A token validated moments ago needs no second signature check
+        claims = self._claims_cache.get(token)
+        if claims is not None:
+            return claims
+
         with trace_operation("validate_token"):
             try:
                 signing_key = self._jwks_cache.get_signing_key(token)
@@ -94,7 +110,9 @@ class AuthPlatformClient:
                     algorithms=["ES256", "ES384", "RS256", "RS384", "RS512"],
                     audience=self.config.client_id,
                 )
-                return TokenClaims(**decoded)
+                claims = TokenClaims(**decoded)
+                self._claims_cache.put(token, claims)
+                return claims
             except jwt.exceptions.ExpiredSignatureError as e:
                 raise TokenExpiredError() from e
             except jwt.exceptions.InvalidTokenError as e:
@@ -136,6 +154,9 @@ class AuthPlatformClient:
     def refresh_token(self, refresh_token: str | None = None) -> TokenResponse:
         """Refresh access token.
 
+        Concurrent refreshes of the stored token share one request to the
+        token endpoint.
+
         Args:
             refresh_token: Refresh token (uses stored token if not provided).
 
@@ -145,7 +166,16 @@ class AuthPlatformClient:
         Raises:
             TokenRefreshError: If refresh fails.
         """
-        token = refresh_token or (self._tokens.refresh_token if self._tokens else None)
+        if refresh_token:
+            return self._refresh(refresh_token)
+        return self._refresh_coalescer.run_sync(self._refresh_stored_token)
+
+    def _refresh_stored_token(self) -> TokenResponse:
+        """Refresh using the stored refresh token."""
+        return self._refresh(self._tokens.refresh_token if self._tokens else None)
+
+    def _refresh(self, token: str | None) -> TokenResponse:
+        """Exchange a refresh token for new tokens."""
         if not token:
             raise TokenRefreshError("No refresh token available")
 
@@ -305,4 +335,4 @@ class AuthPlatformClient:
                 return self._token_request(data)  # Retry with nonce
 
         response.raise_for_status()
-        return TokenResponse(**response.json())
+        return TokenResponse.from_json(response.content)
@@ -6,6 +6,7 @@ comprehensive configuration options.
 
 from __future__ import annotations
 
+import random
 from typing import Annotated, Any, Self
 
 from pydantic import (
@@ -13,6 +14,7 @@ from pydantic import (
     ConfigDict,
     Field,
     HttpUrl,
+    PrivateAttr,
     SecretStr,
     field_validator,
     model_validator,
@@ -30,14 +32,28 @@ class RetryConfig(BaseModel):
     exponential_base: Annotated[float, Field(ge=1.5, le=3.0)] = 2.0
     jitter: Annotated[float, Field(ge=0, le=1.0)] = 0.1
 
-    def get_delay(self, attempt: int) -> float:
-        """Calculate delay for given attempt with exponential backoff."""
-        import random
+    # Un-jittered delay per attempt, computed once since the model is frozen
+    _base_delays: tuple[float, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the backoff schedule for every allowed attempt."""
+        self._base_delays = tuple(
+            self._base_delay(attempt) for attempt in range(self.max_retries + 1)
+        )
 
-        delay = min(
+    def _base_delay(self, attempt: int) -> float:
+        """Exponential backoff delay for an attempt, capped at max_delay."""
+        return min(
             self.initial_delay * (self.exponential_base**attempt),
             self.max_delay,
         )
+
+    def get_delay(self, attempt: int) -> float:
+        """Calculate delay for given attempt with exponential backoff."""
+        if attempt < len(self._base_delays):
+            delay = self._base_delays[attempt]
+        else:
+            delay = self._base_delay(attempt)
         # Add jitter to prevent thundering herd
         jitter_range = delay * self.jitter
         return delay + random.uniform(-jitter_range, jitter_range)  # noqa: S311
@@ -82,7 +98,10 @@ class CacheConfig(BaseModel):
 
     jwks_ttl: Annotated[int, Field(gt=0)] = 3600  # 1 hour
     jwks_refresh_ahead: Annotated[int, Field(ge=0)] = 300  # 5 minutes
+    jwks_shared_dir: str | None = None  # Share fetched JWKS across worker processes
     token_buffer: Annotated[int, Field(ge=0)] = 60  # 1 minute before expiry
+    claims_ttl: Annotated[float, Field(ge=0)] = 5.0  # Reuse validated claims; 0 disables
+    claims_max_size: Annotated[int, Field(gt=0)] = 10_000
 
 
 class AuthPlatformConfig(BaseModel):
@@ -6,16 +6,24 @@ between sync and async clients.
 
 from __future__ import annotations
 
+from .claims_cache import ClaimsCache
 from .errors import ErrorFactory
 from .jwks_base import JWKSCacheBase
+from .jwks_file import SharedJWKSFile
+from .jwks_state import JWKSCacheState
+from .refresh_coalescer import RefreshCoalescer
 from .token_ops import TokenOperations
 from .auth_builder import AuthorizationBuilder
 from .token_validator import TokenValidator
 from .http_executor import SyncHTTPExecutor, AsyncHTTPExecutor
 
 __all__ = [
+    "ClaimsCache",
     "ErrorFactory",
     "JWKSCacheBase",
+    "SharedJWKSFile",
+    "JWKSCacheState",
+    "RefreshCoalescer",
     "TokenOperations",
     "AuthorizationBuilder",
     "TokenValidator",
@@ -0,0 +1,94 @@
+"""Short-lived cache of validated token claims - December 2025 State of Art.
+
+Lets repeated presentations of the same bearer token skip signature
+verification and claims parsing for a few seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models import TokenClaims
+
+
+class ClaimsCache:
+    """Bounded LRU of validated claims with a short TTL.
+
+    Entries are keyed by a BLAKE2b digest of the token, so raw tokens are
+    never held, and expire at the earlier of the cache TTL and the
+    token's own ``exp``. Cached claims are frozen models, so hits share
+    one instance safely.
+
+    Attributes:
+        ttl_seconds: Seconds a validated token is trusted without
+            re-verification; 0 disables the cache.
+        max_size: Maximum number of cached tokens.
+    """
+
+    __slots__ = ("_entries", "_lock", "max_size", "ttl_seconds")
+
+    def __init__(self, *, ttl_seconds: float = 5.0, max_size: int = 10_000) -> None:
+        """Initialize claims cache.
+
+        Args:
+            ttl_seconds: Seconds a validated token is trusted without
+                re-verification; 0 disables the cache.
+            max_size: Maximum number of cached tokens.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, TokenClaims]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> TokenClaims | None:
+        """Return cached claims for a token validated within the TTL.
+
+        Args:
+            token: JWT access token.
+
+        Returns:
+            Cached claims, or None on a miss or expired entry.
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, token: str, claims: TokenClaims) -> None:
+        """Remember claims for a token that just passed validation.
+
+        Args:
+            token: JWT access token.
+            claims: Claims produced by validating the token.
+        """
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = min(time.time() + self.ttl_seconds, claims.exp)
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached claims."""
+        with self._lock:
+            self._entries.clear()
@@ -24,6 +24,7 @@ from ..errors import (
     TokenRefreshError,
     ValidationError,
 )
+from ..http import parse_retry_after
 
 if TYPE_CHECKING:
     pass
@@ -113,10 +114,9 @@ class ErrorFactory:
             )
         
         if status == 429:
-            retry_after = response.headers.get("Retry-After")
             return RateLimitError(
                 details.get("error_description", "Rate limit exceeded"),
-                retry_after=int(retry_after) if retry_after and retry_after.isdigit() else None,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
                 correlation_id=correlation_id,
             )
         
@@ -7,15 +7,22 @@ for both sync and async clients.
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, Protocol
 
 import httpx
 
 from ..errors import NetworkError, RateLimitError, ServerError
-from ..http import CircuitBreaker
-from ..telemetry import get_logger, trace_operation
+from ..http import CircuitBreaker, parse_retry_after, should_retry_status
+from ..telemetry import (
+    get_logger,
+    log_level_enabled,
+    trace_operation,
+    trace_requests_enabled,
+)
 
 if TYPE_CHECKING:
     from ..config import AuthPlatformConfig, RetryConfig
@@ -34,6 +41,13 @@ class HTTPExecutorProtocol(Protocol):
         ...
 
 
+# Client.request() arguments that belong to send() rather than build_request()
+_SEND_ARGUMENTS = ("auth", "follow_redirects")
+
+# Retry delays below this are not worth an event-loop timer
+_MIN_ASYNC_DELAY = 0.001
+
+
 def calculate_retry_delay(retry_config: RetryConfig, attempt: int) -> float:
     """Calculate retry delay with exponential backoff.
     
@@ -47,21 +61,16 @@ def calculate_retry_delay(retry_config: RetryConfig, attempt: int) -> float:
     return retry_config.get_delay(attempt)
 
 
-def should_retry_status(status_code: int) -> bool:
-    """Check if status code should trigger retry.
-    
-    Args:
-        status_code: HTTP status code.
-        
-    Returns:
-        True if should retry.
-    """
-    return status_code == 429 or status_code >= 500
-
-
 class SyncHTTPExecutor:
     """Synchronous HTTP executor with retry and circuit breaker."""
 
+    __slots__ = (
+        "_circuit_breaker",
+        "_client",
+        "_logger",
+        "_retry_config",
+    )
+
     def __init__(
         self,
         client: httpx.Client,
@@ -106,53 +115,77 @@ class SyncHTTPExecutor:
             RateLimitError: On rate limiting.
             ServerError: On server error.
         """
+        send_kwargs = {k: kwargs.pop(k) for k in _SEND_ARGUMENTS if k in kwargs}
+        # Built once and re-sent on retries
+        request = self._client.build_request(method, url, **kwargs)
         last_error: Exception | None = None
+        # Outcomes not yet applied to the circuit breaker. Failures are
+        # flushed before the next attempt so the breaker can still open
+        # mid-sequence; the final outcome is recorded once on exit.
+        failures = 0
+        succeeded = False
+
+        try:
+            for attempt in range(self._retry_config.max_retries + 1):
+                if failures:
+                    self._circuit_breaker.record(failures=failures)
+                    failures = 0
+
+                if not self._circuit_breaker.allow_request():
+                    raise NetworkError("Circuit breaker is open")
+
+                try:
+                    response = self._execute_single(request, attempt, **send_kwargs)
+                    succeeded = True
+                    return response
+
+                except RateLimitError as e:
+                    failures += 1
+                    last_error = e
+                    delay = e.retry_after or calculate_retry_delay(
+                        self._retry_config, attempt
+                    )
+                    self._log_retry("Rate limited", attempt, delay)
+                    time.sleep(delay)
 
-        for attempt in range(self._retry_config.max_retries + 1):
-            if not self._circuit_breaker.allow_request():
-                raise NetworkError("Circuit breaker is open")
+                except ServerError:
+                    failures += 1
+                    raise
 
-            try:
-                response = self._execute_single(method, url, attempt, **kwargs)
-                return response
+                except (httpx.TimeoutException, httpx.ConnectError) as e:
+                    failures += 1
+                    last_error = NetworkError(str(e), cause=e)
 
-            except RateLimitError as e:
-                last_error = e
-                delay = e.retry_after or calculate_retry_delay(
-                    self._retry_config, attempt
-                )
-                self._log_retry("Rate limited", attempt, delay)
-                time.sleep(delay)
+                    if attempt < self._retry_config.max_retries:
+                        delay = calculate_retry_delay(self._retry_config, attempt)
+                        self._log_retry("Request failed", attempt, delay, e)
+                        time.sleep(delay)
 
-            except (httpx.TimeoutException, httpx.ConnectError) as e:
-                last_error = NetworkError(str(e), cause=e)
-                self._circuit_breaker.record_failure()
+                except httpx.HTTPError as e:
+                    failures += 1
+                    raise NetworkError(str(e), cause=e) from e
 
-                if attempt < self._retry_config.max_retries:
-                    delay = calculate_retry_delay(self._retry_config, attempt)
-                    self._log_retry("Request failed", attempt, delay, str(e))
-                    time.sleep(delay)
-
-            except httpx.HTTPError as e:
-                self._circuit_breaker.record_failure()
-                raise NetworkError(str(e), cause=e) from e
+            raise last_error or NetworkError("Request failed after retries")
 
-        raise last_error or NetworkError("Request failed after retries")
+        finally:
+            if failures or succeeded:
+                self._circuit_breaker.record(
+                    successes=1 if succeeded else 0,
+                    failures=failures,
+                )
 
     def _execute_single(
         self,
-        method: str,
-        url: str,
+        request: httpx.Request,
         attempt: int,
-        **kwargs: Any,
+        **send_kwargs: Any,
     ) -> httpx.Response:
         """Execute single HTTP request.
         
         Args:
-            method: HTTP method.
-            url: Request URL.
+            request: Prebuilt request, re-sent unchanged on retries.
             attempt: Current attempt number.
-            **kwargs: Additional request arguments.
+            **send_kwargs: Arguments for client.send (auth, follow_redirects).
             
         Returns:
             HTTP response.
@@ -161,27 +194,32 @@ class SyncHTTPExecutor:
             RateLimitError: On rate limiting.
             ServerError: On server error.
         """
-        with trace_operation(
-            "http_request",
-            attributes={"http.method": method, "http.url": url, "attempt": attempt},
-        ):
-            response = self._client.request(method, url, **kwargs)
-
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                self._circuit_breaker.record_failure()
-                raise RateLimitError(
-                    retry_after=int(retry_after) if retry_after else None
-                )
-
-            if response.status_code >= 500:
-                self._circuit_breaker.record_failure()
+        span = (
+            trace_operation(
+                "http_request",
+                attributes={
+                    "http.method": request.method,
+                    "http.url": str(request.url),
+                    "attempt": attempt,
+                },
+            )
+            if trace_requests_enabled()
+            else nullcontext()
+        )
+        with span:
+            response = self._client.send(request, **send_kwargs)
+
+            status_code = response.status_code
+            if should_retry_status(status_code):
+                if status_code == 429:
+                    raise RateLimitError(
+                        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                    )
                 raise ServerError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code,
+                    f"Server error: {status_code}",
+                    status_code=status_code,
                 )
 
-            self._circuit_breaker.record_success()
             return response
 
     def _log_retry(
@@ -189,20 +227,30 @@ class SyncHTTPExecutor:
         message: str,
         attempt: int,
         delay: float,
-        error: str | None = None,
+        error: BaseException | None = None,
     ) -> None:
-        """Log retry attempt."""
+        """Log retry attempt, skipped entirely when WARNING is filtered."""
+        if not log_level_enabled(logging.WARNING):
+            return
         self._logger.warning(
             message,
             attempt=attempt,
             delay=delay,
-            error=error,
+            error=str(error) if error is not None else None,
         )
 
 
 class AsyncHTTPExecutor:
     """Asynchronous HTTP executor with retry and circuit breaker."""
 
+    __slots__ = (
+        "_circuit_breaker",
+        "_client",
+        "_logger",
+        "_retry_config",
+        "_shutdown",
+    )
+
     def __init__(
         self,
         client: httpx.AsyncClient,
@@ -220,12 +268,17 @@ class AsyncHTTPExecutor:
         self._retry_config = retry_config
         self._circuit_breaker = circuit_breaker or CircuitBreaker()
         self._logger = get_logger()
+        self._shutdown = asyncio.Event()
 
     @property
     def circuit_breaker(self) -> CircuitBreaker:
         """Get circuit breaker."""
         return self._circuit_breaker
 
+    def close(self) -> None:
+        """Abort pending retry waits; in-flight executions raise NetworkError."""
+        self._shutdown.set()
+
     async def execute(
         self,
         method: str,
@@ -247,53 +300,77 @@ class AsyncHTTPExecutor:
             RateLimitError: On rate limiting.
             ServerError: On server error.
         """
+        send_kwargs = {k: kwargs.pop(k) for k in _SEND_ARGUMENTS if k in kwargs}
+        # Built once and re-sent on retries
+        request = self._client.build_request(method, url, **kwargs)
         last_error: Exception | None = None
-
-        for attempt in range(self._retry_config.max_retries + 1):
-            if not self._circuit_breaker.allow_request():
-                raise NetworkError("Circuit breaker is open")
-
-            try:
-                response = await self._execute_single(method, url, attempt, **kwargs)
-                return response
-
-            except RateLimitError as e:
-                last_error = e
-                delay = e.retry_after or calculate_retry_delay(
-                    self._retry_config, attempt
+        # Outcomes not yet applied to the circuit breaker. Failures are
+        # flushed before the next attempt so the breaker can still open
+        # mid-sequence; the final outcome is recorded once on exit.
+        failures = 0
+        succeeded = False
+
+        try:
+            for attempt in range(self._retry_config.max_retries + 1):
+                if failures:
+                    self._circuit_breaker.record(failures=failures)
+                    failures = 0
+
+                if not self._circuit_breaker.allow_request():
+                    raise NetworkError("Circuit breaker is open")
+
+                try:
+                    response = await self._execute_single(request, attempt, **send_kwargs)
+                    succeeded = True
+                    return response
+
+                except RateLimitError as e:
+                    failures += 1
+                    last_error = e
+                    delay = e.retry_after or calculate_retry_delay(
+                        self._retry_config, attempt
+                    )
+                    self._log_retry("Rate limited", attempt, delay)
+                    await self._wait(delay)
+
+                except ServerError:
+                    failures += 1
+                    raise
+
+                except (httpx.TimeoutException, httpx.ConnectError) as e:
+                    failures += 1
+                    last_error = NetworkError(str(e), cause=e)
+
+                    if attempt < self._retry_config.max_retries:
+                        delay = calculate_retry_delay(self._retry_config, attempt)
+                        self._log_retry("Request failed", attempt, delay, e)
+                        await self._wait(delay)
+
+                except httpx.HTTPError as e:
+                    failures += 1
+                    raise NetworkError(str(e), cause=e) from e
+
+            raise last_error or NetworkError("Request failed after retries")
+
+        finally:
+            if failures or succeeded:
+                self._circuit_breaker.record(
+                    successes=1 if succeeded else 0,
+                    failures=failures,
                 )
-                self._log_retry("Rate limited", attempt, delay)
-                await asyncio.sleep(delay)
-
-            except (httpx.TimeoutException, httpx.ConnectError) as e:
-                last_error = NetworkError(str(e), cause=e)
-                self._circuit_breaker.record_failure()
-
-                if attempt < self._retry_config.max_retries:
-                    delay = calculate_retry_delay(self._retry_config, attempt)
-                    self._log_retry("Request failed", attempt, delay, str(e))
-                    await asyncio.sleep(delay)
-
-            except httpx.HTTPError as e:
-                self._circuit_breaker.record_failure()
-                raise NetworkError(str(e), cause=e) from e
-
-        raise last_error or NetworkError("Request failed after retries")
 
     async def _execute_single(
         self,
-        method: str,
-        url: str,
+        request: httpx.Request,
         attempt: int,
-        **kwargs: Any,
+        **send_kwargs: Any,
     ) -> httpx.Response:
         """Execute single async HTTP request.
         
         Args:
-            method: HTTP method.
-            url: Request URL.
+            request: Prebuilt request, re-sent unchanged on retries.
             attempt: Current attempt number.
-            **kwargs: Additional request arguments.
+            **send_kwargs: Arguments for client.send (auth, follow_redirects).
             
         Returns:
             HTTP response.
@@ -302,40 +379,63 @@ class AsyncHTTPExecutor:
             RateLimitError: On rate limiting.
             ServerError: On server error.
         """
-        with trace_operation(
-            "http_request",
-            attributes={"http.method": method, "http.url": url, "attempt": attempt},
-        ):
-            response = await self._client.request(method, url, **kwargs)
-
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                self._circuit_breaker.record_failure()
-                raise RateLimitError(
-                    retry_after=int(retry_after) if retry_after else None
-                )
-
-            if response.status_code >= 500:
-                self._circuit_breaker.record_failure()
+        span = (
+            trace_operation(
+                "http_request",
+                attributes={
+                    "http.method": request.method,
+                    "http.url": str(request.url),
+                    "attempt": attempt,
+                },
+            )
+            if trace_requests_enabled()
+            else nullcontext()
+        )
+        with span:
+            response = await self._client.send(request, **send_kwargs)
+
+            status_code = response.status_code
+            if should_retry_status(status_code):
+                if status_code == 429:
+                    raise RateLimitError(
+                        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                    )
                 raise ServerError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code,
+                    f"Server error: {status_code}",
+                    status_code=status_code,
                 )
 
-            self._circuit_breaker.record_success()
             return response
 
+    async def _wait(self, delay: float) -> None:
+        """Wait out a retry delay, returning early if the executor is closed.
+        
+        Raises:
+            NetworkError: If close() is called before the delay elapses.
+        """
+        if delay < _MIN_ASYNC_DELAY and not self._shutdown.is_set():
+            return
+
+        try:
+            await asyncio.wait_for(self._shutdown.wait(), delay)
+        except TimeoutError:
+            return
+
+        raise NetworkError("HTTP executor is shutting down")
+
     def _log_retry(
         self,
         message: str,
         attempt: int,
         delay: float,
-        error: str | None = None,
+        error: BaseException | None = None,
     ) -> None:
-        """Log retry attempt."""
+        """Log retry attempt, skipped entirely when WARNING is filtered."""
+        if not log_level_enabled(logging.WARNING):
+            return
         self._logger.warning(
             message,
             attempt=attempt,
             delay=delay,
-            error=error,
+            error=str(error) if error is not None else None,
         )
@@ -6,11 +6,12 @@ between sync and async JWKS cache implementations.
 
 from __future__ import annotations
 
+import hashlib
 import time
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from ..models import JWK, JWKS
+from .._compat import json_loads
+from ..errors import ValidationError
+from ..models import JWK, JWKS
 
 
 class JWKSCacheBase:
@@ -19,12 +20,24 @@ class JWKSCacheBase:
     This class provides the core caching logic that is shared between
     synchronous and asynchronous JWKS cache implementations.
     
+    Cache age is measured with ``time.monotonic()`` so wall-clock
+    adjustments (NTP steps, suspend/resume) cannot stall or burst refreshes.
+    
     Attributes:
         jwks_uri: URI to fetch JWKS from.
         ttl_seconds: Cache TTL in seconds.
         refresh_ahead_seconds: Seconds before expiry to trigger refresh.
     """
 
+    __slots__ = (
+        "_body_digest",
+        "_cache_time",
+        "_jwks",
+        "jwks_uri",
+        "refresh_ahead_seconds",
+        "ttl_seconds",
+    )
+
     def __init__(
         self,
         jwks_uri: str,
@@ -43,7 +56,9 @@ class JWKSCacheBase:
         self.ttl_seconds = ttl_seconds
         self.refresh_ahead_seconds = refresh_ahead_seconds
         self._jwks: JWKS | None = None
+        # Monotonic timestamp (time.monotonic), not wall-clock
         self._cache_time: float = 0
+        self._body_digest: bytes | None = None
 
     def should_refresh(self) -> bool:
         """Check if cache should be refreshed.
@@ -59,7 +74,7 @@ class JWKSCacheBase:
         if self._jwks is None:
             return True
         
-        elapsed = time.time() - self._cache_time
+        elapsed = time.monotonic() - self._cache_time
         threshold = self.ttl_seconds - self.refresh_ahead_seconds
         return elapsed > threshold
 
@@ -72,7 +87,7 @@ class JWKSCacheBase:
         if self._jwks is None:
             return True
         
-        elapsed = time.time() - self._cache_time
+        elapsed = time.monotonic() - self._cache_time
         return elapsed > self.ttl_seconds
 
     def time_until_refresh(self) -> float:
@@ -84,7 +99,7 @@ class JWKSCacheBase:
         if self._jwks is None:
             return 0
         
-        elapsed = time.time() - self._cache_time
+        elapsed = time.monotonic() - self._cache_time
         threshold = self.ttl_seconds - self.refresh_ahead_seconds
         remaining = threshold - elapsed
         return max(0, remaining)
@@ -98,7 +113,7 @@ class JWKSCacheBase:
         if self._jwks is None:
             return 0
         
-        elapsed = time.time() - self._cache_time
+        elapsed = time.monotonic() - self._cache_time
         remaining = self.ttl_seconds - elapsed
         return max(0, remaining)
 
@@ -132,12 +147,46 @@ class JWKSCacheBase:
             jwks: New JWKS to cache.
         """
         self._jwks = jwks
-        self._cache_time = time.time()
+        self._cache_time = time.monotonic()
+        self._body_digest = None
+
+    def update_from_bytes(self, body: bytes) -> None:
+        """Update cache from a raw JWKS response body.
+        
+        Identical bodies (the common case for periodic refreshes) only
+        bump the cache time. Changed bodies are parsed and built with
+        ``model_construct``, since the document comes from the trusted
+        issuer endpoint.
+        
+        Args:
+            body: Raw JWKS JSON document.
+
+        Raises:
+            ValidationError: If the body is not a JSON object with a list
+                of key objects.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if self._jwks is not None and digest == self._body_digest:
+            self._cache_time = time.monotonic()
+            return
+
+        try:
+            data = json_loads(body)
+        except ValueError as e:
+            raise ValidationError(f"Failed to parse JWKS: {e}") from e
+        raw_keys = data.get("keys", []) if isinstance(data, dict) else None
+        if not isinstance(raw_keys, list) or not all(isinstance(key, dict) for key in raw_keys):
+            raise ValidationError("Failed to parse JWKS: expected an object with a list of keys")
+
+        keys = [JWK.model_construct(**key) for key in raw_keys]
+        self.update_cache(JWKS.model_construct(keys=keys))
+        self._body_digest = digest
 
     def invalidate(self) -> None:
         """Invalidate cache, forcing refresh on next access."""
         self._jwks = None
         self._cache_time = 0
+        self._body_digest = None
 
     @property
     def is_cached(self) -> bool:
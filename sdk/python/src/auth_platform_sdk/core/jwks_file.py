@@ -0,0 +1,166 @@
+"""Cross-process JWKS document cache - December 2025 State of Art.
+
+Lets the worker processes of one deployment share a fetched JWKS
+document through a small file, so only one of them goes to the
+identity provider per refresh.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .._compat import json_loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None  # type: ignore[assignment]
+
+
+class SharedJWKSFile:
+    """JWKS document shared between processes through the filesystem.
+
+    The file holds the raw key set plus the fetch time and HTTP cache
+    validators. Writes go through a temporary file and ``os.replace`` so
+    readers never see a partial document, and a sibling lock file
+    serializes refreshes across processes where ``fcntl`` is available.
+
+    Anyone who can write the directory can inject signing keys, so it
+    must only be writable by the service account.
+
+    Attributes:
+        path: Location of the shared document.
+    """
+
+    __slots__ = ("_lock_path", "path")
+
+    def __init__(self, directory: str | os.PathLike[str], jwks_uri: str) -> None:
+        """Initialize shared JWKS file.
+
+        Args:
+            directory: Directory holding the shared document.
+            jwks_uri: JWKS URI the document caches; determines the file name.
+        """
+        digest = hashlib.sha256(jwks_uri.encode()).hexdigest()[:16]
+        base = Path(directory)
+        self.path = base / f"jwks-{digest}.json"
+        self._lock_path = base / f"jwks-{digest}.lock"
+
+    def load(self) -> dict[str, Any] | None:
+        """Read the shared document.
+
+        Returns:
+            Document with ``fetched_at``, ``ttl``, ``etag``,
+            ``last_modified`` and ``keys``, or None if missing or unreadable.
+        """
+        try:
+            document = json_loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict):
+            return None
+        if not isinstance(document.get("fetched_at"), (int, float)):
+            return None
+        if not isinstance(document.get("ttl"), (int, float)):
+            return None
+        if not isinstance(document.get("keys"), list):
+            return None
+        return document
+
+    def store(
+        self,
+        keys: list[dict[str, Any]],
+        *,
+        fetched_at: float,
+        ttl: float,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Atomically publish a freshly fetched key set.
+
+        Failures are ignored: the file only saves other workers a fetch.
+
+        Args:
+            keys: Raw JWK dicts.
+            fetched_at: Wall-clock time of the fetch.
+            ttl: Seconds the key set stays fresh after ``fetched_at``.
+            etag: ETag of the response, if any.
+            last_modified: Last-Modified of the response, if any.
+        """
+        payload = json.dumps(
+            {
+                "fetched_at": fetched_at,
+                "ttl": ttl,
+                "etag": etag,
+                "last_modified": last_modified,
+                "keys": keys,
+            },
+            separators=(",", ":"),
+        ).encode()
+        try:
+            # mkstemp creates the file with mode 0o600
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".jwks-")
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                tmp_path.replace(self.path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink()
+                raise
+        except OSError:
+            pass
+
+    def acquire(self, *, blocking: bool = True) -> int | None:
+        """Take the cross-process refresh lock.
+
+        Args:
+            blocking: Wait for the lock instead of failing when it is held.
+
+        Returns:
+            Lock handle for ``release()``, or None if locking is unavailable.
+
+        Raises:
+            BlockingIOError: If ``blocking`` is False and another process
+                holds the lock.
+        """
+        if fcntl is None:
+            return None
+        try:
+            fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError:
+            return None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    def release(self, handle: int | None) -> None:
+        """Release a lock taken with ``acquire()``."""
+        if handle is not None:
+            # Closing the descriptor drops the flock
+            os.close(handle)
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the cross-process refresh lock for the duration of a block."""
+        handle = self.acquire()
+        try:
+            yield
+        finally:
+            self.release(handle)
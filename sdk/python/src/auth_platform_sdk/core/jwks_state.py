@@ -0,0 +1,321 @@
+"""Shared state for the JWKS caches - December 2025 State of Art.
+
+Holds the I/O-free half of the sync and async JWKS caches: expiry and
+rate-limit bookkeeping, the cross-process document exchange, and
+turning a fetched response into installed keys. The caches add only
+their transport, locking and background refresh on top.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import jwt
+
+from .._compat import json_loads
+from ..errors import ValidationError
+from ..models import JWK, JWKS
+from ..telemetry import get_logger
+from .jwks_file import SharedJWKSFile
+
+if TYPE_CHECKING:
+    import os
+
+# Floor for the background refresh interval, also used as the retry
+# interval after a failed background fetch and as the cooldown between
+# refreshes triggered by unknown key IDs
+MIN_REFRESH_INTERVAL = 10.0
+
+
+def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    """Build revalidation headers from the last successful response."""
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _max_age(response: httpx.Response) -> int | None:
+    """Extract ``max-age`` from a Cache-Control header, if present."""
+    for directive in response.headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return int(value.strip('"'))
+            except ValueError:
+                return None
+    return None
+
+
+def _prepare_signing_keys(jwks: JWKS) -> dict[str, jwt.PyJWK]:
+    """Build verification key objects for every signing key with a kid.
+
+    Keys PyJWT cannot load are skipped so one unsupported key does not
+    break validation against the rest of the set.
+    """
+    prepared: dict[str, jwt.PyJWK] = {}
+    for jwk in jwks.get_signing_keys():
+        if jwk.kid is None:
+            continue
+        try:
+            prepared[jwk.kid] = jwt.PyJWK(jwk.model_dump(exclude_none=True))
+        except (jwt.exceptions.PyJWTError, KeyError, ValueError):
+            continue
+    return prepared
+
+
+def parse_key_set(
+    keys: list[dict[str, Any]],
+    *,
+    validate: bool = True,
+) -> tuple[JWKS, dict[str, jwt.PyJWK]]:
+    """Build the JWKS model and its verification keys from raw JWKs.
+
+    Args:
+        keys: Raw JWK dicts.
+        validate: Run pydantic validation. Refreshes of a warm cache skip
+            it; the same endpoint's documents already passed on cold start.
+
+    Returns:
+        The key set and its verification keys by kid.
+    """
+    if validate:
+        jwks = JWKS(keys=[JWK(**key) for key in keys])
+    else:
+        jwks = JWKS.model_construct(keys=[JWK.model_construct(**key) for key in keys])
+    return jwks, _prepare_signing_keys(jwks)
+
+
+class JWKSCacheState:
+    """Key set, expiry and revalidation state shared by the JWKS caches.
+
+    Subclasses fetch the document and call ``_apply_response`` or
+    ``_fetch_failed`` with the outcome. ``_install`` and ``_is_loaded``
+    are the hooks for caches that keep extra objects alongside the keys.
+
+    Attributes:
+        jwks_uri: URI to fetch JWKS from.
+        ttl_seconds: Cache TTL in seconds.
+        refresh_ahead_seconds: Seconds before expiry to trigger refresh.
+        http_timeout: HTTP request timeout.
+        max_stale_seconds: How long past expiry cached keys may still be
+            served while the JWKS endpoint is unreachable.
+    """
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        *,
+        ttl_seconds: int = 3600,
+        refresh_ahead_seconds: int = 300,
+        http_timeout: float = 10.0,
+        max_stale_seconds: int = 900,
+        shared_cache_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Initialize JWKS cache state.
+
+        Args:
+            jwks_uri: URI to fetch JWKS from.
+            ttl_seconds: Cache TTL in seconds.
+            refresh_ahead_seconds: Seconds before expiry to trigger refresh.
+            http_timeout: HTTP request timeout.
+            max_stale_seconds: How long past expiry cached keys may still
+                be served while the JWKS endpoint is unreachable.
+            shared_cache_dir: Directory for a key set shared with other
+                worker processes, or None to keep it in-process.
+        """
+        self.jwks_uri = jwks_uri
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.http_timeout = http_timeout
+        self.max_stale_seconds = max_stale_seconds
+        self._shared_file = (
+            SharedJWKSFile(shared_cache_dir, jwks_uri) if shared_cache_dir is not None else None
+        )
+
+        self._jwks: JWKS | None = None
+        self._cache_time: float = 0
+        # Verification keys by kid, rebuilt together with _jwks on refresh
+        self._signing_keys: dict[str, jwt.PyJWK] = {}
+        # Validators and server max-age from the last full response
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._effective_ttl: float = ttl_seconds
+        # While serving stale keys, lookups wait until this time to re-fetch
+        self._retry_at: float = 0
+        # Start of the last refresh, successful or not; rate limits
+        # refreshes triggered by unknown key IDs
+        self._refresh_attempted_at: float = 0
+
+    def _is_loaded(self) -> bool:
+        """Check if a key set has been installed."""
+        return self._jwks is not None
+
+    def _install(self, jwks: JWKS, signing_keys: dict[str, jwt.PyJWK]) -> None:
+        """Publish a freshly built key set to lock-free readers.
+
+        Args:
+            jwks: The key set.
+            signing_keys: Its verification keys by kid.
+        """
+        self._jwks = jwks
+        self._signing_keys = signing_keys
+
+    def _should_refresh(self) -> bool:
+        """Check if cache must be refreshed before serving a lookup."""
+        if not self._is_loaded():
+            return True
+
+        # Refresh-ahead is done in the background; lookups only refresh
+        # once the TTL has actually expired
+        now = time.time()
+        return now - self._cache_time > self._effective_ttl and now >= self._retry_at
+
+    def _refresh_ahead_delay(self) -> float:
+        """Seconds until the background refresh is due."""
+        elapsed = time.time() - self._cache_time
+        due_in = self._effective_ttl - self.refresh_ahead_seconds - elapsed
+        return max(due_in, MIN_REFRESH_INTERVAL)
+
+    def _unknown_kid_refresh_throttled(self) -> bool:
+        """Check if a refresh was attempted too recently to try another."""
+        now = time.time()
+        return now - self._refresh_attempted_at < MIN_REFRESH_INTERVAL or now < self._retry_at
+
+    def _adopt_shared(self, document: dict[str, Any] | None) -> bool:
+        """Install a shared key set that is newer than ours and still fresh.
+
+        Args:
+            document: Shared document, or None if there is none.
+
+        Returns:
+            True if the key set was adopted; False if the caller must fetch.
+        """
+        if document is None or document["fetched_at"] <= self._cache_time:
+            return False
+        fetched_at, ttl = document["fetched_at"], document["ttl"]
+        if time.time() - fetched_at >= ttl - self.refresh_ahead_seconds:
+            return False
+        try:
+            jwks, signing_keys = parse_key_set(
+                document["keys"], validate=self._jwks is None
+            )
+        except Exception:
+            return False
+
+        self._etag = document.get("etag")
+        self._last_modified = document.get("last_modified")
+        self._effective_ttl = ttl
+        self._install(jwks, signing_keys)
+        self._cache_time = fetched_at
+        return True
+
+    def _store_shared(self) -> None:
+        """Publish the current key set to other worker processes."""
+        shared_file, jwks = self._shared_file, self._jwks
+        if shared_file is None or jwks is None:
+            return
+        shared_file.store(
+            [key.model_dump(exclude_none=True) for key in jwks.keys],
+            fetched_at=self._cache_time,
+            ttl=self._effective_ttl,
+            etag=self._etag,
+            last_modified=self._last_modified,
+        )
+
+    def _revalidation_headers(self) -> dict[str, str]:
+        """Conditional request headers, empty until keys are loaded."""
+        if not self._is_loaded():
+            return {}
+        return _conditional_headers(self._etag, self._last_modified)
+
+    def _apply_response(self, response: httpx.Response, *, revalidating: bool) -> None:
+        """Install the key set from a JWKS response.
+
+        Args:
+            response: Response to the JWKS request.
+            revalidating: Whether the request carried conditional headers.
+
+        Raises:
+            ValidationError: If the response is an error outside the
+                max-stale window or its body is not a valid key set.
+        """
+        if response.status_code == 304 and revalidating:
+            # Unchanged: keep the parsed keys and restart the TTL, taking
+            # any fresh max-age the 304 carries (RFC 9111 section 4.3.4)
+            max_age = _max_age(response)
+            if max_age is not None:
+                self._effective_ttl = max(self.ttl_seconds, max_age)
+            self._cache_time = time.time()
+            self._store_shared()
+            return
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            self._fetch_failed(e)
+            return
+        try:
+            jwks_data = json_loads(response.content)
+            jwks, signing_keys = parse_key_set(
+                jwks_data.get("keys", []), validate=self._jwks is None
+            )
+        except Exception as e:
+            raise ValidationError(f"Failed to parse JWKS: {e}") from e
+
+        self._etag = response.headers.get("etag")
+        self._last_modified = response.headers.get("last-modified")
+        self._effective_ttl = max(self.ttl_seconds, _max_age(response) or 0)
+
+        # Publish only fully built objects; lock-free readers never see
+        # a partially refreshed cache
+        self._install(jwks, signing_keys)
+        self._cache_time = time.time()
+        self._store_shared()
+
+    def _fetch_failed(self, error: httpx.HTTPError) -> None:
+        """Keep serving cached keys after a failed fetch, or fail closed.
+
+        Args:
+            error: The fetch failure.
+
+        Raises:
+            ValidationError: If there are no cached keys within the
+                max-stale window.
+        """
+        if not self._serve_stale(error):
+            raise ValidationError(f"Failed to fetch JWKS: {error}") from error
+
+    def _serve_stale(self, error: httpx.HTTPError) -> bool:
+        """Decide whether a failed fetch may fall back to the cached keys.
+
+        Args:
+            error: The fetch failure.
+
+        Returns:
+            True if cached keys are within the max-stale window and should
+            keep being served; False to fail closed.
+        """
+        if not self._is_loaded():
+            return False
+        now = time.time()
+        age = now - self._cache_time
+        if age >= self._effective_ttl + self.max_stale_seconds:
+            return False
+
+        self._retry_at = now + MIN_REFRESH_INTERVAL
+        get_logger().warning(
+            "JWKS refresh failed, serving cached keys",
+            jwks_uri=self.jwks_uri,
+            age_seconds=round(age),
+            error=str(error),
+        )
+        return True
+
+    @property
+    def is_cached(self) -> bool:
+        """Check if JWKS is currently cached."""
+        return self._is_loaded() and not self._should_refresh()
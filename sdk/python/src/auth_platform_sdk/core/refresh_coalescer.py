@@ -0,0 +1,101 @@
+"""Single-flight token refresh for Auth Platform SDK - December 2025 State of Art.
+
+Lets concurrent callers that find the same token expired share one
+request to the token endpoint instead of each issuing their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+T = TypeVar("T")
+
+
+class _RefreshFlight(Generic[T]):
+    """In-flight synchronous refresh shared by concurrent callers."""
+
+    __slots__ = ("done", "error", "result")
+
+    # Set by the leader before ``done`` is set, unless ``error`` is
+    result: T
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class RefreshCoalescer(Generic[T]):
+    """Runs a token refresh once for all callers that need it concurrently.
+
+    The first caller starts the refresh; callers arriving while it is in
+    flight receive the same result (or exception). Once it finishes, the
+    next caller starts a new refresh.
+    """
+
+    __slots__ = ("_flight", "_lock", "_task")
+
+    def __init__(self) -> None:
+        """Initialize refresh coalescer."""
+        self._task: asyncio.Future[T] | None = None
+        self._flight: _RefreshFlight[T] | None = None
+        self._lock = threading.Lock()
+
+    async def run(self, do_refresh: Callable[[], Awaitable[T]]) -> T:
+        """Run a refresh once for all concurrent async callers.
+
+        Args:
+            do_refresh: Coroutine function performing the actual refresh.
+
+        Returns:
+            Result of the shared refresh.
+        """
+        task = self._task
+        if task is None:
+            task = asyncio.ensure_future(do_refresh())
+            self._task = task
+            task.add_done_callback(self._clear_task)
+        # Shield so one cancelled caller does not abort the shared refresh
+        return await asyncio.shield(task)
+
+    def _clear_task(self, task: asyncio.Future[T]) -> None:
+        """Forget a finished refresh so the next caller starts a new one."""
+        if self._task is task:
+            self._task = None
+
+    def run_sync(self, do_refresh: Callable[[], T]) -> T:
+        """Run a refresh once for all concurrent threads.
+
+        Args:
+            do_refresh: Callable performing the actual refresh.
+
+        Returns:
+            Result of the shared refresh.
+        """
+        with self._lock:
+            current = self._flight
+            leader = current is None
+            if current is None:
+                current = self._flight = _RefreshFlight()
+            flight = current
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = do_refresh()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+        return flight.result
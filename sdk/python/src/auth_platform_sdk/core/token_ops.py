@@ -22,6 +22,19 @@ class TokenOperations:
     between synchronous and asynchronous client implementations.
     """
 
+    __slots__ = (
+        "_auth_code_template",
+        "_cc_template",
+        "_client_secret",
+        "_default_scope",
+        "_dpop_key",
+        "_dpop_nonce",
+        "_refresh_template",
+        "_token_endpoint",
+        "_tokens",
+        "config",
+    )
+
     def __init__(
         self,
         config: AuthPlatformConfig,
@@ -38,6 +51,29 @@ class TokenOperations:
         self._dpop_nonce: str | None = None
         self._tokens: TokenData | None = None
 
+        # Config is frozen, so credential lookups are resolved once here
+        # and the grant payloads are built by copying these templates.
+        secret = config.client_secret.get_secret_value() if config.client_secret else None
+        self._client_secret = secret
+        self._default_scope = config.scope_string
+        credentials: dict[str, Any] = {"client_id": config.client_id}
+        if secret is not None:
+            credentials["client_secret"] = secret
+        self._cc_template: dict[str, Any] = {
+            "grant_type": "client_credentials",
+            **credentials,
+        }
+        self._refresh_template: dict[str, Any] = {
+            "grant_type": "refresh_token",
+            **credentials,
+        }
+        self._auth_code_template: dict[str, Any] = {
+            "grant_type": "authorization_code",
+            **credentials,
+        }
+
+        self._token_endpoint = config.token_endpoint or ""
+
     @property
     def tokens(self) -> TokenData | None:
         """Get current token data."""
@@ -67,16 +103,12 @@ class TokenOperations:
         Raises:
             ValueError: If client_secret not configured.
         """
-        if not self.config.client_secret:
+        if self._client_secret is None:
             msg = "client_secret required for client credentials flow"
             raise ValueError(msg)
         
-        scope = " ".join(scopes) if scopes else self.config.scope_string
-        data: dict[str, Any] = {
-            "grant_type": "client_credentials",
-            "client_id": self.config.client_id,
-            "client_secret": self.config.client_secret.get_secret_value(),
-        }
+        scope = " ".join(scopes) if scopes else self._default_scope
+        data = self._cc_template.copy()
         if scope:
             data["scope"] = scope
         
@@ -102,13 +134,8 @@ class TokenOperations:
             msg = "No refresh token available"
             raise ValueError(msg)
         
-        data: dict[str, Any] = {
-            "grant_type": "refresh_token",
-            "refresh_token": token,
-            "client_id": self.config.client_id,
-        }
-        if self.config.client_secret:
-            data["client_secret"] = self.config.client_secret.get_secret_value()
+        data = self._refresh_template.copy()
+        data["refresh_token"] = token
         
         return data
 
@@ -128,14 +155,9 @@ class TokenOperations:
         Returns:
             Request payload dictionary.
         """
-        data: dict[str, Any] = {
-            "grant_type": "authorization_code",
-            "code": code,
-            "redirect_uri": redirect_uri,
-            "client_id": self.config.client_id,
-        }
-        if self.config.client_secret:
-            data["client_secret"] = self.config.client_secret.get_secret_value()
+        data = self._auth_code_template.copy()
+        data["code"] = code
+        data["redirect_uri"] = redirect_uri
         if code_verifier:
             data["code_verifier"] = code_verifier
         
@@ -154,7 +176,7 @@ class TokenOperations:
         if self._dpop_key:
             proof = self._dpop_key.create_proof(
                 "POST",
-                self.config.token_endpoint or "",
+                self._token_endpoint,
                 nonce=self._dpop_nonce,
             )
             headers["DPoP"] = proof.proof
@@ -5,10 +5,14 @@ Provides shared JWT validation logic used by both sync and async clients.
 
 from __future__ import annotations
 
+import functools
+import json
+import secrets
 from typing import TYPE_CHECKING, Any
 
 import jwt
 from jwt import algorithms
+from jwt.utils import base64url_decode
 
 from ..errors import TokenExpiredError, ValidationError
 from ..models import JWK, TokenClaims
@@ -20,6 +24,55 @@ if TYPE_CHECKING:
 # Supported algorithms for token validation
 SUPPORTED_ALGORITHMS = ["ES256", "ES384", "ES512", "RS256", "RS384", "RS512"]
 
+# Header segments above this length (e.g. x5c chains, or attacker padding)
+# are decoded without caching so they cannot pin large strings in the cache
+_MAX_CACHED_HEADER_LENGTH = 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _header_key_id(header_segment: str) -> str | None:
+    """Decode a JWT header segment and return its kid.
+
+    Cached on the raw segment: every token signed with the same key
+    carries the same header, so hits do not depend on token reuse.
+    """
+    return _decode_header_key_id(header_segment)
+
+
+def _decode_header_key_id(header_segment: str) -> str | None:
+    """Decode a JWT header segment and return its kid."""
+    try:
+        header = json.loads(base64url_decode(header_segment))
+    except ValueError as e:
+        raise ValidationError(f"Invalid token format: {e}") from e
+    if not isinstance(header, dict):
+        raise ValidationError("Invalid token format: header must be a JSON object")
+
+    kid = header.get("kid")
+    if kid is not None and not isinstance(kid, str):
+        raise ValidationError("Invalid token format: kid must be a string")
+    return kid
+
+
+def unverified_key_id(token: str) -> str | None:
+    """Extract the key ID from a token header without verifying it.
+
+    Args:
+        token: JWT token.
+
+    Returns:
+        Key ID if present, None otherwise.
+
+    Raises:
+        ValidationError: If token format is invalid.
+    """
+    header_segment, sep, _ = token.partition(".")
+    if not sep:
+        raise ValidationError("Invalid token format: not enough segments")
+    if len(header_segment) > _MAX_CACHED_HEADER_LENGTH:
+        return _decode_header_key_id(header_segment)
+    return _header_key_id(header_segment)
+
 
 class TokenValidator:
     """Centralized token validator shared by sync and async clients.
@@ -28,6 +81,8 @@ class TokenValidator:
     between synchronous and asynchronous client implementations.
     """
 
+    __slots__ = ("_algorithms", "config")
+
     def __init__(
         self,
         config: AuthPlatformConfig,
@@ -198,8 +253,7 @@ class TokenValidator:
         Returns:
             Key ID if present, None otherwise.
         """
-        header = self.get_unverified_header(token)
-        return header.get("kid")
+        return unverified_key_id(token)
 
     def verify_dpop_binding(
         self,
@@ -223,5 +277,4 @@ class TokenValidator:
             return False
         
         # Use constant-time comparison for security
-        import secrets
         return secrets.compare_digest(jkt, expected_thumbprint)
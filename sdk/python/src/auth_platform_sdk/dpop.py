@@ -6,26 +6,97 @@ proof-of-possession with asymmetric keys.
 
 from __future__ import annotations
 
-import base64
+import functools
 import hashlib
-import json
+import secrets
 import time
-import uuid
 from typing import TYPE_CHECKING, Any
 
 import jwt
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
 
 from .errors import DPoPError, ErrorCode
 from .models import DPoPProof
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from cryptography.hazmat.primitives.asymmetric.ec import (
         EllipticCurvePrivateKey,
         EllipticCurvePublicKey,
     )
 
+try:
+    from pybase64 import urlsafe_b64decode, urlsafe_b64encode
+except ImportError:  # pragma: no cover - optional speedup
+    from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - optional speedup
+    import json
+
+    def _compact_json_dumps(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_dumps = _compact_json_dumps
+
+
+# Curves and signature algorithms are stateless, so they are shared
+_CURVES: dict[str, ec.EllipticCurve] = {
+    "ES256": ec.SECP256R1(),
+    "ES384": ec.SECP384R1(),
+    "ES512": ec.SECP521R1(),
+}
+_JWK_CURVES: dict[str, ec.EllipticCurve] = {
+    "P-256": _CURVES["ES256"],
+    "P-384": _CURVES["ES384"],
+    "P-521": _CURVES["ES512"],
+}
+_JWK_CURVE_NAMES = {curve.name: crv for crv, curve in _JWK_CURVES.items()}
+
+# JWS signature algorithm for each supported ECDSA algorithm (RFC 7518 3.4)
+_SIGNATURE_ALGORITHMS: dict[str, ec.ECDSA] = {
+    "ES256": ec.ECDSA(hashes.SHA256()),
+    "ES384": ec.ECDSA(hashes.SHA384()),
+    "ES512": ec.ECDSA(hashes.SHA512()),
+}
+
+
+def _b64u(data: bytes) -> str:
+    """Encode bytes as unpadded base64url."""
+    # Annotated so results stay typed when pybase64 has no stubs
+    encoded: bytes = urlsafe_b64encode(data)
+    return encoded.rstrip(b"=").decode("ascii")
+
+
+def _b64u_decode(data: str) -> bytes:
+    """Decode unpadded base64url."""
+    decoded: bytes = urlsafe_b64decode(data + "==")
+    return decoded
+
+
+def _access_token_hash(access_token: str) -> str:
+    """Compute the DPoP ``ath`` claim (base64url SHA-256 of the token)."""
+    return _b64u(hashlib.sha256(access_token.encode()).digest())
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_access_token_hash(access_token: str) -> str:
+    """Compute ``ath`` for the client's own access tokens.
+
+    A client reuses its token across many requests, so the hash is cached;
+    the bound keeps rotated tokens from being retained indefinitely. Only
+    for proof creation: verification must not retain presented tokens.
+    """
+    return _access_token_hash(access_token)
+
 
 class DPoPKeyPair:
     """Manages DPoP key pair for proof generation."""
@@ -50,33 +121,31 @@ class DPoPKeyPair:
             self._private_key = private_key
 
         self._public_key = self._private_key.public_key()
-        self._jwk = self._create_jwk()
+        jwk = self._create_jwk()
+        self._jwk = jwk
         self._thumbprint = self._compute_thumbprint()
+        # Header is identical for every proof signed with this key, so it
+        # is serialized once; proofs are signed directly as compact JWS.
+        header = {"typ": "dpop+jwt", "alg": algorithm, "jwk": jwk}
+        self._header_b64 = _b64u(_json_dumps(header))
+        self._signature_algorithm = _SIGNATURE_ALGORITHMS[algorithm]
+        self._coord_bytes = (self._curve.key_size + 7) // 8
 
     @staticmethod
     def _get_curve_for_algorithm(algorithm: str) -> ec.EllipticCurve:
         """Get elliptic curve for algorithm."""
-        curves: dict[str, ec.EllipticCurve] = {
-            "ES256": ec.SECP256R1(),
-            "ES384": ec.SECP384R1(),
-            "ES512": ec.SECP521R1(),
-        }
-        if algorithm not in curves:
+        try:
+            return _CURVES[algorithm]
+        except KeyError:
             msg = f"Unsupported algorithm: {algorithm}"
-            raise ValueError(msg)
-        return curves[algorithm]
+            raise ValueError(msg) from None
 
     def _create_jwk(self) -> dict[str, Any]:
         """Create JWK representation of public key."""
         public_numbers = self._public_key.public_numbers()
 
         # Get curve name for JWK
-        curve_names = {
-            "secp256r1": "P-256",
-            "secp384r1": "P-384",
-            "secp521r1": "P-521",
-        }
-        curve_name = curve_names.get(self._curve.name, "P-256")
+        curve_name = _JWK_CURVE_NAMES.get(self._curve.name, "P-256")
 
         # Calculate byte length for coordinates
         key_size = self._public_key.key_size
@@ -89,27 +158,24 @@ class DPoPKeyPair:
         return {
             "kty": "EC",
             "crv": curve_name,
-            "x": base64.urlsafe_b64encode(x_bytes).decode().rstrip("="),
-            "y": base64.urlsafe_b64encode(y_bytes).decode().rstrip("="),
+            "x": _b64u(x_bytes),
+            "y": _b64u(y_bytes),
         }
 
     def _compute_thumbprint(self) -> str:
         """Compute JWK thumbprint per RFC 7638."""
-        # Canonical JSON with sorted keys
-        canonical = json.dumps(
-            {
-                "crv": self._jwk["crv"],
-                "kty": self._jwk["kty"],
-                "x": self._jwk["x"],
-                "y": self._jwk["y"],
-            },
-            separators=(",", ":"),
-            sort_keys=True,
+        # Canonical JSON for EC keys has a fixed member order and the
+        # members are base64url/ASCII, so no sorting or escaping is needed.
+        jwk = self._jwk
+        canonical = b'{"crv":"%s","kty":"EC","x":"%s","y":"%s"}' % (
+            jwk["crv"].encode("ascii"),
+            jwk["x"].encode("ascii"),
+            jwk["y"].encode("ascii"),
         )
 
         # SHA-256 hash, base64url encoded
-        digest = hashlib.sha256(canonical.encode()).digest()
-        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+        digest = hashlib.sha256(canonical).digest()
+        return _b64u(digest)
 
     @property
     def thumbprint(self) -> str:
@@ -118,8 +184,12 @@ class DPoPKeyPair:
 
     @property
     def jwk(self) -> dict[str, Any]:
-        """Get public JWK."""
-        return self._jwk.copy()
+        """Get public JWK.
+
+        Returns a fresh copy, so callers may modify it without affecting
+        the proofs signed by this key pair.
+        """
+        return dict(self._jwk)
 
     def create_proof(
         self,
@@ -142,16 +212,9 @@ class DPoPKeyPair:
         """
         now = int(time.time())
 
-        # DPoP proof header
-        header = {
-            "typ": "dpop+jwt",
-            "alg": self.algorithm,
-            "jwk": self._jwk,
-        }
-
         # DPoP proof payload
         payload: dict[str, Any] = {
-            "jti": str(uuid.uuid4()),
+            "jti": secrets.token_urlsafe(16),
             "htm": http_method.upper(),
             "htu": http_uri,
             "iat": now,
@@ -159,22 +222,23 @@ class DPoPKeyPair:
 
         # Add access token hash if provided (for resource requests)
         if access_token:
-            ath = hashlib.sha256(access_token.encode()).digest()
-            payload["ath"] = base64.urlsafe_b64encode(ath).decode().rstrip("=")
+            payload["ath"] = _cached_access_token_hash(access_token)
 
         # Add nonce if provided
         if nonce:
             payload["nonce"] = nonce
 
-        # Get private key in PEM format for PyJWT
-        private_pem = self._private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
+        # Sign the proof (JWS compact serialization, raw r||s signature)
+        payload_b64 = _b64u(_json_dumps(payload))
+        signing_input = f"{self._header_b64}.{payload_b64}"
+        der_signature = self._private_key.sign(
+            signing_input.encode("ascii"),
+            self._signature_algorithm,
         )
-
-        # Sign the proof
-        proof = jwt.encode(payload, private_pem, algorithm=self.algorithm, headers=header)
+        r, s = decode_dss_signature(der_signature)
+        size = self._coord_bytes
+        signature = _b64u(r.to_bytes(size, "big") + s.to_bytes(size, "big"))
+        proof = f"{signing_input}.{signature}"
 
         return DPoPProof(
             proof=proof,
@@ -269,12 +333,10 @@ def verify_dpop_proof(
                 dpop_nonce=expected_nonce,
             )
 
-        # Verify access token hash if provided
-        if access_token:
-            expected_ath = hashlib.sha256(access_token.encode()).digest()
-            expected_ath_b64 = base64.urlsafe_b64encode(expected_ath).decode().rstrip("=")
-            if payload.get("ath") != expected_ath_b64:
-                raise DPoPError("Access token hash mismatch", ErrorCode.DPOP_INVALID)
+        # Verify access token hash if provided; computed uncached so
+        # presented tokens are not kept in memory
+        if access_token and payload.get("ath") != _access_token_hash(access_token):
+            raise DPoPError("Access token hash mismatch", ErrorCode.DPOP_INVALID)
 
         return payload
 
@@ -288,23 +350,24 @@ def _jwk_to_public_key(jwk: dict[str, Any]) -> EllipticCurvePublicKey:
         msg = "Only EC keys are supported for DPoP"
         raise ValueError(msg)
 
-    crv = jwk.get("crv", "P-256")
-    curves: dict[str, ec.EllipticCurve] = {
-        "P-256": ec.SECP256R1(),
-        "P-384": ec.SECP384R1(),
-        "P-521": ec.SECP521R1(),
-    }
+    return _ec_public_key(jwk.get("crv", "P-256"), jwk["x"], jwk["y"])
 
-    if crv not in curves:
+
+@functools.lru_cache(maxsize=512)
+def _ec_public_key(crv: str, x_b64: str, y_b64: str) -> EllipticCurvePublicKey:
+    """Build an EC public key from JWK members.
+
+    Clients re-present the same key on every proof, so the decoded and
+    point-validated key object is cached by its (crv, x, y) members.
+    """
+    curve = _JWK_CURVES.get(crv)
+    if curve is None:
         msg = f"Unsupported curve: {crv}"
         raise ValueError(msg)
 
     # Decode coordinates
-    x_bytes = base64.urlsafe_b64decode(jwk["x"] + "==")
-    y_bytes = base64.urlsafe_b64decode(jwk["y"] + "==")
-
-    x = int.from_bytes(x_bytes, "big")
-    y = int.from_bytes(y_bytes, "big")
+    x = int.from_bytes(_b64u_decode(x_b64), "big")
+    y = int.from_bytes(_b64u_decode(y_b64), "big")
 
-    public_numbers = ec.EllipticCurvePublicNumbers(x, y, curves[crv])
+    public_numbers = ec.EllipticCurvePublicNumbers(x, y, curve)
     return public_numbers.public_key()
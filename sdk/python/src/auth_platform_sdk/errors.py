@@ -63,10 +63,11 @@ class AuthPlatformError(Exception):
     ) -> None:
         super().__init__(message)
         self.message = message
-        self.code = code if isinstance(code, str) else code.value
+        # ErrorCode is a StrEnum, so both accepted types are already str
+        self.code = code
         self.status_code = status_code
         self.correlation_id = correlation_id
-        self.details = details or {}
+        self.details: dict[str, Any] = details if details else {}
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error to dictionary for logging/serialization."""
@@ -75,7 +76,7 @@ class AuthPlatformError(Exception):
             "code": self.code,
             "status_code": self.status_code,
             "correlation_id": self.correlation_id,
-            "details": self.details,
+            "details": dict(self.details),
         }
 
     def __repr__(self) -> str:
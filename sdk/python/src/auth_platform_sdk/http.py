@@ -7,18 +7,90 @@ and OpenTelemetry integration.
 from __future__ import annotations
 
 import asyncio
+import logging
+import math
 import time
+from contextlib import nullcontext
+from datetime import UTC
+from email.utils import parsedate_to_datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from ._compat import HTTP2_AVAILABLE
 from .errors import NetworkError, RateLimitError, ServerError, TimeoutError
-from .telemetry import get_logger, trace_operation
+from .telemetry import (
+    get_logger,
+    log_level_enabled,
+    trace_operation,
+    trace_requests_enabled,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .config import AuthPlatformConfig, RetryConfig
 
+# Sent by every SDK client; httpx copies these into its own Headers
+_DEFAULT_HEADERS = {
+    "User-Agent": "auth-platform-sdk/1.0.0 Python",
+    "Accept": "application/json",
+}
+
+# Token/DPoP traffic is many small requests to one host: keep connections
+# warm so requests reuse them instead of paying TCP+TLS setup again
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# Statuses that mark a failed attempt: rate limiting and all 5xx
+_RETRY_STATUSES = frozenset({429, *range(500, 600)})
+
+
+def should_retry_status(status_code: int) -> bool:
+    """Check if status code should trigger retry.
+
+    Shared by the request helpers and the HTTP executors so both classify
+    responses the same way.
+
+    Args:
+        status_code: HTTP status code.
+
+    Returns:
+        True if should retry.
+    """
+    return status_code in _RETRY_STATUSES
+
+
+def parse_retry_after(value: str | None) -> int | None:
+    """Parse a Retry-After header value into whole seconds.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds and HTTP-date,
+    ignoring surrounding whitespace.
+
+    Args:
+        value: Raw header value, if present.
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isascii() and value.isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # A "-0000" zone parses as naive but still means UTC
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0, math.ceil(retry_at.timestamp() - time.time()))
+
 
 class CircuitState(StrEnum):
     """Circuit breaker states."""
@@ -29,17 +101,25 @@ class CircuitState(StrEnum):
 
 
 class CircuitBreaker:
-    """Simple circuit breaker for resilience."""
+    """Simple circuit breaker for resilience.
+
+    Recovery timing uses ``time.monotonic()`` so wall-clock adjustments
+    cannot keep the circuit open or close it early. Pass ``clock`` to
+    substitute another monotonic time source, e.g. a fake one in tests.
+    """
 
     def __init__(
         self,
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
         half_open_requests: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_requests = half_open_requests
+        self._clock = clock
 
         self._state = CircuitState.CLOSED
         self._failure_count = 0
@@ -49,10 +129,13 @@ class CircuitBreaker:
     @property
     def state(self) -> CircuitState:
         """Get current circuit state."""
-        if self._state == CircuitState.OPEN:
-            if time.time() - self._last_failure_time >= self.recovery_timeout:
-                self._state = CircuitState.HALF_OPEN
-                self._half_open_successes = 0
+        state = self._state
+        # Only an open circuit needs the clock (to check for recovery)
+        if state != CircuitState.OPEN:
+            return state
+        if self._clock() - self._last_failure_time >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_successes = 0
         return self._state
 
     def record_success(self) -> None:
@@ -68,13 +151,39 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed request."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = self._clock()
 
         if self._state == CircuitState.HALF_OPEN:
             self._state = CircuitState.OPEN
         elif self._failure_count >= self.failure_threshold:
             self._state = CircuitState.OPEN
 
+    def record(self, *, successes: int = 0, failures: int = 0) -> None:
+        """Record a burst of request outcomes at once.
+
+        Failures are applied before successes, matching a retry sequence
+        that ends in success. Equivalent to calling record_failure() and
+        record_success() that many times, with a single clock read.
+        """
+        if failures:
+            self._failure_count += failures
+            self._last_failure_time = self._clock()
+
+            if (
+                self._state == CircuitState.HALF_OPEN
+                or self._failure_count >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+
+        if successes:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_successes += successes
+                if self._half_open_successes >= self.half_open_requests:
+                    self._state = CircuitState.CLOSED
+                    self._failure_count = 0
+            elif self._state == CircuitState.CLOSED:
+                self._failure_count = 0
+
     def allow_request(self) -> bool:
         """Check if request should be allowed."""
         return self.state != CircuitState.OPEN
@@ -97,11 +206,10 @@ def create_http_client(config: AuthPlatformConfig) -> httpx.Client:
             write=config.timeout,
             pool=config.timeout,
         ),
-        headers={
-            "User-Agent": "auth-platform-sdk/1.0.0 Python",
-            "Accept": "application/json",
-        },
+        headers=_DEFAULT_HEADERS,
         follow_redirects=False,
+        http2=HTTP2_AVAILABLE,
+        limits=_DEFAULT_LIMITS,
     )
 
 
@@ -122,14 +230,109 @@ def create_async_http_client(config: AuthPlatformConfig) -> httpx.AsyncClient:
             write=config.timeout,
             pool=config.timeout,
         ),
-        headers={
-            "User-Agent": "auth-platform-sdk/1.0.0 Python",
-            "Accept": "application/json",
-        },
+        headers=_DEFAULT_HEADERS,
         follow_redirects=False,
+        http2=HTTP2_AVAILABLE,
+        limits=_DEFAULT_LIMITS,
     )
 
 
+class _RetryDriver:
+    """Retry state machine shared by the sync and async request helpers.
+
+    The helpers only perform I/O and sleeping; classification of responses
+    and errors, circuit breaker accounting, delay selection and logging all
+    live here so both loops stay identical.
+    """
+
+    __slots__ = ("_circuit_breaker", "_last_error", "_logger", "_retry_config")
+
+    def __init__(
+        self,
+        retry_config: RetryConfig,
+        circuit_breaker: CircuitBreaker | None,
+    ) -> None:
+        self._retry_config = retry_config
+        self._circuit_breaker = circuit_breaker
+        self._logger = get_logger()
+        self._last_error: Exception | None = None
+
+    def before_attempt(self) -> None:
+        """Fail fast when the circuit breaker rejects the attempt.
+
+        Raises:
+            NetworkError: If the circuit breaker is open.
+        """
+        if self._circuit_breaker and not self._circuit_breaker.allow_request():
+            raise NetworkError("Circuit breaker is open")
+
+    def on_response(self, response: httpx.Response) -> httpx.Response:
+        """Classify a response, returning it when successful.
+
+        Raises:
+            RateLimitError: On 429 (retried by the caller).
+            ServerError: On 5xx (not retried).
+        """
+        status_code = response.status_code
+        if should_retry_status(status_code):
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure()
+            if status_code == 429:
+                raise RateLimitError(
+                    retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                )
+            raise ServerError(f"Server error: {status_code}", status_code=status_code)
+
+        if self._circuit_breaker:
+            self._circuit_breaker.record_success()
+        return response
+
+    def on_error(self, error: RateLimitError | httpx.HTTPError, attempt: int) -> float | None:
+        """Handle a failed attempt.
+
+        Args:
+            error: Rate limit or transport error raised by the attempt.
+            attempt: Zero-based attempt number.
+
+        Returns:
+            Seconds to sleep before the next attempt, or None to retry
+            (or finish) immediately.
+
+        Raises:
+            NetworkError: For transport errors that are not retryable.
+        """
+        if isinstance(error, RateLimitError):
+            self._last_error = error
+            delay = error.retry_after or self._retry_config.get_delay(attempt)
+            if log_level_enabled(logging.WARNING):
+                self._logger.warning("Rate limited, retrying", attempt=attempt, delay=delay)
+            return delay
+
+        if self._circuit_breaker:
+            self._circuit_breaker.record_failure()
+
+        if not isinstance(error, (httpx.TimeoutException, httpx.ConnectError)):
+            raise NetworkError(str(error), cause=error) from error
+
+        self._last_error = NetworkError(str(error), cause=error)
+        if attempt >= self._retry_config.max_retries:
+            return None
+
+        delay = self._retry_config.get_delay(attempt)
+        if log_level_enabled(logging.WARNING):
+            self._logger.warning(
+                "Request failed, retrying",
+                attempt=attempt,
+                delay=delay,
+                error=str(error),
+            )
+        return delay
+
+    def exhausted(self) -> Exception:
+        """Error to raise once every attempt has failed."""
+        return self._last_error or NetworkError("Request failed after retries")
+
+
 def request_with_retry(
     client: httpx.Client,
     method: str,
@@ -157,72 +360,29 @@ def request_with_retry(
         RateLimitError: On rate limiting.
         ServerError: On server error.
     """
-    logger = get_logger()
-    last_error: Exception | None = None
+    driver = _RetryDriver(retry_config, circuit_breaker)
+    tracing = trace_requests_enabled()
 
     for attempt in range(retry_config.max_retries + 1):
-        if circuit_breaker and not circuit_breaker.allow_request():
-            raise NetworkError("Circuit breaker is open")
+        driver.before_attempt()
 
         try:
-            with trace_operation(
-                "http_request",
-                attributes={"http.method": method, "http.url": url, "attempt": attempt},
-            ):
-                response = client.request(method, url, **kwargs)
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    if circuit_breaker:
-                        circuit_breaker.record_failure()
-                    raise RateLimitError(
-                        retry_after=int(retry_after) if retry_after else None
+            span_context = trace_operation("http_request") if tracing else nullcontext()
+            with span_context as span:
+                # Attributes are only built for spans that will be exported
+                if span is not None and span.is_recording():
+                    span.set_attributes(
+                        {"http.method": method, "http.url": url, "attempt": attempt}
                     )
+                response = client.request(method, url, **kwargs)
+                return driver.on_response(response)
 
-                if response.status_code >= 500:
-                    if circuit_breaker:
-                        circuit_breaker.record_failure()
-                    raise ServerError(
-                        f"Server error: {response.status_code}",
-                        status_code=response.status_code,
-                    )
-
-                if circuit_breaker:
-                    circuit_breaker.record_success()
-
-                return response
-
-        except RateLimitError as e:
-            last_error = e
-            delay = e.retry_after or retry_config.get_delay(attempt)
-            logger.warning(
-                "Rate limited, retrying",
-                attempt=attempt,
-                delay=delay,
-            )
-            time.sleep(delay)
-
-        except (httpx.TimeoutException, httpx.ConnectError) as e:
-            last_error = NetworkError(str(e), cause=e)
-            if circuit_breaker:
-                circuit_breaker.record_failure()
-
-            if attempt < retry_config.max_retries:
-                delay = retry_config.get_delay(attempt)
-                logger.warning(
-                    "Request failed, retrying",
-                    attempt=attempt,
-                    delay=delay,
-                    error=str(e),
-                )
+        except (RateLimitError, httpx.HTTPError) as e:
+            delay = driver.on_error(e, attempt)
+            if delay is not None:
                 time.sleep(delay)
 
-        except httpx.HTTPError as e:
-            if circuit_breaker:
-                circuit_breaker.record_failure()
-            raise NetworkError(str(e), cause=e) from e
-
-    raise last_error or NetworkError("Request failed after retries")
+    raise driver.exhausted()
 
 
 async def async_request_with_retry(
@@ -252,69 +412,26 @@ async def async_request_with_retry(
         RateLimitError: On rate limiting.
         ServerError: On server error.
     """
-    logger = get_logger()
-    last_error: Exception | None = None
+    driver = _RetryDriver(retry_config, circuit_breaker)
+    tracing = trace_requests_enabled()
 
     for attempt in range(retry_config.max_retries + 1):
-        if circuit_breaker and not circuit_breaker.allow_request():
-            raise NetworkError("Circuit breaker is open")
+        driver.before_attempt()
 
         try:
-            with trace_operation(
-                "http_request",
-                attributes={"http.method": method, "http.url": url, "attempt": attempt},
-            ):
-                response = await client.request(method, url, **kwargs)
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    if circuit_breaker:
-                        circuit_breaker.record_failure()
-                    raise RateLimitError(
-                        retry_after=int(retry_after) if retry_after else None
-                    )
-
-                if response.status_code >= 500:
-                    if circuit_breaker:
-                        circuit_breaker.record_failure()
-                    raise ServerError(
-                        f"Server error: {response.status_code}",
-                        status_code=response.status_code,
+            span_context = trace_operation("http_request") if tracing else nullcontext()
+            with span_context as span:
+                # Attributes are only built for spans that will be exported
+                if span is not None and span.is_recording():
+                    span.set_attributes(
+                        {"http.method": method, "http.url": url, "attempt": attempt}
                     )
+                response = await client.request(method, url, **kwargs)
+                return driver.on_response(response)
 
-                if circuit_breaker:
-                    circuit_breaker.record_success()
-
-                return response
-
-        except RateLimitError as e:
-            last_error = e
-            delay = e.retry_after or retry_config.get_delay(attempt)
-            logger.warning(
-                "Rate limited, retrying",
-                attempt=attempt,
-                delay=delay,
-            )
-            await asyncio.sleep(delay)
-
-        except (httpx.TimeoutException, httpx.ConnectError) as e:
-            last_error = NetworkError(str(e), cause=e)
-            if circuit_breaker:
-                circuit_breaker.record_failure()
-
-            if attempt < retry_config.max_retries:
-                delay = retry_config.get_delay(attempt)
-                logger.warning(
-                    "Request failed, retrying",
-                    attempt=attempt,
-                    delay=delay,
-                    error=str(e),
-                )
+        except (RateLimitError, httpx.HTTPError) as e:
+            delay = driver.on_error(e, attempt)
+            if delay is not None:
                 await asyncio.sleep(delay)
 
-        except httpx.HTTPError as e:
-            if circuit_breaker:
-                circuit_breaker.record_failure()
-            raise NetworkError(str(e), cause=e) from e
-
-    raise last_error or NetworkError("Request failed after retries")
+    raise driver.exhausted()
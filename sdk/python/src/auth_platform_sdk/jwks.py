@@ -9,21 +9,112 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
+import weakref
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import jwt
 from jwt import PyJWKClient
 
+from ._compat import HTTP2_AVAILABLE
+from .core.jwks_state import JWKSCacheState
+from .core.token_validator import unverified_key_id
 from .errors import ValidationError
-from .models import JWK, JWKS
+from .telemetry import get_logger
 
 if TYPE_CHECKING:
-    pass
+    import os
 
+    from .models import JWK, JWKS
 
-class JWKSCache:
-    """Thread-safe JWKS cache with configurable TTL and refresh-ahead."""
+
+def _jwks_limits(ttl_seconds: int) -> httpx.Limits:
+    """Pool limits that keep the IdP connection warm between refreshes."""
+    return httpx.Limits(
+        max_connections=8,
+        max_keepalive_connections=4,
+        keepalive_expiry=ttl_seconds * 2,
+    )
+
+
+# How often the async cache retries the cross-process lock
+_SHARED_LOCK_POLL_SECONDS = 0.05
+
+
+def _log_background_failure(jwks_uri: str, error: Exception) -> None:
+    """Log a failed background refresh without stopping the refresh loop."""
+    get_logger().warning(
+        "JWKS background refresh failed",
+        jwks_uri=jwks_uri,
+        error=str(error),
+    )
+
+
+def _background_refresh_loop(
+    cache_ref: weakref.ref[JWKSCache],
+    stop: threading.Event,
+) -> None:
+    """Refresh a JWKSCache ahead of expiry until it is closed or collected.
+
+    Only a weak reference is held between refreshes so an abandoned
+    cache can still be garbage collected.
+    """
+    while True:
+        cache = cache_ref()
+        if cache is None:
+            return
+        delay = cache._refresh_ahead_delay()
+        del cache
+
+        if stop.wait(delay):
+            return
+
+        cache = cache_ref()
+        if cache is None:
+            return
+        try:
+            with cache._lock:
+                cache._refresh()
+        except Exception as e:
+            # Keep serving cached keys; lookups refresh at hard expiry
+            _log_background_failure(cache.jwks_uri, e)
+        del cache
+
+
+async def _async_background_refresh_loop(cache_ref: weakref.ref[AsyncJWKSCache]) -> None:
+    """Refresh an AsyncJWKSCache ahead of expiry until cancelled or collected."""
+    while True:
+        cache = cache_ref()
+        if cache is None:
+            return
+        delay = cache._refresh_ahead_delay()
+        del cache
+
+        await asyncio.sleep(delay)
+
+        cache = cache_ref()
+        if cache is None:
+            return
+        try:
+            await cache._refresh_shared()
+        except Exception as e:
+            # Keep serving cached keys; lookups refresh at hard expiry
+            _log_background_failure(cache.jwks_uri, e)
+        del cache
+
+
+class JWKSCache(JWKSCacheState):
+    """Thread-safe JWKS cache with configurable TTL and refresh-ahead.
+
+    Lookups on a warm cache read the current key set without locking;
+    the lock only serializes refreshes and invalidation, which replace
+    the cached objects wholesale rather than mutating them.
+
+    After the first fetch a daemon thread refreshes the keys
+    ``refresh_ahead_seconds`` before expiry, so lookups only fetch
+    synchronously when the cache is empty or hard-expired. Call
+    ``close()`` to stop it.
+    """
 
     def __init__(
         self,
@@ -32,6 +123,8 @@ class JWKSCache:
         ttl_seconds: int = 3600,
         refresh_ahead_seconds: int = 300,
         http_timeout: float = 10.0,
+        max_stale_seconds: int = 900,
+        shared_cache_dir: str | os.PathLike[str] | None = None,
     ) -> None:
         """Initialize JWKS cache.
 
@@ -40,20 +133,33 @@ class JWKSCache:
             ttl_seconds: Cache TTL in seconds.
             refresh_ahead_seconds: Seconds before expiry to trigger refresh.
             http_timeout: HTTP request timeout.
+            max_stale_seconds: How long past expiry cached keys may still
+                be served while the JWKS endpoint is unreachable.
+            shared_cache_dir: Directory for a key set shared with other
+                worker processes, so one fetch serves them all. Must only
+                be writable by the service account.
         """
-        self.jwks_uri = jwks_uri
-        self.ttl_seconds = ttl_seconds
-        self.refresh_ahead_seconds = refresh_ahead_seconds
-        self.http_timeout = http_timeout
-
-        self._jwks: JWKS | None = None
-        self._cache_time: float = 0
+        super().__init__(
+            jwks_uri,
+            ttl_seconds=ttl_seconds,
+            refresh_ahead_seconds=refresh_ahead_seconds,
+            http_timeout=http_timeout,
+            max_stale_seconds=max_stale_seconds,
+            shared_cache_dir=shared_cache_dir,
+        )
         self._lock = threading.RLock()
         self._jwk_client: PyJWKClient | None = None
+        self._closed = threading.Event()
+        self._refresher: threading.Thread | None = None
+        # Pooled client reused across refreshes, created on first fetch
+        self._http: httpx.Client | None = None
 
     def get_signing_key(self, token: str) -> Any:
         """Get signing key for token, using cache if available.
 
+        The key is looked up in the cached key set by the token's ``kid``;
+        the key set is only re-fetched when the ``kid`` is unknown.
+
         Args:
             token: JWT token to get signing key for.
 
@@ -63,17 +169,49 @@ class JWKSCache:
         Raises:
             ValidationError: If key cannot be found or JWKS fetch fails.
         """
-        with self._lock:
-            if self._should_refresh():
-                self._refresh()
+        kid = unverified_key_id(token)
+        self._refresh_if_needed()
+        if kid is not None:
+            signing_key = self._signing_keys.get(kid)
+            if signing_key is None and self._refresh_for_unknown_kid(kid):
+                signing_key = self._signing_keys.get(kid)
+            if signing_key is None:
+                raise ValidationError(f"Key {kid} not found in JWKS")
+            return signing_key
 
-            if self._jwk_client is None:
-                raise ValidationError("JWKS not loaded")
+        jwk_client = self._jwk_client
 
-            try:
-                return self._jwk_client.get_signing_key_from_jwt(token)
-            except jwt.exceptions.PyJWKClientError as e:
-                raise ValidationError(f"Failed to get signing key: {e}") from e
+        if jwk_client is None:
+            raise ValidationError("JWKS not loaded")
+
+        try:
+            return jwk_client.get_signing_key_from_jwt(token)
+        except jwt.exceptions.PyJWKClientError as e:
+            raise ValidationError(f"Failed to get signing key: {e}") from e
+
+    def _refresh_for_unknown_kid(self, kid: str) -> bool:
+        """Re-fetch the key set once for a kid it does not contain.
+
+        Refreshes are rate limited, including while an outage keeps the
+        cache serving stale keys, so tokens with bogus key IDs cannot force
+        a fetch per request or queue lookups behind the lock.
+
+        Args:
+            kid: Key ID missing from the cached key set.
+
+        Returns:
+            True if the key set was refreshed or already contains kid.
+        """
+        if self._unknown_kid_refresh_throttled():
+            return False
+        with self._lock:
+            jwks = self._jwks
+            if jwks is not None and jwks.get_key(kid) is not None:
+                return True  # Another thread refreshed while we waited
+            if self._unknown_kid_refresh_throttled():
+                return False
+            self._refresh()
+            return True
 
     def get_key_by_id(self, kid: str) -> JWK | None:
         """Get key by key ID.
@@ -84,49 +222,101 @@ class JWKSCache:
         Returns:
             JWK if found, None otherwise.
         """
+        self._refresh_if_needed()
+        jwks = self._jwks
+
+        if jwks is None:
+            return None
+
+        return jwks.get_key(kid)
+
+    def _is_loaded(self) -> bool:
+        """Check if both the key set and its key client are installed."""
+        return self._jwk_client is not None and self._jwks is not None
+
+    def _install(self, jwks: JWKS, signing_keys: dict[str, jwt.PyJWK]) -> None:
+        """Publish a key set together with a fresh PyJWKClient."""
+        self._jwk_client = PyJWKClient(
+            self.jwks_uri,
+            cache_keys=True,
+            lifespan=self.ttl_seconds,
+        )
+        super()._install(jwks, signing_keys)
+
+    def _refresh_if_needed(self) -> None:
+        """Refresh the cache once, however many threads find it stale."""
+        if not self._should_refresh():
+            return
         with self._lock:
+            # Threads that queued behind the refreshing thread find the
+            # cache fresh on re-check and skip their own fetch
             if self._should_refresh():
                 self._refresh()
-
-            if self._jwks is None:
-                return None
-
-            return self._jwks.get_key(kid)
-
-    def _should_refresh(self) -> bool:
-        """Check if cache should be refreshed."""
-        if self._jwk_client is None or self._jwks is None:
-            return True
-
-        elapsed = time.time() - self._cache_time
-        # Refresh if expired or approaching expiry
-        return elapsed > (self.ttl_seconds - self.refresh_ahead_seconds)
-
-    def _refresh(self) -> None:
-        """Refresh JWKS from server."""
-        try:
-            # Use PyJWKClient for key management
-            self._jwk_client = PyJWKClient(
-                self.jwks_uri,
-                cache_keys=True,
-                lifespan=self.ttl_seconds,
+                self._start_background_refresh()
+
+    def _start_background_refresh(self) -> None:
+        """Start the refresh-ahead thread once keys have been loaded."""
+        if self._refresher is not None or self._closed.is_set():
+            return
+        self._refresher = threading.Thread(
+            target=_background_refresh_loop,
+            args=(weakref.ref(self), self._closed),
+            name="jwks-refresh",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def close(self) -> None:
+        """Stop background refreshing and release pooled connections.
+
+        Lookups keep working on demand after close, each fetch using a
+        one-shot connection instead of reopening the pool.
+        """
+        self._closed.set()
+        with self._lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def _http_client(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.Client(
+                timeout=self.http_timeout,
+                http2=HTTP2_AVAILABLE,
+                limits=_jwks_limits(self.ttl_seconds),
             )
+        return self._http
 
-            # Also fetch raw JWKS for direct key access
+    def _get(self, headers: dict[str, str]) -> httpx.Response:
+        """GET the JWKS, over a one-shot client once the cache is closed."""
+        if self._http is None and self._closed.is_set():
             with httpx.Client(timeout=self.http_timeout) as client:
-                response = client.get(self.jwks_uri)
-                response.raise_for_status()
-                jwks_data = response.json()
-
-            self._jwks = JWKS(
-                keys=[JWK(**key) for key in jwks_data.get("keys", [])]
-            )
-            self._cache_time = time.time()
+                return client.get(self.jwks_uri, headers=headers)
+        return self._http_client().get(self.jwks_uri, headers=headers)
 
+    def _refresh(self) -> None:
+        """Refresh JWKS, adopting a key set another worker just fetched."""
+        self._refresh_attempted_at = time.time()
+        shared_file = self._shared_file
+        if shared_file is None:
+            self._fetch()
+            return
+        with shared_file.lock():
+            if not self._adopt_shared(shared_file.load()):
+                self._fetch()
+
+    def _fetch(self) -> None:
+        """Fetch JWKS from server, revalidating when keys are cached."""
+        headers = self._revalidation_headers()
+        try:
+            response = self._get(headers)
         except httpx.HTTPError as e:
-            raise ValidationError(f"Failed to fetch JWKS: {e}") from e
+            self._fetch_failed(e)
+            return
         except Exception as e:
-            raise ValidationError(f"Failed to parse JWKS: {e}") from e
+            raise ValidationError(f"Failed to fetch JWKS: {e}") from e
+        self._apply_response(response, revalidating=bool(headers))
 
     def invalidate(self) -> None:
         """Invalidate the cache, forcing refresh on next access."""
@@ -135,15 +325,13 @@ class JWKSCache:
             self._jwks = None
             self._cache_time = 0
 
-    @property
-    def is_cached(self) -> bool:
-        """Check if JWKS is currently cached."""
-        with self._lock:
-            return self._jwks is not None and not self._should_refresh()
 
+class AsyncJWKSCache(JWKSCacheState):
+    """Async JWKS cache with configurable TTL and refresh-ahead.
 
-class AsyncJWKSCache:
-    """Async JWKS cache with configurable TTL and refresh-ahead."""
+    After the first fetch a background task refreshes the keys
+    ``refresh_ahead_seconds`` before expiry; ``close()`` cancels it.
+    """
 
     def __init__(
         self,
@@ -152,6 +340,8 @@ class AsyncJWKSCache:
         ttl_seconds: int = 3600,
         refresh_ahead_seconds: int = 300,
         http_timeout: float = 10.0,
+        max_stale_seconds: int = 900,
+        shared_cache_dir: str | os.PathLike[str] | None = None,
     ) -> None:
         """Initialize async JWKS cache.
 
@@ -160,15 +350,27 @@ class AsyncJWKSCache:
             ttl_seconds: Cache TTL in seconds.
             refresh_ahead_seconds: Seconds before expiry to trigger refresh.
             http_timeout: HTTP request timeout.
+            max_stale_seconds: How long past expiry cached keys may still
+                be served while the JWKS endpoint is unreachable.
+            shared_cache_dir: Directory for a key set shared with other
+                worker processes, so one fetch serves them all. Must only
+                be writable by the service account.
         """
-        self.jwks_uri = jwks_uri
-        self.ttl_seconds = ttl_seconds
-        self.refresh_ahead_seconds = refresh_ahead_seconds
-        self.http_timeout = http_timeout
-
-        self._jwks: JWKS | None = None
-        self._cache_time: float = 0
+        super().__init__(
+            jwks_uri,
+            ttl_seconds=ttl_seconds,
+            refresh_ahead_seconds=refresh_ahead_seconds,
+            http_timeout=http_timeout,
+            max_stale_seconds=max_stale_seconds,
+            shared_cache_dir=shared_cache_dir,
+        )
         self._lock = asyncio.Lock()
+        # In-flight refresh shared by every coroutine that finds the cache stale
+        self._refreshing: asyncio.Future[None] | None = None
+        self._refresher: asyncio.Task[None] | None = None
+        self._closed = False
+        # Pooled client reused across refreshes, created on first fetch
+        self._http: httpx.AsyncClient | None = None
 
     async def get_signing_key(self, kid: str) -> JWK:
         """Get signing key by key ID.
@@ -182,18 +384,68 @@ class AsyncJWKSCache:
         Raises:
             ValidationError: If key not found.
         """
-        async with self._lock:
-            if self._should_refresh():
-                await self._refresh()
+        await self._refresh_if_needed()
+        jwks = self._jwks
+        if jwks is not None and jwks.get_key(kid) is None:
+            if await self._refresh_for_unknown_kid(kid):
+                jwks = self._jwks
 
-            if self._jwks is None:
-                raise ValidationError("JWKS not loaded")
+        if jwks is None:
+            raise ValidationError("JWKS not loaded")
 
-            key = self._jwks.get_key(kid)
-            if key is None:
-                raise ValidationError(f"Key {kid} not found in JWKS")
+        key = jwks.get_key(kid)
+        if key is None:
+            raise ValidationError(f"Key {kid} not found in JWKS")
+
+        return key
+
+    async def get_verification_key(self, kid: str) -> jwt.PyJWK:
+        """Get the prepared verification key for a key ID.
+
+        The key object is built once per refresh, so callers can pass
+        ``.key`` straight to jwt.decode().
+
+        Args:
+            kid: Key ID to look up.
+
+        Returns:
+            PyJWK wrapping the public key.
+
+        Raises:
+            ValidationError: If key not found or cannot be loaded.
+        """
+        await self._refresh_if_needed()
+        signing_key = self._signing_keys.get(kid)
+        if signing_key is None and await self._refresh_for_unknown_kid(kid):
+            signing_key = self._signing_keys.get(kid)
+
+        if signing_key is None:
+            raise ValidationError(f"Key {kid} not found in JWKS")
+
+        return signing_key
+
+    async def _refresh_for_unknown_kid(self, kid: str) -> bool:
+        """Re-fetch the key set once for a kid it does not contain.
 
-            return key
+        Coroutines missing a key while a refresh is in flight join it
+        instead of fetching again, so a burst of tokens signed with a
+        rotated key costs one fetch. New refreshes are rate limited, also
+        while an outage keeps the cache serving stale keys, so tokens with
+        bogus key IDs cannot force a fetch per request.
+
+        Args:
+            kid: Key ID missing from the cached key set.
+
+        Returns:
+            True if the key set was refreshed or already contains kid.
+        """
+        jwks = self._jwks
+        if jwks is not None and jwks.get_key(kid) is not None:
+            return True
+        if self._refreshing is None and self._unknown_kid_refresh_throttled():
+            return False
+        await self._refresh_shared()
+        return True
 
     async def get_all_signing_keys(self) -> list[JWK]:
         """Get all signing keys.
@@ -201,40 +453,89 @@ class AsyncJWKSCache:
         Returns:
             List of JWKs suitable for signature verification.
         """
-        async with self._lock:
-            if self._should_refresh():
-                await self._refresh()
-
-            if self._jwks is None:
-                return []
+        await self._refresh_if_needed()
+        jwks = self._jwks
 
-            return self._jwks.get_signing_keys()
+        if jwks is None:
+            return []
 
-    def _should_refresh(self) -> bool:
-        """Check if cache should be refreshed."""
-        if self._jwks is None:
-            return True
+        return jwks.get_signing_keys()
 
-        elapsed = time.time() - self._cache_time
-        return elapsed > (self.ttl_seconds - self.refresh_ahead_seconds)
+    async def _refresh_if_needed(self) -> None:
+        """Refresh the cache once, however many coroutines find it stale."""
+        if not self._should_refresh():
+            return
 
-    async def _refresh(self) -> None:
-        """Refresh JWKS from server."""
-        try:
-            async with httpx.AsyncClient(timeout=self.http_timeout) as client:
-                response = await client.get(self.jwks_uri)
-                response.raise_for_status()
-                jwks_data = response.json()
+        await self._refresh_shared()
+        if self._refresher is None and not self._closed:
+            self._refresher = asyncio.create_task(
+                _async_background_refresh_loop(weakref.ref(self))
+            )
 
-            self._jwks = JWKS(
-                keys=[JWK(**key) for key in jwks_data.get("keys", [])]
+    async def _refresh_shared(self) -> None:
+        """Join the in-flight refresh, starting one if none is running."""
+        refreshing = self._refreshing
+        if refreshing is None:
+            refreshing = asyncio.ensure_future(self._refresh())
+            self._refreshing = refreshing
+            refreshing.add_done_callback(self._clear_refreshing)
+        # Shield so a cancelled caller does not abort the shared fetch
+        await asyncio.shield(refreshing)
+
+    def _clear_refreshing(self, refreshing: asyncio.Future[None]) -> None:
+        """Forget a finished refresh so the next expiry starts a new one."""
+        if self._refreshing is refreshing:
+            self._refreshing = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self.http_timeout,
+                http2=HTTP2_AVAILABLE,
+                limits=_jwks_limits(self.ttl_seconds),
             )
-            self._cache_time = time.time()
+        return self._http
+
+    async def _get(self, headers: dict[str, str]) -> httpx.Response:
+        """GET the JWKS, over a one-shot client once the cache is closed."""
+        if self._http is None and self._closed:
+            async with httpx.AsyncClient(timeout=self.http_timeout) as client:
+                return await client.get(self.jwks_uri, headers=headers)
+        return await self._http_client().get(self.jwks_uri, headers=headers)
 
+    async def _refresh(self) -> None:
+        """Refresh JWKS, adopting a key set another worker just fetched."""
+        self._refresh_attempted_at = time.time()
+        shared_file = self._shared_file
+        if shared_file is None:
+            await self._fetch()
+            return
+
+        # Poll the lock so a refresh in another process never blocks the loop
+        while True:
+            try:
+                handle = shared_file.acquire(blocking=False)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(_SHARED_LOCK_POLL_SECONDS)
+        try:
+            if not self._adopt_shared(shared_file.load()):
+                await self._fetch()
+        finally:
+            shared_file.release(handle)
+
+    async def _fetch(self) -> None:
+        """Fetch JWKS from server, revalidating when keys are cached."""
+        headers = self._revalidation_headers()
+        try:
+            response = await self._get(headers)
         except httpx.HTTPError as e:
-            raise ValidationError(f"Failed to fetch JWKS: {e}") from e
+            self._fetch_failed(e)
+            return
         except Exception as e:
-            raise ValidationError(f"Failed to parse JWKS: {e}") from e
+            raise ValidationError(f"Failed to fetch JWKS: {e}") from e
+        self._apply_response(response, revalidating=bool(headers))
 
     async def invalidate(self) -> None:
         """Invalidate the cache, forcing refresh on next access."""
@@ -242,7 +543,21 @@ class AsyncJWKSCache:
             self._jwks = None
             self._cache_time = 0
 
-    @property
-    def is_cached(self) -> bool:
-        """Check if JWKS is currently cached."""
-        return self._jwks is not None and not self._should_refresh()
+    async def close(self) -> None:
+        """Cancel background refreshing and release pooled connections.
+
+        An in-flight refresh is allowed to finish first, so it never runs
+        on a closed pool. Lookups keep working on demand after close, each
+        fetch using a one-shot connection instead of reopening the pool.
+        """
+        self._closed = True
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.cancel()
+        refreshing = self._refreshing
+        if refreshing is not None:
+            # Waits without raising; the refresh's own callers see its outcome
+            await asyncio.wait([refreshing])
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
@@ -6,6 +6,9 @@ with async support and OpenTelemetry integration.
 
 from __future__ import annotations
 
+import threading
+from functools import wraps
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable
 
 from .async_client import AsyncAuthPlatformClient
@@ -14,8 +17,76 @@ from .errors import AuthPlatformError, ValidationError
 from .models import TokenClaims
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .config import AuthPlatformConfig
 
+# Clients shared by every middleware built from the same config object,
+# keyed by id() and stored with that config. Lookups check the stored
+# config by identity, so a reused id can never return another config's client.
+_async_clients: dict[int, tuple[AuthPlatformConfig, AsyncAuthPlatformClient]] = {}
+_sync_clients: dict[int, tuple[AuthPlatformConfig, AuthPlatformClient]] = {}
+_clients_lock = threading.Lock()
+
+# Constant response parts. Read-only, and copied at each hand-off so
+# frameworks that edit bodies or headers in place cannot alter them.
+_MISSING_HEADER_ERROR = MappingProxyType({"error": "Missing authorization header"})
+_INVALID_HEADER_ERROR = MappingProxyType({"error": "Invalid authorization header format"})
+_BEARER_CHALLENGE = MappingProxyType({"WWW-Authenticate": "Bearer"})
+
+_BEARER_PREFIX = "Bearer "
+
+
+def _shared_async_client(config: AuthPlatformConfig) -> AsyncAuthPlatformClient:
+    """Return the async client shared by all middleware for config."""
+    with _clients_lock:
+        entry = _async_clients.get(id(config))
+        if entry is not None and entry[0] is config:
+            return entry[1]
+        client = AsyncAuthPlatformClient(config)
+        _async_clients[id(config)] = (config, client)
+        return client
+
+
+def _shared_client(config: AuthPlatformConfig) -> AuthPlatformClient:
+    """Return the sync client shared by all middleware for config."""
+    with _clients_lock:
+        entry = _sync_clients.get(id(config))
+        if entry is not None and entry[0] is config:
+            return entry[1]
+        client = AuthPlatformClient(config)
+        _sync_clients[id(config)] = (config, client)
+        return client
+
+
+async def close_shared_clients() -> None:
+    """Close and forget the async clients shared by FastAPI middleware.
+
+    Call on application shutdown (or between tests) to release HTTP
+    connections and background JWKS refreshes. Middleware created
+    afterwards builds fresh clients on first use.
+    """
+    with _clients_lock:
+        clients = [client for _, client in _async_clients.values()]
+        _async_clients.clear()
+
+    for client in clients:
+        await client.close()
+
+
+def close_shared_clients_sync() -> None:
+    """Close and forget the sync clients shared by Flask and Django middleware.
+
+    The counterpart of ``close_shared_clients`` for sync applications,
+    which need no event loop to clean up.
+    """
+    with _clients_lock:
+        clients = [client for _, client in _sync_clients.values()]
+        _sync_clients.clear()
+
+    for client in clients:
+        client.close()
+
 
 def create_fastapi_middleware(config: AuthPlatformConfig) -> Any:
     """Create FastAPI dependency for token validation.
@@ -37,7 +108,7 @@ def create_fastapi_middleware(config: AuthPlatformConfig) -> Any:
         raise ImportError(msg) from e
 
     security = HTTPBearer(auto_error=True)
-    client = AsyncAuthPlatformClient(config)
+    client = _shared_async_client(config)
 
     async def get_current_user(
         request: Request,
@@ -56,7 +127,7 @@ def create_fastapi_middleware(config: AuthPlatformConfig) -> Any:
             raise HTTPException(
                 status_code=401,
                 detail=str(e),
-                headers={"WWW-Authenticate": "Bearer"},
+                headers=dict(_BEARER_CHALLENGE),
             ) from e
         except AuthPlatformError as e:
             raise HTTPException(
@@ -75,27 +146,29 @@ def create_fastapi_optional_auth(config: AuthPlatformConfig) -> Any:
 
     Returns:
         FastAPI dependency function that returns None if no token.
+        ``request.state.user_claims`` is only set when a token validates.
     """
     try:
-        from fastapi import Depends, Request
-        from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+        from fastapi import Request
     except ImportError as e:
         msg = "FastAPI not installed. Install with: pip install fastapi"
         raise ImportError(msg) from e
 
-    security = HTTPBearer(auto_error=False)
-    client = AsyncAuthPlatformClient(config)
+    client = _shared_async_client(config)
 
-    async def get_optional_user(
-        request: Request,
-        credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    ) -> TokenClaims | None:
+    async def get_optional_user(request: Request) -> TokenClaims | None:
         """Dependency to optionally get current user from token."""
-        if credentials is None:
+        # Read the header directly so anonymous requests skip HTTPBearer
+        auth_header = request.headers.get("authorization")
+        if not auth_header:
+            return None
+
+        scheme, _, token = auth_header.partition(" ")
+        if not token or scheme.lower() != "bearer":
             return None
 
         try:
-            claims = await client.validate_token(credentials.credentials)
+            claims = await client.validate_token(token)
             request.state.user_claims = claims
             return claims
         except (ValidationError, AuthPlatformError):
@@ -118,12 +191,11 @@ def create_flask_middleware(config: AuthPlatformConfig) -> Callable[..., Any]:
     """
     try:
         from flask import g, request
-        from functools import wraps
     except ImportError as e:
         msg = "Flask not installed. Install with: pip install flask"
         raise ImportError(msg) from e
 
-    client = AuthPlatformClient(config)
+    client = _shared_client(config)
 
     def require_auth(f: Callable[..., Any]) -> Callable[..., Any]:
         """Decorator to require authentication."""
@@ -133,12 +205,11 @@ def create_flask_middleware(config: AuthPlatformConfig) -> Callable[..., Any]:
             auth_header = request.headers.get("Authorization")
 
             if not auth_header:
-                return {"error": "Missing authorization header"}, 401
-
-            if not auth_header.startswith("Bearer "):
-                return {"error": "Invalid authorization header format"}, 401
+                return dict(_MISSING_HEADER_ERROR), 401
 
-            token = auth_header[7:]  # Remove "Bearer " prefix
+            if not auth_header.startswith(_BEARER_PREFIX):
+                return dict(_INVALID_HEADER_ERROR), 401
+            token = auth_header[len(_BEARER_PREFIX):]
 
             try:
                 g.current_user = client.validate_token(token)
@@ -165,12 +236,11 @@ def create_flask_optional_auth(config: AuthPlatformConfig) -> Callable[..., Any]
     """
     try:
         from flask import g, request
-        from functools import wraps
     except ImportError as e:
         msg = "Flask not installed. Install with: pip install flask"
         raise ImportError(msg) from e
 
-    client = AuthPlatformClient(config)
+    client = _shared_client(config)
 
     def optional_auth(f: Callable[..., Any]) -> Callable[..., Any]:
         """Decorator for optional authentication."""
@@ -180,10 +250,9 @@ def create_flask_optional_auth(config: AuthPlatformConfig) -> Callable[..., Any]
             g.current_user = None
             auth_header = request.headers.get("Authorization")
 
-            if auth_header and auth_header.startswith("Bearer "):
-                token = auth_header[7:]
+            if auth_header and auth_header.startswith(_BEARER_PREFIX):
                 try:
-                    g.current_user = client.validate_token(token)
+                    g.current_user = client.validate_token(auth_header[len(_BEARER_PREFIX):])
                 except (ValidationError, AuthPlatformError):
                     pass  # Token invalid, but that's OK for optional auth
 
@@ -215,50 +284,59 @@ class DjangoAuthMiddleware:
             raise ImportError(msg) from e
 
         self.get_response = get_response
-        self.client = AuthPlatformClient(config)
-        self.exempt_paths: list[str] = []
+        self.client = _shared_client(config)
+        self._json_response = JsonResponse
         self.exempt_methods: set[str] = {"OPTIONS"}
+        # Kept as a tuple for a single str.startswith call per request
+        self._exempt_prefixes: tuple[str, ...] = ()
 
     def __call__(self, request: Any) -> Any:
         """Process request."""
-        from django.http import JsonResponse
+        json_response = self._json_response
 
         # Skip exempt methods
         if request.method in self.exempt_methods:
             return self.get_response(request)
 
         # Skip exempt paths
-        if any(request.path.startswith(path) for path in self.exempt_paths):
+        prefixes = self._exempt_prefixes
+        if prefixes and request.path.startswith(prefixes):
             return self.get_response(request)
 
         auth_header = request.headers.get("Authorization")
 
         if not auth_header:
-            return JsonResponse(
-                {"error": "Missing authorization header"},
-                status=401,
-            )
+            return json_response(dict(_MISSING_HEADER_ERROR), status=401)
 
-        if not auth_header.startswith("Bearer "):
-            return JsonResponse(
-                {"error": "Invalid authorization header format"},
-                status=401,
-            )
-
-        token = auth_header[7:]
+        if not auth_header.startswith(_BEARER_PREFIX):
+            return json_response(dict(_INVALID_HEADER_ERROR), status=401)
+        token = auth_header[len(_BEARER_PREFIX):]
 
         try:
             request.user_claims = self.client.validate_token(token)
         except ValidationError as e:
-            return JsonResponse({"error": str(e)}, status=401)
+            return json_response({"error": str(e)}, status=401)
         except AuthPlatformError as e:
-            return JsonResponse({"error": str(e)}, status=e.status_code or 500)
+            return json_response({"error": str(e)}, status=e.status_code or 500)
 
         return self.get_response(request)
 
+    @property
+    def exempt_paths(self) -> tuple[str, ...]:
+        """Path prefixes that don't require authentication.
+
+        Read-only; assign a new sequence or use ``add_exempt_path`` to
+        change it.
+        """
+        return self._exempt_prefixes
+
+    @exempt_paths.setter
+    def exempt_paths(self, paths: Iterable[str]) -> None:
+        self._exempt_prefixes = tuple(paths)
+
     def add_exempt_path(self, path: str) -> None:
         """Add a path that doesn't require authentication."""
-        self.exempt_paths.append(path)
+        self._exempt_prefixes = (*self._exempt_prefixes, path)
 
     def add_exempt_method(self, method: str) -> None:
         """Add an HTTP method that doesn't require authentication."""
@@ -6,6 +6,7 @@ and modern Python 3.11+ type hints.
 
 from __future__ import annotations
 
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any, Self
 
@@ -14,6 +15,7 @@ from pydantic import (
     ConfigDict,
     Field,
     HttpUrl,
+    PrivateAttr,
     SecretStr,
     field_validator,
     model_validator,
@@ -35,6 +37,69 @@ class TokenResponse(BaseModel):
     # DPoP support
     dpop_nonce: str | None = Field(default=None, alias="DPoP-Nonce")
 
+    @classmethod
+    def from_json(cls, content: bytes | str) -> Self:
+        """Parse a token endpoint response body.
+
+        With msgspec installed the body is decoded and checked in one pass
+        and the model is built without re-validation; otherwise pydantic
+        parses the raw JSON directly.
+
+        Args:
+            content: Raw JSON response body.
+
+        Returns:
+            Parsed token response.
+
+        Raises:
+            pydantic.ValidationError: If the body is not a valid token response.
+        """
+        if _token_response_decoder is not None:
+            try:
+                parsed = _token_response_decoder.decode(content)
+            except msgspec.MsgspecError:
+                pass  # Fall through so callers see pydantic's error
+            else:
+                # Only keys present in the body count as set, as with pydantic
+                values = {
+                    name: value
+                    for name in _TOKEN_RESPONSE_FIELDS
+                    if (value := getattr(parsed, name)) is not msgspec.UNSET
+                }
+                return cls.model_construct(_fields_set=set(values), **values)
+        return cls.model_validate_json(content)
+
+
+_TOKEN_RESPONSE_FIELDS = tuple(TokenResponse.model_fields)
+
+_token_response_decoder: Any
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    _token_response_decoder = None
+else:
+    # msgspec mirror of TokenResponse's validation rules; UNSET marks
+    # optional keys missing from the body
+    _TokenResponseStruct = msgspec.defstruct(
+        "_TokenResponseStruct",
+        [
+            ("access_token", Annotated[str, msgspec.Meta(min_length=1)]),
+            ("expires_in", Annotated[int, msgspec.Meta(gt=0)]),
+            ("token_type", str | msgspec.UnsetType, msgspec.UNSET),
+            ("refresh_token", str | None | msgspec.UnsetType, msgspec.UNSET),
+            ("scope", str | None | msgspec.UnsetType, msgspec.UNSET),
+            ("id_token", str | None | msgspec.UnsetType, msgspec.UNSET),
+            (
+                "dpop_nonce",
+                str | None | msgspec.UnsetType,
+                msgspec.field(default=msgspec.UNSET, name="DPoP-Nonce"),
+            ),
+        ],
+        frozen=True,
+    )
+    # Lax mode accepts numeric strings for expires_in, as pydantic does
+    _token_response_decoder = msgspec.json.Decoder(_TokenResponseStruct, strict=False)
+
 
 class TokenData(BaseModel):
     """Internal token storage with expiration tracking."""
@@ -49,6 +114,13 @@ class TokenData(BaseModel):
     id_token: str | None = None
     dpop_nonce: str | None = None
 
+    # Expiry as a Unix timestamp so checks are a float compare
+    _expires_at_ts: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the expiry timestamp for cheap expiration checks."""
+        self._expires_at_ts = self.expires_at.timestamp()
+
     @classmethod
     def from_response(
         cls,
@@ -60,7 +132,8 @@ class TokenData(BaseModel):
         expires_at = datetime.now(UTC) + timedelta(
             seconds=response.expires_in - buffer_seconds
         )
-        return cls(
+        # Every field comes from a validated TokenResponse, so skip revalidation
+        return cls.model_construct(
             access_token=response.access_token,
             token_type=response.token_type,
             expires_at=expires_at,
@@ -72,11 +145,11 @@ class TokenData(BaseModel):
 
     def is_expired(self) -> bool:
         """Check if token is expired."""
-        return datetime.now(UTC) >= self.expires_at
+        return time.time() >= self._expires_at_ts
 
     def time_until_expiry(self) -> timedelta:
         """Get time remaining until token expires."""
-        return self.expires_at - datetime.now(UTC)
+        return timedelta(seconds=self._expires_at_ts - time.time())
 
 
 class TokenClaims(BaseModel):
@@ -97,17 +170,22 @@ class TokenClaims(BaseModel):
     # DPoP confirmation
     cnf: dict[str, Any] | None = Field(default=None, description="Confirmation claim")
 
+    # Split once; claims are frozen and may be shared through the claims cache
+    _scopes: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the parsed scope list for repeated authorization checks."""
+        self._scopes = tuple(self.scope.split()) if self.scope else ()
+
     @property
-    def scopes(self) -> list[str]:
-        """Get scopes as list."""
-        if self.scope is None:
-            return []
-        return self.scope.split()
+    def scopes(self) -> tuple[str, ...]:
+        """Get scopes as an immutable sequence."""
+        return self._scopes
 
     @property
     def is_expired(self) -> bool:
         """Check if token claims indicate expiration."""
-        return datetime.now(UTC).timestamp() >= self.exp
+        return time.time() >= self.exp
 
     @property
     def expires_at(self) -> datetime:
@@ -149,6 +227,20 @@ class DPoPProof(BaseModel):
     nonce: str | None = Field(default=None, description="Server-provided nonce")
 
 
+# Optional fields sent under their own names, in wire order
+_OPTIONAL_QUERY_PARAMS = (
+    "scope",
+    "state",
+    "nonce",
+    "code_challenge",
+    "code_challenge_method",
+    "prompt",
+    "login_hint",
+    "acr_values",
+)
+_OPTIONAL_FORM_FIELDS = ("code", "redirect_uri", "refresh_token", "scope", "code_verifier")
+
+
 class AuthorizationRequest(BaseModel):
     """OAuth 2.0 authorization request parameters."""
 
@@ -170,29 +262,23 @@ class AuthorizationRequest(BaseModel):
     login_hint: str | None = None
     acr_values: str | None = None
 
+    # HttpUrl re-serializes on every str(), so keep the string form
+    _redirect_uri_str: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the serialized redirect URI for repeated query building."""
+        self._redirect_uri_str = str(self.redirect_uri)
+
     def to_query_params(self) -> dict[str, str]:
         """Convert to URL query parameters."""
-        params: dict[str, str] = {
+        params = {
             "response_type": self.response_type,
             "client_id": self.client_id,
-            "redirect_uri": str(self.redirect_uri),
+            "redirect_uri": self._redirect_uri_str,
         }
-        if self.scope:
-            params["scope"] = self.scope
-        if self.state:
-            params["state"] = self.state
-        if self.nonce:
-            params["nonce"] = self.nonce
-        if self.code_challenge:
-            params["code_challenge"] = self.code_challenge
-        if self.code_challenge_method:
-            params["code_challenge_method"] = self.code_challenge_method
-        if self.prompt:
-            params["prompt"] = self.prompt
-        if self.login_hint:
-            params["login_hint"] = self.login_hint
-        if self.acr_values:
-            params["acr_values"] = self.acr_values
+        for key in _OPTIONAL_QUERY_PARAMS:
+            if value := getattr(self, key):
+                params[key] = value
         return params
 
 
@@ -228,22 +314,12 @@ class TokenRequest(BaseModel):
 
     def to_form_data(self) -> dict[str, str]:
         """Convert to form data for token request."""
-        data: dict[str, str] = {
-            "grant_type": self.grant_type,
-            "client_id": self.client_id,
-        }
+        data = {"grant_type": self.grant_type, "client_id": self.client_id}
         if self.client_secret:
             data["client_secret"] = self.client_secret.get_secret_value()
-        if self.code:
-            data["code"] = self.code
-        if self.redirect_uri:
-            data["redirect_uri"] = self.redirect_uri
-        if self.refresh_token:
-            data["refresh_token"] = self.refresh_token
-        if self.scope:
-            data["scope"] = self.scope
-        if self.code_verifier:
-            data["code_verifier"] = self.code_verifier
+        for key in _OPTIONAL_FORM_FIELDS:
+            if value := getattr(self, key):
+                data[key] = value
         return data
 
 
@@ -274,13 +350,24 @@ class JWKS(BaseModel):
 
     keys: list[JWK]
 
+    # Lookup tables built once; the model is frozen so they never go stale
+    _kid_index: dict[str, JWK] = PrivateAttr(default_factory=dict)
+    _signing_keys: list[JWK] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Index keys by ID so lookups don't scan the key list."""
+        index: dict[str, JWK] = {}
+        for key in self.keys:
+            # First key wins on duplicate IDs, matching a linear scan
+            if key.kid is not None:
+                index.setdefault(key.kid, key)
+        self._kid_index = index
+        self._signing_keys = [k for k in self.keys if k.use in (None, "sig")]
+
     def get_key(self, kid: str) -> JWK | None:
         """Get key by ID."""
-        for key in self.keys:
-            if key.kid == kid:
-                return key
-        return None
+        return self._kid_index.get(kid)
 
     def get_signing_keys(self) -> list[JWK]:
         """Get all keys suitable for signature verification."""
-        return [k for k in self.keys if k.use in (None, "sig")]
+        return list(self._signing_keys)
@@ -16,6 +16,9 @@ from .models import PKCEChallenge
 if TYPE_CHECKING:
     pass
 
+# Standard to URL-safe base64 alphabet
+_B64URL_TABLE = bytes.maketrans(b"+/", b"-_")
+
 
 def generate_code_verifier(length: int = 64) -> str:
     """Generate a cryptographically random code verifier.
@@ -33,16 +36,8 @@ def generate_code_verifier(length: int = 64) -> str:
         msg = "Code verifier length must be between 43 and 128 characters"
         raise ValueError(msg)
 
-    # Generate random bytes and encode as URL-safe base64
-    # We need more bytes than the final length due to base64 encoding
-    num_bytes = (length * 3) // 4 + 1
-    random_bytes = secrets.token_bytes(num_bytes)
-
-    # URL-safe base64 without padding
-    verifier = base64.urlsafe_b64encode(random_bytes).decode("ascii")
-    verifier = verifier.rstrip("=")
-
-    return verifier[:length]
+    # Each random byte yields 4/3 unpadded base64url characters
+    return secrets.token_urlsafe((length * 3 + 3) // 4)[:length]
 
 
 def generate_code_challenge(code_verifier: str) -> str:
@@ -57,9 +52,8 @@ def generate_code_challenge(code_verifier: str) -> str:
     # SHA-256 hash of the verifier
     digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
 
-    # Base64url encode without padding
-    challenge = base64.urlsafe_b64encode(digest).decode("ascii")
-    return challenge.rstrip("=")
+    # A 32-byte digest encodes to 43 characters plus exactly one "=" pad
+    return base64.b64encode(digest)[:-1].translate(_B64URL_TABLE).decode("ascii")
 
 
 def create_pkce_challenge(verifier_length: int = 64) -> PKCEChallenge:
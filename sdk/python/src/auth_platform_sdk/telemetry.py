@@ -6,40 +6,96 @@ Provides tracing, metrics, and structured logging for observability.
 from __future__ import annotations
 
 import functools
+import inspect
+import logging
+import types
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ParamSpec,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 import structlog
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Awaitable, Generator
 
     from .config import TelemetryConfig
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
-# Module-level tracer and logger
-_tracer: trace.Tracer | None = None
-_logger: structlog.BoundLogger | None = None
+
+class _TelemetryState:
+    """Settings written by configure_telemetry and read on hot paths."""
+
+    __slots__ = (
+        "log_level",
+        "logger",
+        "structlog_level",
+        "trace_requests",
+        "tracer",
+        "tracing_enabled",
+    )
+
+    def __init__(self) -> None:
+        # SDK tracer and logger, created on first use
+        self.tracer: trace.Tracer | None = None
+        self.logger: structlog.BoundLogger | None = None
+        # Whether per-request HTTP spans are emitted (see configure_telemetry)
+        self.trace_requests = True
+        # False once telemetry is disabled; traced code then skips span handling
+        self.tracing_enabled = True
+        # Minimum level configured for structlog; NOTSET until configure_telemetry
+        self.log_level = logging.NOTSET
+        # Level structlog was last configured with, to skip identical reconfiguration
+        self.structlog_level: int | None = None
+
+
+_state = _TelemetryState()
+
+# Processor chain installed by configure_telemetry; the processors are stateless
+_PROCESSORS = (
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.JSONRenderer(),
+)
 
 
 def get_tracer() -> trace.Tracer:
     """Get or create the SDK tracer."""
-    global _tracer
-    if _tracer is None:
-        _tracer = trace.get_tracer("auth-platform-sdk", "1.0.0")
-    return _tracer
+    if _state.tracer is None:
+        _state.tracer = trace.get_tracer("auth-platform-sdk", "1.0.0")
+    return _state.tracer
 
 
 def get_logger() -> structlog.BoundLogger:
     """Get or create the SDK logger."""
-    global _logger
-    if _logger is None:
-        _logger = structlog.get_logger("auth-platform-sdk")
-    return _logger
+    if _state.logger is None:
+        _state.logger = structlog.get_logger("auth-platform-sdk")
+    return _state.logger
+
+
+def trace_requests_enabled() -> bool:
+    """Check whether per-request HTTP spans should be created."""
+    return _state.trace_requests
+
+
+def log_level_enabled(level: int) -> bool:
+    """Check whether SDK messages at ``level`` pass the configured level."""
+    return _state.log_level <= level
 
 
 def configure_telemetry(config: TelemetryConfig) -> None:
@@ -48,44 +104,38 @@ def configure_telemetry(config: TelemetryConfig) -> None:
     Args:
         config: Telemetry configuration.
     """
-    global _tracer, _logger
+    state = _state
+    state.trace_requests = config.enabled and config.trace_requests
+    state.tracing_enabled = config.enabled
 
     if not config.enabled:
-        _tracer = trace.NoOpTracer()
+        state.tracer = trace.NoOpTracer()
         return
 
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            _log_level_to_int(config.log_level)
-        ),
-        context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+    log_level = state.log_level = _log_level_to_int(config.log_level)
+
+    # Reconfiguring resets structlog's cached loggers, so only do it on change
+    if state.structlog_level != log_level:
+        structlog.configure(
+            processors=list(_PROCESSORS),
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
+            context_class=dict,
+            logger_factory=structlog.PrintLoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        state.structlog_level = log_level
+
+    state.tracer = trace.get_tracer(config.service_name, "1.0.0")
+    state.logger = structlog.get_logger(config.service_name)
+
 
-    _tracer = trace.get_tracer(config.service_name, "1.0.0")
-    _logger = structlog.get_logger(config.service_name)
+# getLevelNamesMapping() copies the registry on every call, so take it once
+_LOG_LEVELS = logging.getLevelNamesMapping()
 
 
 def _log_level_to_int(level: str) -> int:
     """Convert log level string to integer."""
-    levels = {
-        "DEBUG": 10,
-        "INFO": 20,
-        "WARNING": 30,
-        "ERROR": 40,
-        "CRITICAL": 50,
-    }
-    return levels.get(level.upper(), 20)
+    return _LOG_LEVELS.get(level.upper(), logging.INFO)
 
 
 @contextmanager
@@ -101,13 +151,16 @@ def trace_operation(
         attributes: Optional span attributes.
 
     Yields:
-        The active span.
+        The active span, or a non-recording span when telemetry is disabled.
     """
+    if not _state.tracing_enabled:
+        yield trace.INVALID_SPAN
+        return
+
     tracer = get_tracer()
     with tracer.start_as_current_span(name) as span:
-        if attributes:
-            for key, value in attributes.items():
-                span.set_attribute(key, value)
+        if attributes and span.is_recording():
+            span.set_attributes(attributes)
         try:
             yield span
         except Exception as e:
@@ -116,6 +169,79 @@ def trace_operation(
             raise
 
 
+# Argument types recorded as span attributes by record_args
+_RECORDABLE_TYPES = (str, int, float, bool)
+
+
+def _may_be_recordable(hint: Any) -> bool:
+    """Check whether a value annotated with hint could be recorded."""
+    if hint is Any or hint is object:
+        return True
+    if isinstance(hint, type):
+        return issubclass(hint, _RECORDABLE_TYPES)
+    origin = get_origin(hint)
+    if origin is Union or origin is types.UnionType:
+        return any(_may_be_recordable(arg) for arg in get_args(hint))
+    if isinstance(origin, type):
+        return issubclass(origin, _RECORDABLE_TYPES)
+    # TypeVars, Literals and other special forms
+    return True
+
+
+def _recordable_params(
+    func: Callable[..., Any],
+) -> tuple[tuple[int, ...], frozenset[str]] | None:
+    """Find the arguments of func whose annotations allow primitive values.
+
+    Returns:
+        Positional indices and keyword names worth checking, or None when
+        the signature can't be resolved and every argument must be checked.
+    """
+    try:
+        signature = inspect.signature(func)
+        hints = get_type_hints(func)
+    except (TypeError, ValueError, NameError):
+        return None
+
+    positions: list[int] = []
+    names: set[str] = set()
+    for index, param in enumerate(signature.parameters.values()):
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            return None
+        if index == 0 and param.name in ("self", "cls"):
+            continue
+        if not _may_be_recordable(hints.get(param.name, Any)):
+            continue
+        if param.kind is not param.KEYWORD_ONLY:
+            positions.append(index)
+        if param.kind is not param.POSITIONAL_ONLY:
+            names.add(param.name)
+    return tuple(positions), frozenset(names)
+
+
+def _arg_attributes(
+    recordable: tuple[tuple[int, ...], frozenset[str]] | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Build span attributes from the primitive arguments of a call."""
+    attributes: dict[str, Any] = {}
+    if recordable is None:
+        positions: Any = range(len(args))
+        items: Any = kwargs.items()
+    else:
+        positions = [i for i in recordable[0] if i < len(args)]
+        items = [(k, v) for k, v in kwargs.items() if k in recordable[1]]
+    # Only record safe, serializable arguments
+    for i in positions:
+        if isinstance(args[i], _RECORDABLE_TYPES):
+            attributes[f"arg_{i}"] = args[i]
+    for key, value in items:
+        if isinstance(value, _RECORDABLE_TYPES):
+            attributes[f"kwarg_{key}"] = value
+    return attributes
+
+
 def traced(
     name: str | None = None,
     *,
@@ -133,18 +259,14 @@ def traced(
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         span_name = name or func.__name__
+        recordable = _recordable_params(func) if record_args else None
 
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            attributes: dict[str, Any] = {}
-            if record_args:
-                # Only record safe, serializable arguments
-                for i, arg in enumerate(args):
-                    if isinstance(arg, (str, int, float, bool)):
-                        attributes[f"arg_{i}"] = arg
-                for key, value in kwargs.items():
-                    if isinstance(value, (str, int, float, bool)):
-                        attributes[f"kwarg_{key}"] = value
+            if not _state.tracing_enabled:
+                return func(*args, **kwargs)
+
+            attributes = _arg_attributes(recordable, args, kwargs) if record_args else {}
 
             with trace_operation(span_name, attributes=attributes):
                 return func(*args, **kwargs)
@@ -158,7 +280,7 @@ def traced_async(
     name: str | None = None,
     *,
     record_args: bool = False,
-) -> Callable[[Callable[P, T]], Callable[P, T]]:
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """Decorator to trace an async function.
 
     Args:
@@ -169,52 +291,64 @@ def traced_async(
         Decorated async function.
     """
 
-    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         span_name = name or func.__name__
+        recordable = _recordable_params(func) if record_args else None
 
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            attributes: dict[str, Any] = {}
-            if record_args:
-                for i, arg in enumerate(args):
-                    if isinstance(arg, (str, int, float, bool)):
-                        attributes[f"arg_{i}"] = arg
-                for key, value in kwargs.items():
-                    if isinstance(value, (str, int, float, bool)):
-                        attributes[f"kwarg_{key}"] = value
+            if not _state.tracing_enabled:
+                return await func(*args, **kwargs)
+
+            attributes = _arg_attributes(recordable, args, kwargs) if record_args else {}
 
             with trace_operation(span_name, attributes=attributes):
-                return await func(*args, **kwargs)  # type: ignore[misc]
+                return await func(*args, **kwargs)
 
-        return wrapper  # type: ignore[return-value]
+        return wrapper
 
     return decorator
 
 
 class SDKLogger:
-    """Structured logger for SDK operations."""
+    """Structured logger for SDK operations.
+
+    Messages below the level set by ``configure_telemetry`` return before
+    reaching structlog's processor chain.
+    """
+
+    __slots__ = ("_logger",)
 
     def __init__(self, name: str = "auth-platform-sdk") -> None:
         self._logger = structlog.get_logger(name)
 
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message."""
+        if _state.log_level > logging.DEBUG:
+            return
         self._logger.debug(message, **kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log info message."""
+        if _state.log_level > logging.INFO:
+            return
         self._logger.info(message, **kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message."""
+        if _state.log_level > logging.WARNING:
+            return
         self._logger.warning(message, **kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log error message."""
+        if _state.log_level > logging.ERROR:
+            return
         self._logger.error(message, **kwargs)
 
-    def bind(self, **kwargs: Any) -> "SDKLogger":
+    def bind(self, **kwargs: Any) -> SDKLogger:
         """Create a new logger with bound context."""
-        new_logger = SDKLogger.__new__(SDKLogger)
+        # Skip __init__, which would look up a fresh structlog logger
+        new_logger = object.__new__(type(self))
         new_logger._logger = self._logger.bind(**kwargs)
         return new_logger
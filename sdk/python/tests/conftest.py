@@ -6,6 +6,7 @@ and test data generation.
 """
 
 import pytest
+from hypothesis import Phase, settings
 from unittest.mock import MagicMock
 
 from auth_platform_sdk.config import (
@@ -15,6 +16,27 @@ from auth_platform_sdk.config import (
     RetryConfig,
     TelemetryConfig,
 )
+from auth_platform_sdk.dpop import DPoPKeyPair
+
+# For properties whose assertion does not depend on the drawn value, a few
+# examples suffice. Use via settings.get_profile("invariant").
+settings.register_profile(
+    "invariant",
+    max_examples=5,
+    phases=(Phase.generate,),
+    database=None,
+    deadline=None,
+)
+
+
+@pytest.fixture(scope="session")
+def dpop_keypairs() -> dict[str, DPoPKeyPair]:
+    """Provide one DPoP key pair per supported algorithm.
+
+    EC key generation dominates DPoP test time, and the tested properties
+    do not depend on the particular key, so the pairs are shared.
+    """
+    return {alg: DPoPKeyPair(algorithm=alg) for alg in ("ES256", "ES384", "ES512")}
 
 
 @pytest.fixture
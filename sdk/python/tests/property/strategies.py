@@ -0,0 +1,12 @@
+"""Hypothesis strategies shared across property test modules."""
+
+from __future__ import annotations
+
+from hypothesis import strategies as st
+
+# Client IDs are opaque to these tests; a small ASCII alphabet keeps examples cheap
+client_id_strategy = st.text(
+    alphabet="abcdefghijklmnopqrstuvwxyz0123456789-_",
+    min_size=1,
+    max_size=16,
+)
@@ -9,22 +9,31 @@ Property 11: Authorization URL Construction
 
 from __future__ import annotations
 
-from urllib.parse import parse_qs, urlparse
+import functools
+from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit
 
 import pytest
-from hypothesis import given, settings, assume, HealthCheck
+from hypothesis import example, given, settings, Phase
 from hypothesis import strategies as st
 
 from auth_platform_sdk.config import AuthPlatformConfig
 from auth_platform_sdk.core.auth_builder import AuthorizationBuilder
+from auth_platform_sdk.pkce import generate_state
+
+from .strategies import client_id_strategy
+
+
+# Failures here are not meaningfully reducible, so skip shrink and explain
+FAST_SETTINGS = settings(
+    max_examples=100,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate),
+    deadline=None,
+)
 
 
 # Strategies for generating test data
-client_id_strategy = st.text(
-    alphabet=st.characters(whitelist_categories=("L", "N"), whitelist_characters="-_"),
-    min_size=1,
-    max_size=64,
-).filter(lambda x: len(x.strip()) > 0)
+# Redirect URI used by explicit @example cases
+_CALLBACK = "https://example.com/callback"
 
 redirect_uri_strategy = st.sampled_from([
     "https://example.com/callback",
@@ -41,14 +50,45 @@ scope_strategy = st.lists(
 )
 
 
+def check_params(
+    url: str,
+    required: dict[str, str] | None = None,
+    absent: tuple[str, ...] = (),
+) -> tuple[SplitResult, dict[str, str]]:
+    """Parse a URL once and check its query against expected parameters.
+
+    Args:
+        url: URL to check.
+        required: Parameters that must be present with exactly these values.
+        absent: Parameter names that must not be present.
+
+    Returns:
+        The split URL and its query parameters, one value per name.
+    """
+    parsed = urlsplit(url)
+    params = dict(parse_qsl(parsed.query))
+    if required is not None:
+        assert required.items() <= params.items()
+    for key in absent:
+        assert key not in params
+    return parsed, params
+
+
+@functools.lru_cache(maxsize=512)
 def create_test_config(client_id: str) -> AuthPlatformConfig:
-    """Create a test configuration."""
+    """Create a test configuration (configs are frozen, so shared)."""
     return AuthPlatformConfig(
         client_id=client_id,
         base_url="https://auth.example.com",
     )
 
 
+@functools.lru_cache(maxsize=512)
+def _builder_for(client_id: str) -> AuthorizationBuilder:
+    """Return a shared builder; it holds no state besides its config."""
+    return AuthorizationBuilder(create_test_config(client_id))
+
+
 class TestAuthorizationURLConstruction:
     """Property tests for authorization URL construction."""
 
@@ -58,7 +98,8 @@ class TestAuthorizationURLConstruction:
         scopes=scope_strategy,
         use_pkce=st.booleans(),
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    @example(client_id="a", redirect_uri=_CALLBACK, scopes=[], use_pkce=False)
+    @FAST_SETTINGS
     def test_required_parameters_always_present(
         self,
         client_id: str,
@@ -67,112 +108,69 @@ class TestAuthorizationURLConstruction:
         use_pkce: bool,
     ) -> None:
         """Property: All required OAuth 2.0 parameters are always present."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
-
-        url, state, pkce = builder.build_authorization_url(
+        url, state, _ = _builder_for(client_id).build_authorization_url(
             redirect_uri,
-            scopes=scopes if scopes else None,
+            scopes=scopes or None,
             use_pkce=use_pkce,
         )
 
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
-        # Required parameters must be present
-        assert "response_type" in params
-        assert params["response_type"][0] == "code"
-        assert "client_id" in params
-        assert params["client_id"][0] == client_id
-        assert "redirect_uri" in params
-        assert params["redirect_uri"][0] == redirect_uri
-        assert "state" in params
+        _, params = check_params(
+            url,
+            {
+                "response_type": "code",
+                "client_id": client_id,
+                "redirect_uri": redirect_uri,
+                "state": state,
+            },
+        )
         assert "nonce" in params
 
-    @given(
-        client_id=client_id_strategy,
-        redirect_uri=redirect_uri_strategy,
-    )
-    @settings(max_examples=100)
-    def test_pkce_parameters_when_enabled(
-        self,
-        client_id: str,
-        redirect_uri: str,
-    ) -> None:
+    @given(client_id=client_id_strategy, redirect_uri=redirect_uri_strategy)
+    @FAST_SETTINGS
+    def test_pkce_parameters_when_enabled(self, client_id: str, redirect_uri: str) -> None:
         """Property: PKCE parameters are present when PKCE is enabled."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
-
-        url, state, pkce = builder.build_authorization_url(
+        url, _, pkce = _builder_for(client_id).build_authorization_url(
             redirect_uri,
             use_pkce=True,
         )
 
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
-        # PKCE parameters must be present
-        assert "code_challenge" in params
-        assert "code_challenge_method" in params
-        assert params["code_challenge_method"][0] == "S256"
         assert pkce is not None
-        assert pkce.code_challenge == params["code_challenge"][0]
+        check_params(
+            url,
+            {"code_challenge": pkce.code_challenge, "code_challenge_method": "S256"},
+        )
 
-    @given(
-        client_id=client_id_strategy,
-        redirect_uri=redirect_uri_strategy,
-    )
-    @settings(max_examples=100)
-    def test_no_pkce_parameters_when_disabled(
-        self,
-        client_id: str,
-        redirect_uri: str,
-    ) -> None:
+    @given(client_id=client_id_strategy, redirect_uri=redirect_uri_strategy)
+    @FAST_SETTINGS
+    def test_no_pkce_parameters_when_disabled(self, client_id: str, redirect_uri: str) -> None:
         """Property: PKCE parameters are absent when PKCE is disabled."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
-
-        url, state, pkce = builder.build_authorization_url(
+        url, _, pkce = _builder_for(client_id).build_authorization_url(
             redirect_uri,
             use_pkce=False,
         )
 
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
-        # PKCE parameters must be absent
-        assert "code_challenge" not in params
-        assert "code_challenge_method" not in params
         assert pkce is None
+        check_params(url, absent=("code_challenge", "code_challenge_method"))
 
-    @given(
-        client_id=client_id_strategy,
-        redirect_uri=redirect_uri_strategy,
-    )
-    @settings(max_examples=100)
-    def test_state_uniqueness(
-        self,
-        client_id: str,
-        redirect_uri: str,
-    ) -> None:
-        """Property: Generated states are unique across calls."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
+    def test_state_uniqueness(self) -> None:
+        """Property: Generated states are unique across calls.
 
-        states = set()
-        for _ in range(10):
-            _, state, _ = builder.build_authorization_url(redirect_uri)
-            states.add(state)
+        Uniqueness comes from the random generator rather than the builder
+        inputs, so one large sample beats many small generated ones.
+        """
+        builder = _builder_for("a")
 
-        # All states should be unique
-        assert len(states) == 10
+        states = {builder.build_authorization_url(_CALLBACK)[1] for _ in range(1000)}
+
+        assert len(states) == 1000
 
     @given(
         client_id=client_id_strategy,
         redirect_uri=redirect_uri_strategy,
-        scopes=scope_strategy,
+        scopes=scope_strategy.filter(bool),
     )
-    @settings(max_examples=100)
+    @example(client_id="a", redirect_uri=_CALLBACK, scopes=["openid", "profile"])
+    @FAST_SETTINGS
     def test_scope_encoding(
         self,
         client_id: str,
@@ -180,22 +178,14 @@ class TestAuthorizationURLConstruction:
         scopes: list[str],
     ) -> None:
         """Property: Scopes are correctly space-separated in URL."""
-        assume(len(scopes) > 0)
-
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
-
-        url, _, _ = builder.build_authorization_url(
+        url, _, _ = _builder_for(client_id).build_authorization_url(
             redirect_uri,
             scopes=scopes,
         )
 
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
+        _, params = check_params(url)
         assert "scope" in params
-        url_scopes = set(params["scope"][0].split())
-        assert url_scopes == set(scopes)
+        assert set(params["scope"].split()) == set(scopes)
 
     @given(
         client_id=client_id_strategy,
@@ -203,7 +193,13 @@ class TestAuthorizationURLConstruction:
         custom_state=st.text(min_size=16, max_size=64),
         custom_nonce=st.text(min_size=16, max_size=64),
     )
-    @settings(max_examples=100)
+    @example(
+        client_id="a",
+        redirect_uri=_CALLBACK,
+        custom_state="s" * 16,
+        custom_nonce="n" * 16,
+    )
+    @FAST_SETTINGS
     def test_custom_state_and_nonce_preserved(
         self,
         client_id: str,
@@ -212,41 +208,25 @@ class TestAuthorizationURLConstruction:
         custom_nonce: str,
     ) -> None:
         """Property: Custom state and nonce are preserved in URL."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
-
-        url, returned_state, _ = builder.build_authorization_url(
+        url, returned_state, _ = _builder_for(client_id).build_authorization_url(
             redirect_uri,
             state=custom_state,
             nonce=custom_nonce,
         )
 
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
         assert returned_state == custom_state
-        assert params["state"][0] == custom_state
-        assert params["nonce"][0] == custom_nonce
+        check_params(url, {"state": custom_state, "nonce": custom_nonce})
 
-    @given(
-        client_id=client_id_strategy,
-        redirect_uri=redirect_uri_strategy,
-    )
-    @settings(max_examples=100)
-    def test_url_base_matches_config(
-        self,
-        client_id: str,
-        redirect_uri: str,
-    ) -> None:
+    @given(client_id=client_id_strategy, redirect_uri=redirect_uri_strategy)
+    @FAST_SETTINGS
+    def test_url_base_matches_config(self, client_id: str, redirect_uri: str) -> None:
         """Property: URL base matches authorization endpoint from config."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
+        builder = _builder_for(client_id)
 
         url, _, _ = builder.build_authorization_url(redirect_uri)
 
-        parsed = urlparse(url)
-        expected_endpoint = urlparse(config.authorization_endpoint)
-
+        parsed, _ = check_params(url)
+        expected_endpoint = urlsplit(builder.config.authorization_endpoint)
         assert parsed.scheme == expected_endpoint.scheme
         assert parsed.netloc == expected_endpoint.netloc
         assert parsed.path == expected_endpoint.path
@@ -260,7 +240,7 @@ class TestCallbackParsing:
         redirect_uri=redirect_uri_strategy,
         auth_code=st.text(min_size=16, max_size=128, alphabet="abcdefghijklmnopqrstuvwxyz0123456789"),
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_valid_callback_extracts_code(
         self,
         client_id: str,
@@ -268,14 +248,14 @@ class TestCallbackParsing:
         auth_code: str,
     ) -> None:
         """Property: Valid callback URL correctly extracts authorization code."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
+        builder = _builder_for(client_id)
 
-        # Generate authorization URL to get state
-        _, state, _ = builder.build_authorization_url(redirect_uri)
+        # The builder keeps no state registry, so any generated state will do
+        state = generate_state()
 
         # Simulate callback URL
-        callback_url = f"{redirect_uri}?code={auth_code}&state={state}"
+        query = urlencode({"code": auth_code, "state": state})
+        callback_url = f"{redirect_uri}?{query}"
 
         code, error = builder.parse_callback_url(callback_url, state)
 
@@ -287,7 +267,7 @@ class TestCallbackParsing:
         redirect_uri=redirect_uri_strategy,
         auth_code=st.text(min_size=16, max_size=128, alphabet="abcdefghijklmnopqrstuvwxyz0123456789"),
     )
-    @settings(max_examples=100)
+    @FAST_SETTINGS
     def test_state_mismatch_raises_error(
         self,
         client_id: str,
@@ -295,15 +275,15 @@ class TestCallbackParsing:
         auth_code: str,
     ) -> None:
         """Property: State mismatch raises ValueError."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
+        builder = _builder_for(client_id)
 
-        # Generate authorization URL to get state
-        _, state, _ = builder.build_authorization_url(redirect_uri)
+        # The builder keeps no state registry, so any generated state will do
+        state = generate_state()
 
         # Simulate callback URL with wrong state
         wrong_state = "wrong_state_value"
-        callback_url = f"{redirect_uri}?code={auth_code}&state={wrong_state}"
+        query = urlencode({"code": auth_code, "state": wrong_state})
+        callback_url = f"{redirect_uri}?{query}"
 
         with pytest.raises(ValueError, match="State mismatch"):
             builder.parse_callback_url(callback_url, state)
@@ -318,7 +298,11 @@ class TestCallbackParsing:
             "server_error",
         ]),
     )
-    @settings(max_examples=100)
+    @example(client_id="a", redirect_uri=_CALLBACK, error_code="access_denied")
+    @example(client_id="a", redirect_uri=_CALLBACK, error_code="invalid_request")
+    @example(client_id="a", redirect_uri=_CALLBACK, error_code="unauthorized_client")
+    @example(client_id="a", redirect_uri=_CALLBACK, error_code="server_error")
+    @settings(FAST_SETTINGS, max_examples=20)
     def test_error_response_raises_error(
         self,
         client_id: str,
@@ -326,14 +310,14 @@ class TestCallbackParsing:
         error_code: str,
     ) -> None:
         """Property: Error response in callback raises ValueError."""
-        config = create_test_config(client_id)
-        builder = AuthorizationBuilder(config)
+        builder = _builder_for(client_id)
 
-        # Generate authorization URL to get state
-        _, state, _ = builder.build_authorization_url(redirect_uri)
+        # The builder keeps no state registry, so any generated state will do
+        state = generate_state()
 
         # Simulate error callback URL
-        callback_url = f"{redirect_uri}?error={error_code}&state={state}"
+        query = urlencode({"error": error_code, "state": state})
+        callback_url = f"{redirect_uri}?{query}"
 
         with pytest.raises(ValueError, match="Authorization error"):
             builder.parse_callback_url(callback_url, state)
@@ -6,11 +6,8 @@ Validates: Requirements 2.3
 
 from __future__ import annotations
 
-import time
-from unittest.mock import patch
-
 import pytest
-from hypothesis import given, settings, strategies as st, assume
+from hypothesis import Phase, given, settings, strategies as st
 from hypothesis.stateful import RuleBasedStateMachine, rule, invariant, initialize
 
 from auth_platform_sdk.http import CircuitBreaker, CircuitState
@@ -18,7 +15,8 @@ from auth_platform_sdk.http import CircuitBreaker, CircuitState
 
 # Strategies for generating test data
 failure_thresholds = st.integers(min_value=1, max_value=20)
-recovery_timeouts = st.floats(min_value=1.0, max_value=300.0, allow_nan=False, allow_infinity=False)
+# Whole seconds: the breaker only compares elapsed time against the timeout
+recovery_timeouts = st.integers(min_value=1, max_value=300).map(float)
 half_open_requests = st.integers(min_value=1, max_value=10)
 
 
@@ -38,40 +36,25 @@ class TestCircuitBreakerStateTransitions:
         assert cb.state == CircuitState.CLOSED
         assert cb.allow_request() is True
 
-    @given(threshold=failure_thresholds)
+    @given(threshold=failure_thresholds, extra=st.integers(min_value=0, max_value=5))
     @settings(max_examples=100)
-    def test_opens_after_threshold_failures(self, threshold: int) -> None:
-        """Property 9: Circuit opens after threshold consecutive failures.
-        
-        Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
-        Validates: Requirements 2.3
-        """
-        cb = CircuitBreaker(failure_threshold=threshold)
-        
-        # Record failures up to threshold
-        for _ in range(threshold):
-            cb.record_failure()
-        
-        assert cb.state == CircuitState.OPEN
-        assert cb.allow_request() is False
+    def test_opens_exactly_at_threshold_failures(self, threshold: int, extra: int) -> None:
+        """Property 9: Circuit opens once failures reach the threshold, not before.
+
+        Failure counts range from two below to three above the threshold.
 
-    @given(threshold=failure_thresholds)
-    @settings(max_examples=100)
-    def test_stays_closed_below_threshold(self, threshold: int) -> None:
-        """Property 9: Circuit stays closed below failure threshold.
-        
         Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
         Validates: Requirements 2.3
         """
-        assume(threshold > 1)
+        failures = max(threshold + extra - 2, 0)
         cb = CircuitBreaker(failure_threshold=threshold)
-        
-        # Record failures below threshold
-        for _ in range(threshold - 1):
+
+        for _ in range(failures):
             cb.record_failure()
-        
-        assert cb.state == CircuitState.CLOSED
-        assert cb.allow_request() is True
+
+        should_open = failures >= threshold
+        assert (cb.state == CircuitState.OPEN) == should_open
+        assert cb.allow_request() is not should_open
 
     @given(
         threshold=failure_thresholds,
@@ -88,9 +71,11 @@ class TestCircuitBreakerStateTransitions:
         Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
         Validates: Requirements 2.3
         """
+        now = [0.0]
         cb = CircuitBreaker(
             failure_threshold=threshold,
             recovery_timeout=recovery_timeout,
+            clock=lambda: now[0],
         )
         
         # Open the circuit
@@ -100,9 +85,9 @@ class TestCircuitBreakerStateTransitions:
         assert cb.state == CircuitState.OPEN
         
         # Simulate time passing beyond recovery timeout
-        with patch.object(time, "time", return_value=cb._last_failure_time + recovery_timeout + 1):
-            assert cb.state == CircuitState.HALF_OPEN
-            assert cb.allow_request() is True
+        now[0] += recovery_timeout + 1
+        assert cb.state == CircuitState.HALF_OPEN
+        assert cb.allow_request() is True
 
     @given(
         threshold=failure_thresholds,
@@ -119,10 +104,12 @@ class TestCircuitBreakerStateTransitions:
         Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
         Validates: Requirements 2.3
         """
+        now = [0.0]
         cb = CircuitBreaker(
             failure_threshold=threshold,
             recovery_timeout=1.0,
             half_open_requests=half_open_reqs,
+            clock=lambda: now[0],
         )
         
         # Open the circuit
@@ -130,14 +117,14 @@ class TestCircuitBreakerStateTransitions:
             cb.record_failure()
         
         # Transition to half-open
-        with patch.object(time, "time", return_value=cb._last_failure_time + 2.0):
-            assert cb.state == CircuitState.HALF_OPEN
-            
-            # Record successes
-            for _ in range(half_open_reqs):
-                cb.record_success()
-            
-            assert cb.state == CircuitState.CLOSED
+        now[0] += 2.0
+        assert cb.state == CircuitState.HALF_OPEN
+
+        # Record successes
+        for _ in range(half_open_reqs):
+            cb.record_success()
+
+        assert cb.state == CircuitState.CLOSED
 
     @given(threshold=failure_thresholds)
     @settings(max_examples=100)
@@ -147,9 +134,11 @@ class TestCircuitBreakerStateTransitions:
         Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
         Validates: Requirements 2.3
         """
+        now = [0.0]
         cb = CircuitBreaker(
             failure_threshold=threshold,
             recovery_timeout=1.0,
+            clock=lambda: now[0],
         )
         
         # Open the circuit
@@ -157,15 +146,15 @@ class TestCircuitBreakerStateTransitions:
             cb.record_failure()
         
         # Transition to half-open
-        with patch.object(time, "time", return_value=cb._last_failure_time + 2.0):
-            assert cb.state == CircuitState.HALF_OPEN
-            
-            # Record failure in half-open
-            cb.record_failure()
-            
-            assert cb.state == CircuitState.OPEN
+        now[0] += 2.0
+        assert cb.state == CircuitState.HALF_OPEN
 
-    @given(threshold=failure_thresholds)
+        # Record failure in half-open
+        cb.record_failure()
+
+        assert cb.state == CircuitState.OPEN
+
+    @given(threshold=st.integers(min_value=2, max_value=20))
     @settings(max_examples=100)
     def test_success_resets_failure_count_in_closed(self, threshold: int) -> None:
         """Property 9: Success resets failure count in CLOSED state.
@@ -173,7 +162,6 @@ class TestCircuitBreakerStateTransitions:
         Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
         Validates: Requirements 2.3
         """
-        assume(threshold > 1)
         cb = CircuitBreaker(failure_threshold=threshold)
         
         # Record some failures
@@ -189,6 +177,58 @@ class TestCircuitBreakerStateTransitions:
         
         assert cb.state == CircuitState.CLOSED
 
+    @given(
+        threshold=failure_thresholds,
+        half_open_reqs=half_open_requests,
+        failures=st.integers(min_value=0, max_value=25),
+        successes=st.integers(min_value=0, max_value=10),
+        start_half_open=st.booleans(),
+    )
+    @settings(max_examples=100)
+    def test_batched_record_matches_individual_calls(
+        self,
+        threshold: int,
+        half_open_reqs: int,
+        failures: int,
+        successes: int,
+        start_half_open: bool,
+    ) -> None:
+        """Property 9: record() matches the equivalent sequence of single calls.
+        
+        Feature: python-sdk-state-of-art-2025, Property 9: Circuit Breaker State Transitions
+        Validates: Requirements 2.3
+        """
+        now = [0.0]
+
+        def make_breaker() -> CircuitBreaker:
+            return CircuitBreaker(
+                failure_threshold=threshold,
+                recovery_timeout=1.0,
+                half_open_requests=half_open_reqs,
+                clock=lambda: now[0],
+            )
+
+        batched, single = make_breaker(), make_breaker()
+        if start_half_open:
+            for cb in (batched, single):
+                for _ in range(threshold):
+                    cb.record_failure()
+            now[0] += 2.0
+            assert batched.state == single.state == CircuitState.HALF_OPEN
+        
+        batched.record(successes=successes, failures=failures)
+        for _ in range(failures):
+            single.record_failure()
+        for _ in range(successes):
+            single.record_success()
+        
+        assert batched.state == single.state
+        # Equal failure counts: further failures open both at the same point
+        for _ in range(threshold):
+            batched.record_failure()
+            single.record_failure()
+            assert batched.state == single.state
+
 
 class CircuitBreakerStateMachine(RuleBasedStateMachine):
     """Stateful property test for circuit breaker using Hypothesis."""
@@ -203,7 +243,7 @@ class CircuitBreakerStateMachine(RuleBasedStateMachine):
 
     @initialize(
         threshold=failure_thresholds,
-        recovery=st.floats(min_value=1.0, max_value=10.0, allow_nan=False, allow_infinity=False),
+        recovery=st.integers(min_value=1, max_value=10).map(float),
         half_open=half_open_requests,
     )
     def init_circuit_breaker(self, threshold: int, recovery: float, half_open: int) -> None:
@@ -212,11 +252,12 @@ class CircuitBreakerStateMachine(RuleBasedStateMachine):
             failure_threshold=threshold,
             recovery_timeout=recovery,
             half_open_requests=half_open,
+            clock=lambda: self.mock_time,
         )
         self.expected_state = CircuitState.CLOSED
         self.failure_count = 0
         self.half_open_successes = 0
-        self.mock_time = time.time()
+        self.mock_time = 0.0
 
     @rule()
     def record_success(self) -> None:
@@ -224,16 +265,15 @@ class CircuitBreakerStateMachine(RuleBasedStateMachine):
         if self.cb is None:
             return
         
-        with patch.object(time, "time", return_value=self.mock_time):
-            self.cb.record_success()
-            
-            if self.expected_state == CircuitState.HALF_OPEN:
-                self.half_open_successes += 1
-                if self.half_open_successes >= self.cb.half_open_requests:
-                    self.expected_state = CircuitState.CLOSED
-                    self.failure_count = 0
-            elif self.expected_state == CircuitState.CLOSED:
+        self.cb.record_success()
+
+        if self.expected_state == CircuitState.HALF_OPEN:
+            self.half_open_successes += 1
+            if self.half_open_successes >= self.cb.half_open_requests:
+                self.expected_state = CircuitState.CLOSED
                 self.failure_count = 0
+        elif self.expected_state == CircuitState.CLOSED:
+            self.failure_count = 0
 
     @rule()
     def record_failure(self) -> None:
@@ -241,14 +281,13 @@ class CircuitBreakerStateMachine(RuleBasedStateMachine):
         if self.cb is None:
             return
         
-        with patch.object(time, "time", return_value=self.mock_time):
-            self.cb.record_failure()
-            self.failure_count += 1
-            
-            if self.expected_state == CircuitState.HALF_OPEN:
-                self.expected_state = CircuitState.OPEN
-            elif self.failure_count >= self.cb.failure_threshold:
-                self.expected_state = CircuitState.OPEN
+        self.cb.record_failure()
+        self.failure_count += 1
+
+        if self.expected_state == CircuitState.HALF_OPEN:
+            self.expected_state = CircuitState.OPEN
+        elif self.failure_count >= self.cb.failure_threshold:
+            self.expected_state = CircuitState.OPEN
 
     @rule()
     def advance_time_small(self) -> None:
@@ -274,11 +313,10 @@ class CircuitBreakerStateMachine(RuleBasedStateMachine):
         if self.cb is None:
             return
         
-        with patch.object(time, "time", return_value=self.mock_time):
-            actual_state = self.cb.state
-            assert actual_state == self.expected_state, (
-                f"Expected {self.expected_state}, got {actual_state}"
-            )
+        actual_state = self.cb.state
+        assert actual_state == self.expected_state, (
+            f"Expected {self.expected_state}, got {actual_state}"
+        )
 
     @invariant()
     def allow_request_consistent_with_state(self) -> None:
@@ -286,14 +324,20 @@ class CircuitBreakerStateMachine(RuleBasedStateMachine):
         if self.cb is None:
             return
         
-        with patch.object(time, "time", return_value=self.mock_time):
-            state = self.cb.state
-            allowed = self.cb.allow_request()
-            
-            if state == CircuitState.OPEN:
-                assert allowed is False
-            else:
-                assert allowed is True
+        state = self.cb.state
+        allowed = self.cb.allow_request()
+
+        if state == CircuitState.OPEN:
+            assert allowed is False
+        else:
+            assert allowed is True
 
 
 TestCircuitBreakerStateful = CircuitBreakerStateMachine.TestCase
+# A three-state machine needs far less than the default stateful budget
+TestCircuitBreakerStateful.settings = settings(
+    max_examples=30,
+    stateful_step_count=25,
+    phases=(Phase.generate,),
+    deadline=None,
+)
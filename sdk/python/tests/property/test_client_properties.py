@@ -5,13 +5,24 @@ Property-based tests for client module.
 **Validates: Requirements 12.3, 12.5**
 """
 
+import asyncio
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import Phase, given, settings, strategies as st
 
+from auth_platform_sdk.async_client import AsyncAuthPlatformClient
+from auth_platform_sdk.client import AuthPlatformClient
 from auth_platform_sdk.config import AuthPlatformConfig
 
+from .strategies import client_id_strategy
+
+
+# Context manager behaviour has no input-dependent branches, so a few
+# generated examples are enough and there is nothing worth shrinking
+CONTEXT_MANAGER_SETTINGS = settings(max_examples=5, phases=(Phase.generate,), deadline=None)
 
 # Strategy for valid base URLs
 valid_base_url = st.sampled_from([
@@ -20,20 +31,15 @@ valid_base_url = st.sampled_from([
     "https://identity.company.org",
 ])
 
-# Strategy for valid client IDs
-valid_client_id = st.text(min_size=1, max_size=50).filter(
-    lambda x: len(x.strip()) > 0
-)
-
 
 class TestClientContextManagerProperties:
     """Property tests for client context manager."""
 
     @given(
         base_url=valid_base_url,
-        client_id=valid_client_id,
+        client_id=client_id_strategy,
     )
-    @settings(max_examples=50)
+    @CONTEXT_MANAGER_SETTINGS
     def test_sync_client_context_manager_closes_connection(
         self,
         base_url: str,
@@ -44,15 +50,13 @@ class TestClientContextManagerProperties:
         For any AuthPlatformClient, using the context manager protocol
         SHALL properly close HTTP connections on exit.
         """
-        from auth_platform_sdk.client import AuthPlatformClient
-
         config = AuthPlatformConfig(
             base_url=base_url,
             client_id=client_id,
         )
 
         with patch("auth_platform_sdk.client.create_http_client") as mock_create:
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=httpx.Client)
             mock_create.return_value = mock_client
 
             with AuthPlatformClient(config) as client:
@@ -63,9 +67,9 @@ class TestClientContextManagerProperties:
 
     @given(
         base_url=valid_base_url,
-        client_id=valid_client_id,
+        client_id=client_id_strategy,
     )
-    @settings(max_examples=50)
+    @CONTEXT_MANAGER_SETTINGS
     def test_sync_client_closes_on_exception(
         self,
         base_url: str,
@@ -75,15 +79,13 @@ class TestClientContextManagerProperties:
         Property 14: Client Context Manager
         Client SHALL close connections even when exception occurs.
         """
-        from auth_platform_sdk.client import AuthPlatformClient
-
         config = AuthPlatformConfig(
             base_url=base_url,
             client_id=client_id,
         )
 
         with patch("auth_platform_sdk.client.create_http_client") as mock_create:
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=httpx.Client)
             mock_create.return_value = mock_client
 
             with pytest.raises(ValueError):
@@ -95,9 +97,9 @@ class TestClientContextManagerProperties:
 
     @given(
         base_url=valid_base_url,
-        client_id=valid_client_id,
+        client_id=client_id_strategy,
     )
-    @settings(max_examples=50)
+    @CONTEXT_MANAGER_SETTINGS
     def test_sync_client_explicit_close(
         self,
         base_url: str,
@@ -107,15 +109,13 @@ class TestClientContextManagerProperties:
         Property 14: Client Context Manager
         Client SHALL support explicit close() method.
         """
-        from auth_platform_sdk.client import AuthPlatformClient
-
         config = AuthPlatformConfig(
             base_url=base_url,
             client_id=client_id,
         )
 
         with patch("auth_platform_sdk.client.create_http_client") as mock_create:
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=httpx.Client)
             mock_create.return_value = mock_client
 
             client = AuthPlatformClient(config)
@@ -124,16 +124,25 @@ class TestClientContextManagerProperties:
             mock_client.close.assert_called_once()
 
 
+@pytest.fixture(scope="class")
+def shared_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Provide one event loop for every example in a test class."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 class TestAsyncClientContextManagerProperties:
     """Property tests for async client context manager."""
 
     @given(
         base_url=valid_base_url,
-        client_id=valid_client_id,
+        client_id=client_id_strategy,
     )
-    @settings(max_examples=50)
+    @CONTEXT_MANAGER_SETTINGS
     def test_async_client_context_manager_closes_connection(
         self,
+        shared_loop: asyncio.AbstractEventLoop,
         base_url: str,
         client_id: str,
     ) -> None:
@@ -142,10 +151,6 @@ class TestAsyncClientContextManagerProperties:
         For any AsyncAuthPlatformClient, using async context manager
         SHALL properly close HTTP connections on exit.
         """
-        import asyncio
-
-        from auth_platform_sdk.async_client import AsyncAuthPlatformClient
-
         config = AuthPlatformConfig(
             base_url=base_url,
             client_id=client_id,
@@ -155,25 +160,25 @@ class TestAsyncClientContextManagerProperties:
             with patch(
                 "auth_platform_sdk.async_client.create_async_http_client"
             ) as mock_create:
-                mock_client = MagicMock()
-                mock_client.aclose = MagicMock(return_value=asyncio.Future())
-                mock_client.aclose.return_value.set_result(None)
+                # spec makes aclose an AsyncMock, as httpx defines it async
+                mock_client = MagicMock(spec=httpx.AsyncClient)
                 mock_create.return_value = mock_client
 
                 async with AsyncAuthPlatformClient(config) as client:
                     assert client is not None
 
-                mock_client.aclose.assert_called_once()
+                mock_client.aclose.assert_awaited_once()
 
-        asyncio.run(test_context_manager())
+        shared_loop.run_until_complete(test_context_manager())
 
     @given(
         base_url=valid_base_url,
-        client_id=valid_client_id,
+        client_id=client_id_strategy,
     )
-    @settings(max_examples=50)
+    @CONTEXT_MANAGER_SETTINGS
     def test_async_client_closes_on_exception(
         self,
+        shared_loop: asyncio.AbstractEventLoop,
         base_url: str,
         client_id: str,
     ) -> None:
@@ -181,10 +186,6 @@ class TestAsyncClientContextManagerProperties:
         Property 14: Client Context Manager
         Async client SHALL close connections even when exception occurs.
         """
-        import asyncio
-
-        from auth_platform_sdk.async_client import AsyncAuthPlatformClient
-
         config = AuthPlatformConfig(
             base_url=base_url,
             client_id=client_id,
@@ -194,15 +195,14 @@ class TestAsyncClientContextManagerProperties:
             with patch(
                 "auth_platform_sdk.async_client.create_async_http_client"
             ) as mock_create:
-                mock_client = MagicMock()
-                mock_client.aclose = MagicMock(return_value=asyncio.Future())
-                mock_client.aclose.return_value.set_result(None)
+                # spec makes aclose an AsyncMock, as httpx defines it async
+                mock_client = MagicMock(spec=httpx.AsyncClient)
                 mock_create.return_value = mock_client
 
                 with pytest.raises(ValueError):
                     async with AsyncAuthPlatformClient(config):
                         raise ValueError("Test exception")
 
-                mock_client.aclose.assert_called_once()
+                mock_client.aclose.assert_awaited_once()
 
-        asyncio.run(test_exception_handling())
+        shared_loop.run_until_complete(test_exception_handling())
@@ -20,6 +20,10 @@ from auth_platform_sdk.config import (
 )
 
 
+# Registered in tests/conftest.py
+INVARIANT_SETTINGS = settings.get_profile("invariant")
+
+
 # Strategy for valid base URLs
 valid_base_url = st.sampled_from([
     "https://auth.example.com",
@@ -39,7 +43,7 @@ class TestConfigurationImmutabilityProperties:
         base_url=valid_base_url,
         client_id=valid_client_id,
     )
-    @settings(max_examples=100)
+    @INVARIANT_SETTINGS
     def test_config_is_frozen(
         self,
         base_url: str,
@@ -62,7 +66,7 @@ class TestConfigurationImmutabilityProperties:
         max_retries=st.integers(min_value=0, max_value=10),
         initial_delay=st.floats(min_value=0.1, max_value=60.0),
     )
-    @settings(max_examples=100)
+    @INVARIANT_SETTINGS
     def test_retry_config_is_frozen(
         self,
         max_retries: int,
@@ -80,8 +84,7 @@ class TestConfigurationImmutabilityProperties:
         with pytest.raises(PydanticValidationError):
             config.max_retries = 5
 
-    @given(enabled=st.booleans())
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("enabled", [True, False])
     def test_telemetry_config_is_frozen(self, enabled: bool) -> None:
         """
         Property 11: Configuration Immutability
@@ -92,8 +95,7 @@ class TestConfigurationImmutabilityProperties:
         with pytest.raises(PydanticValidationError):
             config.enabled = not enabled
 
-    @given(enabled=st.booleans())
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("enabled", [True, False])
     def test_dpop_config_is_frozen(self, enabled: bool) -> None:
         """
         Property 11: Configuration Immutability
@@ -105,7 +107,7 @@ class TestConfigurationImmutabilityProperties:
             config.enabled = not enabled
 
     @given(jwks_ttl=st.integers(min_value=1, max_value=86400))
-    @settings(max_examples=100)
+    @INVARIANT_SETTINGS
     def test_cache_config_is_frozen(self, jwks_ttl: int) -> None:
         """
         Property 11: Configuration Immutability
@@ -11,6 +11,7 @@ import base64
 import hashlib
 
 import jwt
+import pytest
 from hypothesis import given, settings, strategies as st
 
 from auth_platform_sdk.dpop import DPoPKeyPair, verify_dpop_proof
@@ -27,8 +28,9 @@ uri_strategy = st.sampled_from([
     "https://auth.test.local:8443/api/v1/users",
 ])
 
-# Strategy for supported algorithms
-algorithm_strategy = st.sampled_from(["ES256", "ES384", "ES512"])
+# Supported algorithms, enumerated directly where they are the only input
+SUPPORTED_ALGORITHMS = ["ES256", "ES384", "ES512"]
+algorithm_strategy = st.sampled_from(SUPPORTED_ALGORITHMS)
 
 # Strategy for optional nonce
 nonce_strategy = st.one_of(
@@ -53,6 +55,7 @@ class TestDPoPProofStructureProperties:
     @settings(max_examples=100)
     def test_proof_has_correct_header_type(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         http_method: str,
         http_uri: str,
     ) -> None:
@@ -60,7 +63,7 @@ class TestDPoPProofStructureProperties:
         Property 5: DPoP Proof Structure
         Proof header SHALL have typ: "dpop+jwt".
         """
-        key_pair = DPoPKeyPair()
+        key_pair = dpop_keypairs["ES256"]
         proof = key_pair.create_proof(http_method, http_uri)
 
         header = jwt.get_unverified_header(proof.proof)
@@ -74,6 +77,7 @@ class TestDPoPProofStructureProperties:
     @settings(max_examples=100)
     def test_proof_has_correct_algorithm(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         http_method: str,
         http_uri: str,
         algorithm: str,
@@ -82,7 +86,7 @@ class TestDPoPProofStructureProperties:
         Property 5: DPoP Proof Structure
         Proof header SHALL have correct alg claim.
         """
-        key_pair = DPoPKeyPair(algorithm=algorithm)
+        key_pair = dpop_keypairs[algorithm]
         proof = key_pair.create_proof(http_method, http_uri)
 
         header = jwt.get_unverified_header(proof.proof)
@@ -95,6 +99,7 @@ class TestDPoPProofStructureProperties:
     @settings(max_examples=100)
     def test_proof_has_jwk_in_header(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         http_method: str,
         http_uri: str,
     ) -> None:
@@ -102,7 +107,7 @@ class TestDPoPProofStructureProperties:
         Property 5: DPoP Proof Structure
         Proof header SHALL contain jwk claim.
         """
-        key_pair = DPoPKeyPair()
+        key_pair = dpop_keypairs["ES256"]
         proof = key_pair.create_proof(http_method, http_uri)
 
         header = jwt.get_unverified_header(proof.proof)
@@ -116,6 +121,7 @@ class TestDPoPProofStructureProperties:
     @settings(max_examples=100)
     def test_proof_has_required_payload_claims(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         http_method: str,
         http_uri: str,
     ) -> None:
@@ -123,7 +129,7 @@ class TestDPoPProofStructureProperties:
         Property 5: DPoP Proof Structure
         Proof payload SHALL have jti, htm, htu, and iat claims.
         """
-        key_pair = DPoPKeyPair()
+        key_pair = dpop_keypairs["ES256"]
         proof = key_pair.create_proof(http_method, http_uri)
 
         payload = jwt.decode(proof.proof, options={"verify_signature": False})
@@ -142,6 +148,7 @@ class TestDPoPProofStructureProperties:
     @settings(max_examples=100)
     def test_proof_includes_ath_when_token_provided(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         http_method: str,
         http_uri: str,
         access_token: str,
@@ -150,7 +157,7 @@ class TestDPoPProofStructureProperties:
         Property 5: DPoP Proof Structure
         Proof SHALL include ath claim when access_token is provided.
         """
-        key_pair = DPoPKeyPair()
+        key_pair = dpop_keypairs["ES256"]
         proof = key_pair.create_proof(
             http_method,
             http_uri,
@@ -174,6 +181,7 @@ class TestDPoPProofStructureProperties:
     @settings(max_examples=100)
     def test_proof_includes_nonce_when_provided(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         http_method: str,
         http_uri: str,
         nonce: str,
@@ -182,7 +190,7 @@ class TestDPoPProofStructureProperties:
         Property 5: DPoP Proof Structure
         Proof SHALL include nonce claim when nonce is provided.
         """
-        key_pair = DPoPKeyPair()
+        key_pair = dpop_keypairs["ES256"]
         proof = key_pair.create_proof(
             http_method,
             http_uri,
@@ -198,15 +206,18 @@ class TestDPoPProofStructureProperties:
 class TestDPoPThumbprintDeterminismProperties:
     """Property tests for DPoP thumbprint determinism."""
 
-    @given(algorithm=algorithm_strategy)
-    @settings(max_examples=100)
-    def test_thumbprint_is_deterministic(self, algorithm: str) -> None:
+    @pytest.mark.parametrize("algorithm", SUPPORTED_ALGORITHMS)
+    def test_thumbprint_is_deterministic(
+        self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
+        algorithm: str,
+    ) -> None:
         """
         Property 6: DPoP Thumbprint Determinism
         For any DPoPKeyPair, multiple calls to thumbprint property
         SHALL return the same value.
         """
-        key_pair = DPoPKeyPair(algorithm=algorithm)
+        key_pair = dpop_keypairs[algorithm]
 
         thumbprint1 = key_pair.thumbprint
         thumbprint2 = key_pair.thumbprint
@@ -214,14 +225,17 @@ class TestDPoPThumbprintDeterminismProperties:
 
         assert thumbprint1 == thumbprint2 == thumbprint3
 
-    @given(algorithm=algorithm_strategy)
-    @settings(max_examples=100)
-    def test_proof_thumbprint_matches_keypair(self, algorithm: str) -> None:
+    @pytest.mark.parametrize("algorithm", SUPPORTED_ALGORITHMS)
+    def test_proof_thumbprint_matches_keypair(
+        self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
+        algorithm: str,
+    ) -> None:
         """
         Property 6: DPoP Thumbprint Determinism
         Proof thumbprint SHALL match key pair thumbprint.
         """
-        key_pair = DPoPKeyPair(algorithm=algorithm)
+        key_pair = dpop_keypairs[algorithm]
         proof = key_pair.create_proof("POST", "https://auth.example.com/token")
 
         assert proof.thumbprint == key_pair.thumbprint
@@ -234,6 +248,7 @@ class TestDPoPThumbprintDeterminismProperties:
     @settings(max_examples=100)
     def test_multiple_proofs_same_thumbprint(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         algorithm: str,
         http_method: str,
         http_uri: str,
@@ -242,7 +257,7 @@ class TestDPoPThumbprintDeterminismProperties:
         Property 6: DPoP Thumbprint Determinism
         Multiple proofs from same key pair SHALL have same thumbprint.
         """
-        key_pair = DPoPKeyPair(algorithm=algorithm)
+        key_pair = dpop_keypairs[algorithm]
 
         proof1 = key_pair.create_proof(http_method, http_uri)
         proof2 = key_pair.create_proof(http_method, http_uri)
@@ -254,8 +269,7 @@ class TestDPoPThumbprintDeterminismProperties:
 class TestDPoPAlgorithmSupportProperties:
     """Property tests for DPoP algorithm support."""
 
-    @given(algorithm=algorithm_strategy)
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("algorithm", SUPPORTED_ALGORITHMS)
     def test_supported_algorithms_create_valid_keypairs(
         self,
         algorithm: str,
@@ -271,17 +285,17 @@ class TestDPoPAlgorithmSupportProperties:
         assert key_pair.thumbprint is not None
         assert len(key_pair.thumbprint) > 0
 
-    @given(algorithm=algorithm_strategy)
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("algorithm", SUPPORTED_ALGORITHMS)
     def test_supported_algorithms_produce_valid_proofs(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         algorithm: str,
     ) -> None:
         """
         Property 7: DPoP Algorithm Support
         For any supported algorithm, generated proofs SHALL be valid.
         """
-        key_pair = DPoPKeyPair(algorithm=algorithm)
+        key_pair = dpop_keypairs[algorithm]
         proof = key_pair.create_proof("POST", "https://auth.example.com/token")
 
         # Proof should be verifiable
@@ -294,10 +308,10 @@ class TestDPoPAlgorithmSupportProperties:
         assert payload["htm"] == "POST"
         assert payload["htu"] == "https://auth.example.com/token"
 
-    @given(algorithm=algorithm_strategy)
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("algorithm", SUPPORTED_ALGORITHMS)
     def test_jwk_has_correct_curve_for_algorithm(
         self,
+        dpop_keypairs: dict[str, DPoPKeyPair],
         algorithm: str,
     ) -> None:
         """
@@ -310,13 +324,12 @@ class TestDPoPAlgorithmSupportProperties:
             "ES512": "P-521",
         }
 
-        key_pair = DPoPKeyPair(algorithm=algorithm)
+        key_pair = dpop_keypairs[algorithm]
         jwk = key_pair.jwk
 
         assert jwk["crv"] == expected_curves[algorithm]
 
-    @given(algorithm=algorithm_strategy)
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("algorithm", SUPPORTED_ALGORITHMS)
     def test_exported_key_can_be_reimported(
         self,
         algorithm: str,
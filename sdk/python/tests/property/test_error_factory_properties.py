@@ -6,6 +6,8 @@ Validates: Requirements 4.1, 4.2, 4.3, 4.4, 4.5
 
 from __future__ import annotations
 
+import time
+from email.utils import formatdate
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -30,6 +32,9 @@ http_status_codes = st.sampled_from([400, 401, 403, 404, 429, 500, 502, 503, 504
 error_messages = st.text(min_size=1, max_size=100, alphabet=st.characters(whitelist_categories=("L", "N", "P", "S")))
 correlation_ids = st.uuids().map(str)
 
+# Registered in tests/conftest.py
+INVARIANT_SETTINGS = settings.get_profile("invariant")
+
 
 def create_mock_response(status_code: int, body: dict[str, Any] | None = None) -> MagicMock:
     """Create a mock HTTP response."""
@@ -67,8 +72,7 @@ class TestErrorFactoryProperties:
         assert error.code is not None
         assert error.message is not None
 
-    @given(status_code=st.integers(min_value=500, max_value=599))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("status_code", [500, 502, 503, 504, 599])
     def test_server_errors_produce_server_error_type(self, status_code: int) -> None:
         """Property 6: Server errors (5xx) produce ServerError type.
         
@@ -98,8 +102,19 @@ class TestErrorFactoryProperties:
         assert isinstance(error, RateLimitError)
         assert error.retry_after == retry_after
 
+    def test_rate_limit_accepts_http_date_retry_after(self) -> None:
+        """Retry-After given as an HTTP-date is converted to seconds."""
+        response = create_mock_response(429)
+        response.headers = {"Retry-After": formatdate(time.time() + 120, usegmt=True)}
+
+        error = ErrorFactory.from_http_response(response)
+
+        assert isinstance(error, RateLimitError)
+        assert error.retry_after is not None
+        assert 118 <= error.retry_after <= 121
+
     @given(correlation_id=correlation_ids)
-    @settings(max_examples=100)
+    @INVARIANT_SETTINGS
     def test_correlation_id_always_present(self, correlation_id: str) -> None:
         """Property 6: Correlation IDs are always included when provided.
         
@@ -187,7 +202,7 @@ class TestErrorFactoryExceptionHandling:
         assert message in error.message
 
     @given(correlation_id=correlation_ids)
-    @settings(max_examples=100)
+    @INVARIANT_SETTINGS
     def test_exception_transformation_preserves_correlation_id(
         self,
         correlation_id: str,
@@ -8,12 +8,16 @@ Property 8: Retry Exponential Backoff
 
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
 from hypothesis import given, settings, assume
 from hypothesis import strategies as st
 
 from auth_platform_sdk.config import RetryConfig
-from auth_platform_sdk.core.http_executor import calculate_retry_delay
+from auth_platform_sdk.core.http_executor import AsyncHTTPExecutor, calculate_retry_delay
+from auth_platform_sdk.errors import NetworkError
 
 
 # Strategies for generating test data
@@ -311,3 +315,22 @@ class TestDelayDistribution:
         
         # All delays should be identical
         assert len(set(delays)) == 1
+
+
+class TestAsyncExecutorShutdown:
+    """Tests for cancelling async retry backoff."""
+
+    async def test_close_aborts_pending_backoff(self) -> None:
+        """Property: close() ends a retry wait immediately with NetworkError."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"Retry-After": "30"})
+        )
+        async with httpx.AsyncClient(transport=transport, base_url="https://auth.test") as client:
+            executor = AsyncHTTPExecutor(client, RetryConfig())
+            task = asyncio.create_task(executor.execute("GET", "/oauth/token"))
+            await asyncio.sleep(0.01)
+
+            executor.close()
+
+            with pytest.raises(NetworkError, match="shutting down"):
+                await asyncio.wait_for(task, timeout=1.0)
@@ -5,9 +5,24 @@ Property-based tests for HTTP module.
 **Validates: Requirements 2.3**
 """
 
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import httpx
+import pytest
 from hypothesis import given, settings, strategies as st
 
 from auth_platform_sdk.config import RetryConfig
+from auth_platform_sdk.errors import ServerError
+from auth_platform_sdk.http import (
+    CircuitBreaker,
+    CircuitState,
+    async_request_with_retry,
+    parse_retry_after,
+    request_with_retry,
+)
 
 
 class TestRetryExponentialBackoffProperties:
@@ -205,3 +220,109 @@ class TestRetryExponentialBackoffProperties:
 
         # All should be identical
         assert all(d == delays[0] for d in delays), "Zero jitter should be deterministic"
+
+
+class TestRetryAfterParsingProperties:
+    """Property tests for Retry-After header parsing."""
+
+    @given(seconds=st.integers(min_value=0, max_value=10**6))
+    @settings(max_examples=100)
+    def test_delta_seconds_round_trip(self, seconds: int) -> None:
+        """
+        Retry-After delta-seconds SHALL parse to the same integer.
+        """
+        assert parse_retry_after(str(seconds)) == seconds
+
+    @given(value=st.text(max_size=20).filter(lambda v: not v.strip().isdigit()))
+    @settings(max_examples=100)
+    def test_garbage_is_ignored(self, value: str) -> None:
+        """
+        Unparseable Retry-After values SHALL yield None, never raise.
+        """
+        assert parse_retry_after(value) is None
+
+    def test_http_date_is_converted_to_seconds(self) -> None:
+        """
+        Retry-After HTTP-date SHALL yield the remaining seconds, floored at 0.
+        """
+        future = formatdate(time.time() + 120, usegmt=True)
+        past = formatdate(time.time() - 120, usegmt=True)
+
+        assert 118 <= parse_retry_after(future) <= 121
+        assert parse_retry_after(past) == 0
+
+    @given(seconds=st.integers(min_value=0, max_value=10**6))
+    @settings(max_examples=50)
+    def test_surrounding_whitespace_is_ignored(self, seconds: int) -> None:
+        """
+        Retry-After values padded with whitespace SHALL parse like bare ones.
+        """
+        assert parse_retry_after(f" {seconds}\t") == seconds
+
+    def test_unknown_zone_http_date_is_utc(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Retry-After HTTP-dates with a "-0000" zone SHALL be read as UTC,
+        whatever the local timezone.
+        """
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            # formatdate() writes UTC with the "-0000" zone by default
+            seconds = parse_retry_after(formatdate(time.time() + 120))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert seconds is not None
+        assert 118 <= seconds <= 121
+
+
+class TestRequestWithRetryDriverProperties:
+    """Sync and async retry helpers share one retry state machine."""
+
+    @staticmethod
+    def _transport(statuses: list[int]) -> tuple[httpx.MockTransport, list[int]]:
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return httpx.Response(statuses[len(calls) - 1], headers={"Retry-After": "0"})
+
+        return httpx.MockTransport(handler), calls
+
+    @given(rate_limited=st.integers(min_value=0, max_value=3))
+    @settings(max_examples=10)
+    def test_sync_and_async_agree(self, rate_limited: int) -> None:
+        """Both helpers retry 429s and stop on the first 5xx."""
+        statuses = [429] * rate_limited + [503, 200]
+        config = RetryConfig(max_retries=5, initial_delay=0.01)
+
+        # One failure short of opening once every attempt has failed
+        threshold = rate_limited + 2
+
+        sync_transport, sync_calls = self._transport(statuses)
+        sync_breaker = CircuitBreaker(failure_threshold=threshold)
+        with patch.object(time, "sleep"), httpx.Client(transport=sync_transport) as client:
+            with pytest.raises(ServerError):
+                request_with_retry(
+                    client, "GET", "https://api.example.com", config, circuit_breaker=sync_breaker
+                )
+
+        async_transport, async_calls = self._transport(statuses)
+        async_breaker = CircuitBreaker(failure_threshold=threshold)
+
+        async def run() -> None:
+            async with httpx.AsyncClient(transport=async_transport) as client:
+                await async_request_with_retry(
+                    client, "GET", "https://api.example.com", config, circuit_breaker=async_breaker
+                )
+
+        with pytest.raises(ServerError):
+            asyncio.run(run())
+
+        assert len(sync_calls) == len(async_calls) == rate_limited + 1
+        # Every attempt counted as a failure: still closed, one more opens it
+        for breaker in (sync_breaker, async_breaker):
+            assert breaker.state == CircuitState.CLOSED
+            breaker.record_failure()
+            assert not breaker.allow_request()
@@ -13,6 +13,7 @@ import pytest
 from hypothesis import given, settings, strategies as st, assume
 
 from auth_platform_sdk.core.jwks_base import JWKSCacheBase
+from auth_platform_sdk.errors import ValidationError
 from auth_platform_sdk.models import JWK, JWKS
 
 
@@ -97,7 +98,7 @@ class TestJWKSCacheRefreshLogic:
         
         # Simulate time passing just past the threshold
         threshold = ttl - refresh_ahead
-        with patch.object(time, "time", return_value=cache._cache_time + threshold + 1):
+        with patch.object(time, "monotonic", return_value=cache._cache_time + threshold + 1):
             assert cache.should_refresh() is True
             # But not yet expired
             assert cache.is_expired() is False
@@ -118,7 +119,7 @@ class TestJWKSCacheRefreshLogic:
         cache.update_cache(create_test_jwks())
         
         # Simulate time passing past TTL
-        with patch.object(time, "time", return_value=cache._cache_time + ttl + 1):
+        with patch.object(time, "monotonic", return_value=cache._cache_time + ttl + 1):
             assert cache.is_expired() is True
             assert cache.should_refresh() is True
 
@@ -230,7 +231,7 @@ class TestJWKSCacheTimingCalculations:
         )
         cache.update_cache(create_test_jwks())
         
-        with patch.object(time, "time", return_value=cache._cache_time + elapsed):
+        with patch.object(time, "monotonic", return_value=cache._cache_time + elapsed):
             time_until = cache.time_until_refresh()
             threshold = ttl - refresh_ahead
             expected = max(0, threshold - elapsed)
@@ -254,8 +255,78 @@ class TestJWKSCacheTimingCalculations:
         )
         cache.update_cache(create_test_jwks())
         
-        with patch.object(time, "time", return_value=cache._cache_time + elapsed):
+        with patch.object(time, "monotonic", return_value=cache._cache_time + elapsed):
             time_until = cache.time_until_expiry()
             expected = max(0, ttl - elapsed)
             
             assert abs(time_until - expected) < 0.01  # Allow small float error
+
+
+class TestJWKSCacheUpdateFromBytes:
+    """Property tests for raw-body cache updates."""
+
+    def test_update_from_bytes_populates_cache(self) -> None:
+        """Property 10: Raw JWKS body populates key lookup.
+        
+        Feature: python-sdk-state-of-art-2025, Property 10: JWKS Cache Refresh Logic
+        Validates: Requirements 3.1, 3.3
+        """
+        cache = JWKSCacheBase("https://example.com/.well-known/jwks.json")
+        cache.update_from_bytes(
+            b'{"keys": [{"kty": "EC", "kid": "key-1", "use": "sig", "crv": "P-256"}]}'
+        )
+        
+        key = cache.get_key("key-1")
+        assert key is not None
+        assert key.kty == "EC"
+        assert cache.is_cached is True
+
+    def test_identical_body_skips_reparse(self) -> None:
+        """Property 10: Unchanged body only bumps the cache time.
+        
+        Feature: python-sdk-state-of-art-2025, Property 10: JWKS Cache Refresh Logic
+        Validates: Requirements 3.2
+        """
+        body = b'{"keys": [{"kty": "RSA", "kid": "key-2", "n": "test", "e": "AQAB"}]}'
+        cache = JWKSCacheBase("https://example.com/.well-known/jwks.json")
+        cache.update_from_bytes(body)
+        first = cache.cached_jwks
+        
+        with patch.object(time, "monotonic", return_value=cache._cache_time + 10):
+            cache.update_from_bytes(body)
+            assert cache.cached_jwks is first
+            assert cache.time_until_expiry() == cache.ttl_seconds
+        
+        cache.update_from_bytes(b'{"keys": []}')
+        assert cache.cached_jwks is not first
+        assert cache.get_key("key-2") is None
+
+    def test_update_cache_forgets_body_digest(self) -> None:
+        """Property 10: A body seen before an external update is parsed again.
+        
+        Feature: python-sdk-state-of-art-2025, Property 10: JWKS Cache Refresh Logic
+        Validates: Requirements 3.2
+        """
+        body = b'{"keys": [{"kty": "EC", "kid": "key-9", "crv": "P-256"}]}'
+        cache = JWKSCacheBase("https://example.com/.well-known/jwks.json")
+        cache.update_from_bytes(body)
+        cache.update_cache(create_test_jwks())
+        
+        cache.update_from_bytes(body)
+        assert cache.get_key("key-9") is not None
+
+    @pytest.mark.parametrize(
+        "body",
+        [b"not json", b"[]", b'{"keys": {}}', b'{"keys": ["key"]}', b'{"keys": [null]}'],
+    )
+    def test_malformed_body_raises_validation_error(self, body: bytes) -> None:
+        """Property 10: Bodies that are not a key set raise ValidationError.
+        
+        Feature: python-sdk-state-of-art-2025, Property 10: JWKS Cache Refresh Logic
+        Validates: Requirements 3.1
+        """
+        cache = JWKSCacheBase("https://example.com/.well-known/jwks.json")
+        
+        with pytest.raises(ValidationError, match="Failed to parse JWKS"):
+            cache.update_from_bytes(body)
+        assert cache.cached_jwks is None
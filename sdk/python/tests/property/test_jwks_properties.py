@@ -6,13 +6,23 @@ Property-based tests for JWKS caching.
 **Validates: Requirements 6.1, 6.2, 6.3**
 """
 
+import asyncio
 import threading
 import time
+from typing import Any
 from unittest.mock import MagicMock
 
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
 from hypothesis import given, settings, strategies as st
 
-from auth_platform_sdk.jwks import JWKSCache
+from auth_platform_sdk.core import SharedJWKSFile
+from auth_platform_sdk.core.jwks_state import parse_key_set
+from auth_platform_sdk.errors import ValidationError
+from auth_platform_sdk.jwks import AsyncJWKSCache, JWKSCache
+from auth_platform_sdk.models import JWK, JWKS
 
 
 class TestJWKSCacheTTLProperties:
@@ -192,6 +202,759 @@ class TestJWKSCacheThreadSafetyProperties:
         assert len(errors) == 0
         assert len(results) == 10
 
+    def test_warm_cache_lookup_does_not_wait_for_lock(self) -> None:
+        """
+        Property 4: JWKS Cache Thread Safety
+        Lookups on a warm cache SHALL NOT block behind a lock holder.
+        """
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        cache._cache_time = time.time()
+        cache._jwk_client = MagicMock()
+        cache._jwks = MagicMock()
+        cache._jwks.get_key.return_value = "key"
+
+        results: list[object] = []
+        with cache._lock:
+            reader = threading.Thread(target=lambda: results.append(cache.get_key_by_id("kid")))
+            reader.start()
+            reader.join(timeout=5)
+
+        assert results == ["key"]
+
+    def test_concurrent_stale_lookups_refresh_once(self) -> None:
+        """
+        Property 4: JWKS Cache Thread Safety
+        Threads that find the cache stale together SHALL trigger one fetch.
+        """
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        calls: list[int] = []
+        all_stale: list[bool] = []
+        checked = threading.Semaphore(0)
+        should_refresh = cache._should_refresh
+
+        def counting_should_refresh() -> bool:
+            stale = should_refresh()
+            checked.release()
+            return stale
+
+        def fake_refresh() -> None:
+            calls.append(1)
+            # Finish only after every thread has seen the cache stale: one
+            # check per waiting thread plus the leader's re-check under the lock
+            all_stale.append(all(checked.acquire(timeout=5) for _ in range(len(threads) + 1)))
+            cache._jwk_client = MagicMock()
+            cache._jwks = MagicMock()
+            cache._cache_time = time.time()
+
+        cache._should_refresh = counting_should_refresh  # type: ignore[method-assign]
+        cache._refresh = fake_refresh  # type: ignore[method-assign]
+        threads = [threading.Thread(target=cache.get_key_by_id, args=("kid",)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all_stale == [True]
+        cache.close()
+
+    def test_async_concurrent_stale_lookups_share_one_fetch(self) -> None:
+        """
+        Property 4: JWKS Cache Thread Safety
+        Coroutines that find the async cache stale SHALL await one fetch.
+        """
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        calls: list[int] = []
+
+        async def fake_refresh() -> None:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            cache._jwks = MagicMock()
+            cache._jwks.get_signing_keys.return_value = ["key"]
+            cache._cache_time = time.time()
+
+        cache._refresh = fake_refresh  # type: ignore[method-assign]
+
+        async def run() -> list[list[str]]:
+            return await asyncio.gather(*(cache.get_all_signing_keys() for _ in range(8)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == [["key"]] * 8
+        assert cache._refreshing is None
+
+
+class TestJWKSCacheConnectionReuseProperties:
+    """Tests for the pooled JWKS HTTP client."""
+
+    def test_refreshes_reuse_one_client(self) -> None:
+        """
+        Property: Successive refreshes SHALL share one pooled HTTP client.
+        """
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"keys": []})
+
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        cache._http = client
+
+        cache._refresh()
+        cache._refresh()
+
+        assert len(requests) == 2
+        assert cache._http_client() is client
+
+        cache.close()
+        assert cache._http is None
+        assert client.is_closed
+
+    def test_async_refreshes_reuse_one_client(self) -> None:
+        """
+        Property: Successive async refreshes SHALL share one pooled HTTP client.
+        """
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"keys": []})
+
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache._http = client
+
+        async def run() -> None:
+            await cache._refresh()
+            await cache._refresh()
+            assert cache._http_client() is client
+            await cache.close()
+
+        asyncio.run(run())
+
+        assert len(requests) == 2
+        assert client.is_closed
+
+    def test_refresh_after_close_uses_one_shot_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Property: Refreshes after close SHALL NOT reopen the pooled HTTP client.
+        """
+        seen: list[httpx.Client | httpx.AsyncClient] = []
+
+        def get(client: httpx.Client, url: str, **_kwargs: Any) -> httpx.Response:
+            seen.append(client)
+            return httpx.Response(200, json={"keys": []}, request=httpx.Request("GET", url))
+
+        async def aget(client: httpx.AsyncClient, url: str, **_kwargs: Any) -> httpx.Response:
+            seen.append(client)
+            return httpx.Response(200, json={"keys": []}, request=httpx.Request("GET", url))
+
+        monkeypatch.setattr(httpx.Client, "get", get)
+        monkeypatch.setattr(httpx.AsyncClient, "get", aget)
+        uri = "https://auth.example.com/.well-known/jwks.json"
+
+        cache = JWKSCache(uri)
+        cache.close()
+        cache._refresh()
+
+        async_cache = AsyncJWKSCache(uri)
+
+        async def run() -> None:
+            await async_cache.close()
+            await async_cache._refresh()
+
+        asyncio.run(run())
+
+        assert cache._http is None
+        assert async_cache._http is None
+        assert len(seen) == 2
+        assert all(client.is_closed for client in seen)
+
+
+class TestJWKSCacheRevalidationProperties:
+    """Tests for conditional JWKS refreshes."""
+
+    def test_not_modified_keeps_parsed_keys(self) -> None:
+        """
+        Property: A 304 revalidation SHALL keep the cached key set and restart the TTL.
+        """
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"keys": []}, headers={"ETag": '"v1"'})
+
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        cache._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+        cache._refresh()
+        jwks, jwk_client = cache._jwks, cache._jwk_client
+        cache._cache_time = 0
+        cache._refresh()
+
+        assert "if-none-match" not in seen[0].headers
+        assert seen[1].headers["if-none-match"] == '"v1"'
+        assert cache._jwks is jwks
+        assert cache._jwk_client is jwk_client
+        assert cache._cache_time > 0
+        cache.close()
+
+    @pytest.mark.parametrize("max_age", [None, 30, 7200])
+    def test_not_modified_applies_new_max_age(self, max_age: int | None) -> None:
+        """
+        Property: A 304 carrying max-age SHALL recompute the effective TTL.
+        """
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match") == '"v1"':
+                headers = {} if max_age is None else {"Cache-Control": f"max-age={max_age}"}
+                return httpx.Response(304, headers=headers)
+            return httpx.Response(
+                200,
+                json={"keys": []},
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=600"},
+            )
+
+        expected = 600 if max_age is None else max(60, max_age)
+        uri = "https://auth.example.com/.well-known/jwks.json"
+
+        cache = JWKSCache(uri, ttl_seconds=60)
+        cache._http = httpx.Client(transport=httpx.MockTransport(handler))
+        cache._refresh()
+        cache._cache_time = 0
+        cache._refresh()
+        cache.close()
+
+        async_cache = AsyncJWKSCache(uri, ttl_seconds=60)
+        async_cache._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def run() -> None:
+            await async_cache._refresh()
+            async_cache._cache_time = 0
+            await async_cache._refresh()
+            await async_cache.close()
+
+        asyncio.run(run())
+
+        assert cache._effective_ttl == expected
+        assert async_cache._effective_ttl == expected
+
+    @given(
+        ttl=st.integers(min_value=60, max_value=3600),
+        max_age=st.integers(min_value=0, max_value=7200),
+    )
+    @settings(max_examples=50)
+    def test_max_age_extends_ttl(self, ttl: int, max_age: int) -> None:
+        """
+        Property: The effective TTL SHALL be max(ttl, Cache-Control max-age).
+        """
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json", ttl_seconds=ttl)
+        cache._http = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    json={"keys": []},
+                    headers={"Cache-Control": f"public, max-age={max_age}"},
+                )
+            )
+        )
+
+        async def run() -> None:
+            await cache._refresh()
+            await cache.close()
+
+        asyncio.run(run())
+
+        assert cache._effective_ttl == max(ttl, max_age)
+
+
+class TestJWKSCacheStaleOnErrorProperties:
+    """Tests for serving cached keys through JWKS endpoint outages."""
+
+    @staticmethod
+    def _failing_cache(age: float) -> tuple[JWKSCache, list[httpx.Request]]:
+        fetches: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            fetches.append(request)
+            return httpx.Response(503)
+
+        cache = JWKSCache(
+            "https://auth.example.com/.well-known/jwks.json",
+            ttl_seconds=3600,
+            max_stale_seconds=900,
+        )
+        cache._http = httpx.Client(transport=httpx.MockTransport(handler))
+        cache._closed.set()
+        cache._jwk_client = MagicMock()
+        cache._jwks = MagicMock()
+        cache._jwks.get_key.return_value = "key"
+        cache._cache_time = time.time() - age
+        return cache, fetches
+
+    @given(overdue=st.integers(min_value=1, max_value=800))
+    @settings(max_examples=20)
+    def test_serves_stale_keys_within_window(self, overdue: int) -> None:
+        """
+        Property: Within ttl + max_stale a failed fetch SHALL keep serving cached keys.
+        """
+        cache, fetches = self._failing_cache(3600 + overdue)
+
+        assert cache.get_key_by_id("kid") == "key"
+        assert cache.get_key_by_id("kid") == "key"
+        # The failed fetch is not retried on every lookup
+        assert len(fetches) == 1
+
+    def test_fails_closed_beyond_window(self) -> None:
+        """
+        Property: Past ttl + max_stale a failed fetch SHALL raise.
+        """
+        cache, _ = self._failing_cache(3600 + 900 + 1)
+
+        with pytest.raises(ValidationError, match="Failed to fetch JWKS"):
+            cache.get_key_by_id("kid")
+
+    def test_unknown_kids_do_not_refetch_while_serving_stale(self) -> None:
+        """
+        Property: During an outage unknown kids SHALL NOT trigger a fetch per token.
+        """
+        cache, fetches = self._failing_cache(3600 + 100)
+        cache._jwks.get_key.return_value = None
+        tokens = [
+            jwt.encode({"sub": "user"}, "s" * 32, algorithm="HS256", headers={"kid": f"bogus-{i}"})
+            for i in range(5)
+        ]
+
+        for token in tokens:
+            with pytest.raises(ValidationError, match="not found"):
+                cache.get_signing_key(token)
+
+        async_fetches: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            async_fetches.append(request)
+            return httpx.Response(503)
+
+        async_cache = AsyncJWKSCache(
+            "https://auth.example.com/.well-known/jwks.json",
+            ttl_seconds=3600,
+            max_stale_seconds=900,
+        )
+        async_cache._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async_cache._closed = True
+        async_cache._jwks = JWKS(keys=[])
+        async_cache._cache_time = time.time() - 3700
+
+        async def run() -> None:
+            for i in range(5):
+                with pytest.raises(ValidationError, match="not found"):
+                    await async_cache.get_verification_key(f"bogus-{i}")
+            await async_cache.close()
+
+        asyncio.run(run())
+
+        assert len(fetches) == 1
+        assert len(async_fetches) == 1
+
+
+class TestJWKSCacheSharedFileProperties:
+    """Tests for sharing fetched key sets between worker processes."""
+
+    @staticmethod
+    def _worker(directory: object, fetches: list[httpx.Request]) -> JWKSCache:
+        def handler(request: httpx.Request) -> httpx.Response:
+            fetches.append(request)
+            return httpx.Response(200, json={"keys": [{"kty": "oct", "kid": "k1", "k": "c2VjcmV0"}]})
+
+        cache = JWKSCache(
+            "https://auth.example.com/.well-known/jwks.json",
+            shared_cache_dir=directory,  # type: ignore[arg-type]
+        )
+        cache._http = httpx.Client(transport=httpx.MockTransport(handler))
+        cache._closed.set()
+        return cache
+
+    def test_second_worker_adopts_shared_key_set(self, tmp_path: object) -> None:
+        """
+        Property: A fresh key set fetched by one worker SHALL serve the others.
+        """
+        fetches: list[httpx.Request] = []
+        first = self._worker(tmp_path, fetches)
+        second = self._worker(tmp_path, fetches)
+
+        assert first.get_key_by_id("k1") is not None
+        assert second.get_key_by_id("k1") is not None
+        assert len(fetches) == 1
+        assert second._cache_time == first._cache_time
+
+    def test_stale_shared_key_set_is_refetched(self, tmp_path: object) -> None:
+        """
+        Property: A shared key set inside the refresh-ahead window SHALL NOT be adopted.
+        """
+        fetches: list[httpx.Request] = []
+        SharedJWKSFile(tmp_path, "https://auth.example.com/.well-known/jwks.json").store(  # type: ignore[arg-type]
+            [{"kty": "oct", "kid": "old"}],
+            fetched_at=time.time() - 3500,
+            ttl=3600,
+            etag=None,
+            last_modified=None,
+        )
+        cache = self._worker(tmp_path, fetches)
+
+        assert cache.get_key_by_id("k1") is not None
+        assert len(fetches) == 1
+
+    def test_corrupt_shared_file_is_ignored(self, tmp_path: object) -> None:
+        """
+        Property: An unreadable shared document SHALL load as None.
+        """
+        shared = SharedJWKSFile(tmp_path, "https://auth.example.com/.well-known/jwks.json")  # type: ignore[arg-type]
+        shared.path.write_text("{not json")
+
+        assert shared.load() is None
+
+
+class TestJWKSCacheSigningKeyProperties:
+    """Tests for kid-based signing key lookup."""
+
+    @staticmethod
+    def _signed_cache(kid: str) -> tuple[JWKSCache, list[httpx.Request], str]:
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        public_jwk = jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        public_jwk["kid"] = kid
+        fetches: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            fetches.append(request)
+            return httpx.Response(200, json={"keys": [public_jwk]})
+
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        cache._http = httpx.Client(transport=httpx.MockTransport(handler))
+        cache._closed.set()  # No background thread in these tests
+        token = jwt.encode({"sub": "user"}, private_key, algorithm="ES256", headers={"kid": kid})
+        return cache, fetches, token
+
+    def test_known_kid_served_from_cache(self) -> None:
+        """
+        Property: A cached kid SHALL resolve without another fetch and reuse the prepared key.
+        """
+        cache, fetches, token = self._signed_cache("k1")
+
+        first = cache.get_signing_key(token)
+        second = cache.get_signing_key(token)
+
+        assert first is second
+        assert len(fetches) == 1
+        assert jwt.decode(token, first.key, algorithms=["ES256"])["sub"] == "user"
+
+    def test_async_verification_keys_prepared_on_refresh(self) -> None:
+        """
+        Property: Refresh SHALL prepare key objects once and skip keys PyJWT cannot load.
+        """
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        public_jwk = jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        keys = [{**public_jwk, "kid": "k1"}, {"kty": "unknown", "kid": "k2"}]
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        cache._http = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"keys": keys}))
+        )
+        token = jwt.encode({"sub": "user"}, private_key, algorithm="ES256", headers={"kid": "k1"})
+
+        async def run() -> tuple[jwt.PyJWK, jwt.PyJWK]:
+            first = await cache.get_verification_key("k1")
+            second = await cache.get_verification_key("k1")
+            with pytest.raises(ValidationError, match="not found"):
+                await cache.get_verification_key("k2")
+            await cache.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert jwt.decode(token, first.key, algorithms=["ES256"])["sub"] == "user"
+
+    def test_unvalidated_parse_matches_validated(self) -> None:
+        """
+        Property: Warm refreshes SHALL build the same key set without validation.
+        """
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        public_jwk = jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        keys = [{**public_jwk, "kid": "k1", "use": "sig"}, {"kty": "RSA", "kid": "bad"}]
+
+        validated, validated_keys = parse_key_set(keys)
+        constructed, constructed_keys = parse_key_set(keys, validate=False)
+
+        assert constructed == validated
+        assert constructed_keys.keys() == validated_keys.keys() == {"k1"}
+
+    def test_unknown_kid_refetch_is_rate_limited(self) -> None:
+        """
+        Property: An unknown kid SHALL re-fetch only when the key set is not brand new.
+        """
+        cache, fetches, _ = self._signed_cache("k1")
+        cache._refresh()
+        bogus = jwt.encode({"sub": "user"}, "s" * 32, algorithm="HS256", headers={"kid": "nope"})
+
+        with pytest.raises(ValidationError, match="not found"):
+            cache.get_signing_key(bogus)
+        assert len(fetches) == 1
+
+        cache._refresh_attempted_at = time.time() - 60
+        with pytest.raises(ValidationError, match="not found"):
+            cache.get_signing_key(bogus)
+        assert len(fetches) == 2
+
+    def test_unloadable_kid_does_not_refetch(self) -> None:
+        """
+        Property: A kid present in the key set SHALL NOT re-fetch, even if PyJWT cannot load it.
+        """
+        keys = [{"kty": "unknown", "kid": "k2"}]
+        fetches: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            fetches.append(request)
+            return httpx.Response(200, json={"keys": keys})
+
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        cache._http = httpx.Client(transport=httpx.MockTransport(handler))
+        cache._closed.set()
+        async_cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        async_cache._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async_cache._closed = True
+        token = jwt.encode({"sub": "user"}, "s" * 32, algorithm="HS256", headers={"kid": "k2"})
+
+        cache._refresh()
+        cache._refresh_attempted_at = time.time() - 60
+        with pytest.raises(ValidationError, match="not found"):
+            cache.get_signing_key(token)
+
+        async def run() -> None:
+            await async_cache._refresh_shared()
+            async_cache._refresh_attempted_at = time.time() - 60
+            with pytest.raises(ValidationError, match="not found"):
+                await async_cache.get_verification_key("k2")
+            assert (await async_cache.get_signing_key("k2")).kid == "k2"
+            await async_cache.close()
+
+        asyncio.run(run())
+
+        assert len(fetches) == 2
+
+    def test_async_rotated_kid_lookups_share_one_fetch(self) -> None:
+        """
+        Property: Concurrent lookups of a newly rotated kid SHALL await one re-fetch.
+        """
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        public_jwk = jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        key_sets = [[{**public_jwk, "kid": "k1"}], [{**public_jwk, "kid": "k2"}]]
+        fetches: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            fetches.append(request)
+            return httpx.Response(200, json={"keys": key_sets[min(len(fetches), 2) - 1]})
+
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        cache._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache._closed = True  # No background task in this test
+
+        async def run() -> list[JWK]:
+            await cache._refresh_shared()
+            with pytest.raises(ValidationError, match="not found"):
+                await cache.get_signing_key("k2")  # Key set is brand new
+            cache._refresh_attempted_at = time.time() - 60
+            keys = await asyncio.gather(*(cache.get_signing_key("k2") for _ in range(8)))
+            await cache.close()
+            return keys
+
+        keys = asyncio.run(run())
+
+        assert len(fetches) == 2
+        assert all(key.kid == "k2" for key in keys)
+
+
+class TestJWKSCacheBackgroundRefreshProperties:
+    """Tests for refresh-ahead done off the request path."""
+
+    @given(
+        ttl=st.integers(min_value=600, max_value=3600),
+        refresh_ahead=st.integers(min_value=2, max_value=300),
+    )
+    @settings(max_examples=50)
+    def test_lookups_inside_refresh_ahead_window_do_not_fetch(
+        self, ttl: int, refresh_ahead: int
+    ) -> None:
+        """
+        Property 3: JWKS Cache TTL Behavior
+        Between (t - r) and t lookups SHALL serve cached keys, leaving the
+        refresh to the background.
+        """
+        cache = JWKSCache(
+            "https://auth.example.com/.well-known/jwks.json",
+            ttl_seconds=ttl,
+            refresh_ahead_seconds=refresh_ahead,
+        )
+        cache._cache_time = time.time() - (ttl - refresh_ahead // 2)
+        cache._jwk_client = MagicMock()
+        cache._jwks = MagicMock()
+
+        assert cache._should_refresh() is False
+        assert cache._refresh_ahead_delay() >= 0
+
+    def test_background_thread_refreshes_and_stops_on_close(self) -> None:
+        """
+        Property 3: JWKS Cache TTL Behavior
+        After the first fetch a background refresh SHALL run before expiry.
+        """
+        cache = JWKSCache(
+            "https://auth.example.com/.well-known/jwks.json",
+            ttl_seconds=3600,
+            refresh_ahead_seconds=300,
+        )
+        refreshed = threading.Event()
+        calls: list[int] = []
+
+        def fake_refresh() -> None:
+            calls.append(1)
+            cache._jwk_client = MagicMock()
+            cache._jwks = MagicMock()
+            cache._cache_time = time.time()
+            if len(calls) > 1:
+                refreshed.set()
+
+        cache._refresh = fake_refresh  # type: ignore[method-assign]
+        cache._refresh_ahead_delay = lambda: 0.01  # type: ignore[method-assign]
+        cache.get_key_by_id("kid")
+
+        assert refreshed.wait(timeout=5)
+        cache.close()
+        assert cache._refresher is not None
+        cache._refresher.join(timeout=5)
+        assert not cache._refresher.is_alive()
+
+    def test_async_background_task_cancelled_on_close(self) -> None:
+        """
+        Property 3: JWKS Cache TTL Behavior
+        The async background refresh SHALL reuse the shared fetch and stop on close.
+        """
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        calls: list[int] = []
+
+        async def fake_refresh() -> None:
+            calls.append(1)
+            cache._jwks = MagicMock()
+            cache._jwks.get_signing_keys.return_value = ["key"]
+            cache._cache_time = time.time()
+
+        cache._refresh = fake_refresh  # type: ignore[method-assign]
+        cache._refresh_ahead_delay = lambda: 0.01  # type: ignore[method-assign]
+
+        async def run() -> asyncio.Task[None] | None:
+            await cache.get_all_signing_keys()
+            refresher = cache._refresher
+            await asyncio.sleep(0.05)
+            await cache.close()
+            await asyncio.sleep(0)
+            return refresher
+
+        refresher = asyncio.run(run())
+
+        assert len(calls) > 1
+        assert refresher is not None and refresher.done()
+        assert cache._refresher is None
+
+    def test_background_thread_survives_unexpected_errors(self) -> None:
+        """
+        Property 3: JWKS Cache TTL Behavior
+        A background refresh failing with any error SHALL not stop later refreshes.
+        """
+        cache = JWKSCache("https://auth.example.com/.well-known/jwks.json")
+        refreshed = threading.Event()
+        calls: list[int] = []
+
+        def fake_refresh() -> None:
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("unexpected")
+            cache._jwk_client = MagicMock()
+            cache._jwks = MagicMock()
+            cache._cache_time = time.time()
+            if len(calls) > 2:
+                refreshed.set()
+
+        cache._refresh = fake_refresh  # type: ignore[method-assign]
+        cache._refresh_ahead_delay = lambda: 0.01  # type: ignore[method-assign]
+        cache.get_key_by_id("kid")
+
+        assert refreshed.wait(timeout=5)
+        cache.close()
+
+    def test_async_background_task_survives_unexpected_errors(self) -> None:
+        """
+        Property 3: JWKS Cache TTL Behavior
+        The async background refresh SHALL keep running after any failed refresh.
+        """
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        calls: list[int] = []
+
+        async def run() -> None:
+            refreshed = asyncio.Event()
+
+            async def fake_refresh() -> None:
+                calls.append(1)
+                if len(calls) == 2:
+                    raise RuntimeError("unexpected")
+                cache._jwks = MagicMock()
+                cache._cache_time = time.time()
+                if len(calls) > 2:
+                    refreshed.set()
+
+            cache._refresh = fake_refresh  # type: ignore[method-assign]
+            cache._refresh_ahead_delay = lambda: 0.01  # type: ignore[method-assign]
+            await cache.get_all_signing_keys()
+            await asyncio.wait_for(refreshed.wait(), timeout=5)
+            await cache.close()
+
+        asyncio.run(run())
+
+        assert len(calls) >= 3
+
+    def test_async_close_waits_for_in_flight_refresh(self) -> None:
+        """
+        Property 3: JWKS Cache TTL Behavior
+        close() SHALL let an in-flight refresh finish before releasing the pool.
+        """
+        cache = AsyncJWKSCache("https://auth.example.com/.well-known/jwks.json")
+        events: list[str] = []
+
+        async def run() -> None:
+            release = asyncio.Event()
+
+            async def fake_refresh() -> None:
+                await release.wait()
+                events.append("refreshed")
+
+            cache._refresh = fake_refresh  # type: ignore[method-assign]
+            refresh = asyncio.ensure_future(cache._refresh_shared())
+            await asyncio.sleep(0)
+            closing = asyncio.ensure_future(cache.close())
+            await asyncio.sleep(0)
+            assert not closing.done()
+
+            release.set()
+            await closing
+            events.append("closed")
+            await refresh
+
+        asyncio.run(run())
+
+        assert events == ["refreshed", "closed"]
+
     @given(
         ttl=st.integers(min_value=1, max_value=86400),
     )
@@ -18,7 +18,11 @@ from hypothesis import given, settings, assume
 from hypothesis import strategies as st
 
 from auth_platform_sdk.config import AuthPlatformConfig
-from auth_platform_sdk.core.token_validator import TokenValidator
+from auth_platform_sdk.core.token_validator import (
+    TokenValidator,
+    _header_key_id,
+    unverified_key_id,
+)
 from auth_platform_sdk.errors import TokenExpiredError, ValidationError
 from auth_platform_sdk.models import JWK
 
@@ -216,3 +220,37 @@ class TestTokenValidationConsistency:
         
         with pytest.raises(ValidationError, match="Invalid audience"):
             validator.validate(token, jwk, issuer=issuer)
+
+
+class TestUnverifiedKeyId:
+    """Property tests for cached key ID extraction."""
+
+    @given(kid=st.one_of(st.none(), st.text(min_size=1, max_size=40)))
+    @settings(max_examples=50)
+    def test_matches_pyjwt_header_decode(self, kid: str | None) -> None:
+        """Key ID extraction agrees with PyJWT's unverified header."""
+        headers = {"kid": kid} if kid is not None else None
+        token = jwt.encode({"sub": "user"}, "s" * 32, algorithm="HS256", headers=headers)
+
+        assert unverified_key_id(token) == jwt.get_unverified_header(token).get("kid")
+        # Second lookup is served from the header cache
+        assert unverified_key_id(token) == kid
+
+    @pytest.mark.parametrize("token", ["no-dots", "!!!.payload.sig", "WzFd.payload.sig"])
+    def test_malformed_header_raises_validation_error(self, token: str) -> None:
+        """Malformed headers raise ValidationError."""
+        with pytest.raises(ValidationError, match="Invalid token format"):
+            unverified_key_id(token)
+
+    def test_oversized_header_bypasses_cache(self) -> None:
+        """Headers above the cache bound are decoded but never cached."""
+        token = jwt.encode(
+            {"sub": "user"},
+            "s" * 32,
+            algorithm="HS256",
+            headers={"kid": "big-key", "pad": "x" * 2048},
+        )
+        before = _header_key_id.cache_info().currsize
+
+        assert unverified_key_id(token) == "big-key"
+        assert _header_key_id.cache_info().currsize == before
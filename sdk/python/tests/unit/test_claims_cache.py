@@ -0,0 +1,62 @@
+"""Unit tests for the validated-claims cache."""
+
+import time
+from unittest.mock import patch
+
+from auth_platform_sdk.core import ClaimsCache
+from auth_platform_sdk.models import TokenClaims
+
+
+def _claims(exp_in: float = 3600) -> TokenClaims:
+    now = int(time.time())
+    return TokenClaims(sub="user", iss="issuer", aud="client", exp=int(now + exp_in), iat=now)
+
+
+class TestClaimsCache:
+    """Tests for ClaimsCache."""
+
+    def test_hit_returns_same_instance(self) -> None:
+        """A cached token returns the stored claims object."""
+        cache = ClaimsCache()
+        claims = _claims()
+        cache.put("token", claims)
+
+        assert cache.get("token") is claims
+        assert cache.get("other") is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Entries stop being served once the TTL passes."""
+        cache = ClaimsCache(ttl_seconds=60)
+        cache.put("token", _claims())
+        now = time.time()
+
+        with patch.object(time, "time", return_value=now + 59):
+            assert cache.get("token") is not None
+        with patch.object(time, "time", return_value=now + 61):
+            assert cache.get("token") is None
+
+    def test_entries_never_outlive_token_exp(self) -> None:
+        """A token expiring inside the TTL is not served after exp."""
+        cache = ClaimsCache(ttl_seconds=60)
+        cache.put("token", _claims(exp_in=-1))
+
+        assert cache.get("token") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The oldest unused entry is evicted at capacity."""
+        cache = ClaimsCache(max_size=2)
+        cache.put("a", _claims())
+        cache.put("b", _claims())
+        cache.get("a")
+        cache.put("c", _claims())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        """A TTL of zero turns the cache off."""
+        cache = ClaimsCache(ttl_seconds=0)
+        cache.put("token", _claims())
+
+        assert cache.get("token") is None
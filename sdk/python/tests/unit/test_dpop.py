@@ -4,6 +4,7 @@ Tests RFC 9449 compliance with property-based testing using Hypothesis.
 """
 
 import base64
+import contextlib
 import hashlib
 import json
 import time
@@ -15,6 +16,7 @@ from hypothesis import given, settings, strategies as st
 from auth_platform_sdk.dpop import (
     DPoPKeyPair,
     verify_dpop_proof,
+    _cached_access_token_hash,
     _jwk_to_public_key,
 )
 from auth_platform_sdk.errors import DPoPError
@@ -55,6 +57,16 @@ class TestDPoPKeyPair:
         # Should not contain private key
         assert "d" not in jwk
 
+    def test_jwk_is_a_serializable_copy(self) -> None:
+        """JWK should be a plain dict whose changes do not leak back."""
+        key_pair = DPoPKeyPair()
+        jwk = key_pair.jwk
+        original_x = jwk["x"]
+
+        jwk["x"] = "tampered"
+
+        assert json.loads(json.dumps(key_pair.jwk))["x"] == original_x
+
     def test_thumbprint_is_deterministic(self) -> None:
         """Same key should produce same thumbprint."""
         key_pair = DPoPKeyPair()
@@ -63,6 +75,20 @@ class TestDPoPKeyPair:
 
         assert thumbprint1 == thumbprint2
 
+    @pytest.mark.parametrize("algorithm", ["ES256", "ES384", "ES512"])
+    def test_thumbprint_matches_rfc7638_canonical_json(self, algorithm: str) -> None:
+        """Thumbprint should hash the sorted, whitespace-free required members."""
+        key_pair = DPoPKeyPair(algorithm=algorithm)
+        jwk = key_pair.jwk
+        canonical = json.dumps(
+            {"crv": jwk["crv"], "kty": jwk["kty"], "x": jwk["x"], "y": jwk["y"]},
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(canonical.encode()).digest()
+
+        assert key_pair.thumbprint == base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
     def test_different_keys_different_thumbprints(self) -> None:
         """Different keys should have different thumbprints."""
         key_pair1 = DPoPKeyPair()
@@ -165,6 +191,17 @@ class TestDPoPProofVerification:
         assert payload["htm"] == "POST"
         assert payload["htu"] == "https://auth.example.com/token"
 
+    @pytest.mark.parametrize("algorithm", ["ES256", "ES384", "ES512"])
+    def test_pyjwt_verifies_proof_signature(self, algorithm: str) -> None:
+        """Directly signed proofs should verify with PyJWT for every curve."""
+        key_pair = DPoPKeyPair(algorithm=algorithm)
+        proof = key_pair.create_proof("GET", "https://api.example.com/resource")
+
+        public_key = jwt.PyJWK(key_pair.jwk, algorithm=algorithm).key
+        payload = jwt.decode(proof.proof, public_key, algorithms=[algorithm])
+
+        assert payload["htu"] == "https://api.example.com/resource"
+
     def test_rejects_wrong_method(self) -> None:
         """Should reject proof with wrong HTTP method."""
         key_pair = DPoPKeyPair()
@@ -233,6 +270,27 @@ class TestDPoPProofVerification:
                 access_token="wrong_token",
             )
 
+    def test_verification_does_not_cache_presented_tokens(self) -> None:
+        """Should not retain access tokens presented for verification."""
+        key_pair = DPoPKeyPair()
+        proof = key_pair.create_proof(
+            "GET",
+            "https://api.example.com/resource",
+            access_token="client_token",
+        )
+        cached = _cached_access_token_hash.cache_info().currsize
+
+        for presented in ("client_token", "attacker_token"):
+            with contextlib.suppress(DPoPError):
+                verify_dpop_proof(
+                    proof.proof,
+                    "GET",
+                    "https://api.example.com/resource",
+                    access_token=presented,
+                )
+
+        assert _cached_access_token_hash.cache_info().currsize == cached
+
 
 class TestKeyExportImport:
     """Tests for key export and import."""
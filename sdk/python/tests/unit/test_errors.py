@@ -3,6 +3,8 @@
 Tests error hierarchy, serialization, and error codes.
 """
 
+import json
+
 import pytest
 from hypothesis import given, settings, strategies as st
 
@@ -111,6 +113,24 @@ class TestAuthPlatformError:
         assert result["correlation_id"] == "req-123"
         assert result["details"]["extra"] == "info"
 
+    def test_to_dict_without_details_is_json_serializable(self) -> None:
+        """Errors without details should still serialize to plain JSON."""
+        error = AuthPlatformError("Test", ErrorCode.TOKEN_EXPIRED)
+
+        assert not error.details
+        assert json.loads(json.dumps(error.to_dict()))["details"] == {}
+
+    def test_details_is_a_per_error_dict(self) -> None:
+        """Details should be a plain dict that errors do not share."""
+        first = AuthPlatformError("Test", ErrorCode.TOKEN_EXPIRED)
+        second = AuthPlatformError("Test", ErrorCode.TOKEN_EXPIRED)
+
+        first.details["context"] = "added later"
+
+        assert isinstance(first.details, dict)
+        assert not second.details
+        assert json.loads(json.dumps(first.details)) == {"context": "added later"}
+
     def test_repr(self) -> None:
         """Should have useful repr."""
         error = AuthPlatformError("Test", ErrorCode.TOKEN_EXPIRED)
@@ -0,0 +1,180 @@
+"""Unit tests for framework middleware helpers."""
+
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from auth_platform_sdk import middleware
+from auth_platform_sdk.config import AuthPlatformConfig
+from auth_platform_sdk.middleware import (
+    DjangoAuthMiddleware,
+    _shared_async_client,
+    _shared_client,
+    close_shared_clients,
+    close_shared_clients_sync,
+)
+
+
+def _make_config() -> AuthPlatformConfig:
+    return AuthPlatformConfig(
+        base_url="https://auth.example.com",
+        client_id="test-client",
+    )
+
+
+def _bare_django_middleware() -> tuple[DjangoAuthMiddleware, list[dict[str, Any]]]:
+    """Build Django middleware without Django, recording JSON response bodies."""
+    bodies: list[dict[str, Any]] = []
+
+    def json_response(body: dict[str, Any], **_kwargs: Any) -> dict[str, Any]:
+        bodies.append(body)
+        return body
+
+    # Bypass __init__, which needs Django installed
+    mw = object.__new__(DjangoAuthMiddleware)
+    mw.get_response = MagicMock()
+    mw.client = MagicMock()
+    mw._json_response = json_response
+    mw.exempt_methods = {"OPTIONS"}
+    mw._exempt_prefixes = ()
+    return mw, bodies
+
+
+def _request(authorization: str | None = None) -> SimpleNamespace:
+    headers = {} if authorization is None else {"Authorization": authorization}
+    return SimpleNamespace(method="GET", path="/api", headers=headers)
+
+
+@pytest.fixture(autouse=True)
+async def _close_clients() -> AsyncIterator[None]:
+    """Release clients cached by each test."""
+    yield
+    close_shared_clients_sync()
+    await close_shared_clients()
+
+
+class TestSharedClients:
+    """Tests for per-config client sharing."""
+
+    def test_same_config_shares_one_client(self) -> None:
+        """Middleware built from one config reuse the same clients."""
+        config = _make_config()
+
+        assert _shared_client(config) is _shared_client(config)
+        assert _shared_async_client(config) is _shared_async_client(config)
+
+    def test_distinct_configs_get_distinct_clients(self) -> None:
+        """Separate config objects never share a client."""
+        first, second = _make_config(), _make_config()
+
+        assert _shared_client(first) is not _shared_client(second)
+        assert _shared_async_client(first) is not _shared_async_client(second)
+
+    def test_reused_id_does_not_return_stale_client(self) -> None:
+        """An entry left by a collected config is never handed to a new one."""
+        config, stale_config = _make_config(), _make_config()
+        stale_client = _shared_client(stale_config)
+        # Simulate stale_config being collected and its id reused by config
+        middleware._sync_clients[id(config)] = middleware._sync_clients.pop(id(stale_config))
+
+        client = _shared_client(config)
+
+        assert client is not stale_client
+        assert client.config is config
+        stale_client.close()
+
+    async def test_close_shared_clients_clears_async_cache(self) -> None:
+        """Closing async clients forgets them and leaves sync clients alone."""
+        config = _make_config()
+        client = _shared_client(config)
+        async_client = _shared_async_client(config)
+
+        await close_shared_clients()
+
+        assert not middleware._async_clients
+        assert _shared_async_client(config) is not async_client
+        assert _shared_client(config) is client
+
+    def test_close_shared_clients_sync_needs_no_event_loop(self) -> None:
+        """Sync apps close their clients without running an event loop."""
+        config = _make_config()
+        client = _shared_client(config)
+
+        close_shared_clients_sync()
+
+        assert not middleware._sync_clients
+        assert _shared_client(config) is not client
+
+
+class TestDjangoAuthResponses:
+    """Tests for Django middleware error responses."""
+
+    @pytest.mark.parametrize("authorization", [None, "Basic abc"])
+    def test_error_bodies_are_not_shared(self, authorization: str | None) -> None:
+        """Editing one error body in place does not change later responses."""
+        mw, bodies = _bare_django_middleware()
+
+        mw(_request(authorization))
+        bodies[0]["error"] = "tampered"
+        mw(_request(authorization))
+
+        assert bodies[1]["error"] != "tampered"
+        assert bodies[0] is not bodies[1]
+
+    def test_bearer_token_is_validated(self) -> None:
+        """The token after the Bearer prefix is passed to the client."""
+        mw, bodies = _bare_django_middleware()
+        request = _request("Bearer abc.def.ghi")
+
+        mw(request)
+
+        mw.client.validate_token.assert_called_once_with("abc.def.ghi")
+        assert request.user_claims is mw.client.validate_token.return_value
+        assert not bodies
+
+    @pytest.mark.parametrize("authorization", ["Basic abc", "bearer abc", "Bearer"])
+    def test_other_schemes_are_rejected(self, authorization: str) -> None:
+        """Headers without the exact Bearer prefix get the format error."""
+        mw, bodies = _bare_django_middleware()
+
+        mw(_request(authorization))
+
+        mw.client.validate_token.assert_not_called()
+        assert bodies == [{"error": "Invalid authorization header format"}]
+
+
+class TestDjangoExemptPaths:
+    """Tests for the exempt path prefixes."""
+
+    def test_add_exempt_path_updates_prefixes(self) -> None:
+        """Paths added through the helper are exempt."""
+        mw, bodies = _bare_django_middleware()
+        mw.add_exempt_path("/health")
+
+        mw(SimpleNamespace(method="GET", path="/health/live", headers={}))
+
+        assert mw.exempt_paths == ("/health",)
+        mw.get_response.assert_called_once()
+        assert not bodies
+
+    def test_assigned_paths_replace_prefixes(self) -> None:
+        """Assigning a new sequence replaces the exempt prefixes."""
+        mw, bodies = _bare_django_middleware()
+        mw.exempt_paths = ["/health"]
+        mw.exempt_paths = ["/status"]
+
+        mw(SimpleNamespace(method="GET", path="/health", headers={}))
+
+        assert mw.exempt_paths == ("/status",)
+        assert bodies == [{"error": "Missing authorization header"}]
+
+    def test_exempt_paths_cannot_be_edited_in_place(self) -> None:
+        """The exposed prefixes are immutable, so they cannot go stale."""
+        mw, _ = _bare_django_middleware()
+        mw.add_exempt_path("/health")
+
+        with pytest.raises(AttributeError):
+            mw.exempt_paths.append("/metrics")  # type: ignore[attr-defined]
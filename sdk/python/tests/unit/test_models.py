@@ -5,6 +5,8 @@ Tests model validation, serialization, and edge cases.
 
 from __future__ import annotations
 
+import time
+
 import pytest
 from pydantic import ValidationError
 
@@ -48,6 +50,44 @@ class TestTokenResponse:
         assert response.refresh_token == "refresh456"
         assert response.scope == "openid profile"
 
+    def test_from_json(self) -> None:
+        """Test parsing a raw token endpoint body."""
+        response = TokenResponse.from_json(
+            b'{"access_token":"access123","expires_in":"3600",'
+            b'"DPoP-Nonce":"nonce1","unknown":1}'
+        )
+        assert response == TokenResponse(
+            access_token="access123", expires_in=3600, **{"DPoP-Nonce": "nonce1"}
+        )
+
+    @pytest.mark.parametrize(
+        "body",
+        [b'{"access_token":"","expires_in":3600}', b'{"access_token":"a","expires_in":0}', b"{"],
+    )
+    def test_from_json_rejects_invalid(self, body: bytes) -> None:
+        """Test invalid bodies raise pydantic's ValidationError."""
+        with pytest.raises(ValidationError):
+            TokenResponse.from_json(body)
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"access_token":"a","expires_in":60}',
+            b'{"access_token":"a","expires_in":"60","token_type":"DPoP","scope":null}',
+            b'{"access_token":"a","expires_in":60,"refresh_token":"r","DPoP-Nonce":"n"}',
+        ],
+    )
+    def test_from_json_msgspec_matches_pydantic(self, body: bytes) -> None:
+        """Test the msgspec fast path tracks set fields like pydantic."""
+        pytest.importorskip("msgspec")
+        expected = TokenResponse.model_validate_json(body)
+
+        response = TokenResponse.from_json(body)
+
+        assert response == expected
+        assert response.model_fields_set == expected.model_fields_set
+        assert response.model_dump(exclude_unset=True) == expected.model_dump(exclude_unset=True)
+
 
 class TestTokenClaims:
     """Tests for TokenClaims model."""
@@ -76,6 +116,48 @@ class TestTokenClaims:
         )
         assert claims.sub == "user123"
 
+    def test_is_expired(self) -> None:
+        """Claims compare exp against the current Unix time."""
+        now = int(time.time())
+        claims = TokenClaims(sub="u", iss="i", aud="a", exp=now - 1, iat=now - 60)
+        live = TokenClaims(sub="u", iss="i", aud="a", exp=now + 60, iat=now)
+
+        assert claims.is_expired
+        assert not live.is_expired
+
+    def test_scopes(self) -> None:
+        """Scopes are split once into an immutable tuple."""
+        now = int(time.time())
+        claims = TokenClaims(
+            sub="u", iss="i", aud="a", exp=now + 60, iat=now, scope="read  write"
+        )
+        bare = TokenClaims(sub="u", iss="i", aud="a", exp=now + 60, iat=now)
+
+        assert claims.scopes == ("read", "write")
+        assert claims.scopes is claims.scopes
+        assert bare.scopes == ()
+
+
+class TestTokenData:
+    """Tests for TokenData model."""
+
+    def test_from_response_applies_buffer(self) -> None:
+        """Expiry is expires_in minus the buffer from now."""
+        response = TokenResponse(access_token="access123", expires_in=3600)
+        data = TokenData.from_response(response, buffer_seconds=60)
+
+        assert not data.is_expired()
+        remaining = data.time_until_expiry().total_seconds()
+        assert 3530 < remaining <= 3540
+
+    def test_expired_when_buffer_exceeds_lifetime(self) -> None:
+        """Tokens whose lifetime is inside the buffer count as expired."""
+        response = TokenResponse(access_token="access123", expires_in=30)
+        data = TokenData.from_response(response, buffer_seconds=60)
+
+        assert data.is_expired()
+        assert data.time_until_expiry().total_seconds() < 0
+
 
 class TestJWK:
     """Tests for JWK model."""
@@ -127,6 +209,16 @@ class TestJWKS:
         jwks = JWKS(keys=[])
         assert len(jwks.keys) == 0
 
+    def test_get_key(self) -> None:
+        """Test key lookup by ID, including keys built without validation."""
+        first = JWK(kty="EC", kid="key1", use="sig")
+        keys = [first, JWK(kty="RSA", kid="key2", use="enc"), JWK(kty="EC", kid="key1")]
+        for jwks in (JWKS(keys=keys), JWKS.model_construct(keys=keys)):
+            assert jwks.get_key("key1") is first
+            assert jwks.get_key("key2") is keys[1]
+            assert jwks.get_key("missing") is None
+            assert jwks.get_signing_keys() == [first, keys[2]]
+
 
 class TestPKCEChallenge:
     """Tests for PKCEChallenge model."""
@@ -158,6 +250,20 @@ class TestTokenRequest:
         assert request.grant_type == "client_credentials"
         assert request.client_id == "client123"
 
+    def test_to_form_data_omits_empty_fields(self) -> None:
+        """Test form data includes the secret and skips unset fields."""
+        request = TokenRequest(
+            grant_type="client_credentials",
+            client_id="client123",
+            client_secret="secret456",
+            scope="",
+        )
+        assert request.to_form_data() == {
+            "grant_type": "client_credentials",
+            "client_id": "client123",
+            "client_secret": "secret456",
+        }
+
 
 class TestAuthorizationRequest:
     """Tests for AuthorizationRequest model."""
@@ -173,3 +279,18 @@ class TestAuthorizationRequest:
         )
         assert request.response_type == "code"
         assert str(request.redirect_uri) == "https://app.example.com/callback"
+
+    def test_to_query_params_omits_empty_fields(self) -> None:
+        """Test query params include required and set optional fields only."""
+        request = AuthorizationRequest(
+            client_id="client123",
+            redirect_uri="https://app.example.com/callback",
+            state="state123",
+            nonce="",
+        )
+        assert request.to_query_params() == {
+            "response_type": "code",
+            "client_id": "client123",
+            "redirect_uri": "https://app.example.com/callback",
+            "state": "state123",
+        }
@@ -73,6 +73,11 @@ class TestGenerateCodeChallenge:
 
         assert challenge == expected
 
+    def test_rfc7636_example(self) -> None:
+        """Challenge should match the RFC 7636 Appendix B example."""
+        verifier = "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+        assert generate_code_challenge(verifier) == "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+
     @given(length=st.integers(min_value=43, max_value=128))
     @settings(max_examples=50)
     def test_challenge_is_base64url(self, length: int) -> None:
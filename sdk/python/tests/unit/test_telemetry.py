@@ -0,0 +1,193 @@
+"""Unit tests for the tracing decorators."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import logging
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from auth_platform_sdk import telemetry
+from auth_platform_sdk.config import RetryConfig, TelemetryConfig
+from auth_platform_sdk.core.http_executor import AsyncHTTPExecutor, SyncHTTPExecutor
+from auth_platform_sdk.errors import RateLimitError
+from auth_platform_sdk.http import _RetryDriver
+from auth_platform_sdk.telemetry import (
+    SDKLogger,
+    _arg_attributes,
+    _log_level_to_int,
+    _recordable_params,
+    log_level_enabled,
+    traced,
+)
+
+
+class _Service:
+    def call(
+        self, name: str, payload: dict[str, Any], limit: int | None = None, *, flag=True
+    ) -> None:
+        pass
+
+
+class TestRecordArgs:
+    """Tests for record_args argument filtering."""
+
+    def test_skips_parameters_that_cannot_hold_primitives(self) -> None:
+        """Only primitive-compatible parameters are considered."""
+        recordable = _recordable_params(_Service.call)
+
+        assert recordable == ((1, 3), frozenset({"name", "limit", "flag"}))
+
+    def test_records_matching_arguments(self) -> None:
+        """Primitive values of recordable parameters become attributes."""
+        recordable = _recordable_params(_Service.call)
+        attributes = _arg_attributes(
+            recordable, (_Service(), "alice", {"k": 1}), {"limit": 5, "flag": False}
+        )
+
+        assert attributes == {"arg_1": "alice", "kwarg_limit": 5, "kwarg_flag": False}
+
+    def test_varargs_fall_back_to_runtime_checks(self) -> None:
+        """Functions taking *args/**kwargs check every argument."""
+
+        def func(*args: Any, **kwargs: Any) -> None:
+            pass
+
+        assert _recordable_params(func) is None
+        assert _arg_attributes(None, (1, [2]), {"k": "v"}) == {"arg_0": 1, "kwarg_k": "v"}
+
+    def test_decorated_function_returns_result(self) -> None:
+        """The decorator passes arguments and results through."""
+
+        @traced(record_args=True)
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert add(1, b=2) == 3
+
+
+class TestLogLevel:
+    """Tests for log level name conversion."""
+
+    @pytest.mark.parametrize(
+        ("name", "level"),
+        [("debug", 10), ("INFO", 20), ("Warning", 30), ("ERROR", 40), ("critical", 50)],
+    )
+    def test_known_levels(self, name: str, level: int) -> None:
+        """Level names map case-insensitively to logging levels."""
+        assert _log_level_to_int(name) == level
+
+    def test_unknown_level_defaults_to_info(self) -> None:
+        """Unrecognized names fall back to INFO."""
+        assert _log_level_to_int("verbose") == 20
+
+    def test_level_enabled_follows_configured_level(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Level checks read the level current at call time."""
+        monkeypatch.setattr(telemetry._state, "log_level", logging.ERROR)
+        assert not log_level_enabled(logging.WARNING)
+
+        monkeypatch.setattr(telemetry._state, "log_level", logging.WARNING)
+        assert log_level_enabled(logging.WARNING)
+
+
+class TestRetryLogging:
+    """Tests for HTTP executor retry logging."""
+
+    @pytest.mark.parametrize(
+        ("executor_cls", "client_cls"),
+        [(SyncHTTPExecutor, httpx.Client), (AsyncHTTPExecutor, httpx.AsyncClient)],
+    )
+    def test_generic_structlog_logger_is_supported(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        executor_cls: type[SyncHTTPExecutor | AsyncHTTPExecutor],
+        client_cls: type[httpx.Client | httpx.AsyncClient],
+    ) -> None:
+        """Executors work with loggers lacking level introspection and track level changes."""
+        # Generic structlog loggers only proxy the log methods themselves
+        logger = MagicMock(spec=["debug", "info", "warning", "error", "bind"])
+        monkeypatch.setattr(telemetry._state, "logger", logger)
+        monkeypatch.setattr(telemetry._state, "log_level", logging.ERROR)
+        executor = executor_cls(MagicMock(spec=client_cls), RetryConfig())
+
+        executor._log_retry("retrying", attempt=1, delay=0.1)
+        logger.warning.assert_not_called()
+
+        monkeypatch.setattr(telemetry._state, "log_level", logging.WARNING)
+        executor._log_retry("retrying", attempt=1, delay=0.1)
+        logger.warning.assert_called_once()
+
+    def test_request_helpers_gate_retry_logs_on_level(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The request helpers skip retry log calls below the SDK level."""
+        logger = MagicMock(spec=["debug", "info", "warning", "error", "bind"])
+        driver = _RetryDriver(RetryConfig(), None)
+        driver._logger = logger
+        errors = [RateLimitError(retry_after=1), httpx.ConnectError("refused")]
+
+        monkeypatch.setattr(telemetry._state, "log_level", logging.ERROR)
+        for error in errors:
+            driver.on_error(error, attempt=0)
+        logger.warning.assert_not_called()
+
+        monkeypatch.setattr(telemetry._state, "log_level", logging.WARNING)
+        for error in errors:
+            driver.on_error(error, attempt=0)
+        assert logger.warning.call_count == 2
+
+
+class TestSDKLogger:
+    """Tests for SDKLogger level filtering."""
+
+    def test_drops_messages_below_configured_level(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Filtered messages never reach structlog."""
+        monkeypatch.setattr(telemetry._state, "log_level", logging.WARNING)
+        logger = SDKLogger()
+        logger._logger = MagicMock()
+
+        logger.debug("dropped", key="value")
+        logger.info("dropped")
+        logger.warning("kept")
+        logger.error("kept")
+
+        logger._logger.debug.assert_not_called()
+        logger._logger.info.assert_not_called()
+        logger._logger.warning.assert_called_once_with("kept")
+        logger._logger.error.assert_called_once_with("kept")
+
+    def test_bind_returns_slotted_logger_with_context(self) -> None:
+        """Bound loggers wrap the bound structlog logger without a __dict__."""
+        logger = SDKLogger()
+        logger._logger = MagicMock()
+
+        bound = logger.bind(request_id="r1")
+
+        assert isinstance(bound, SDKLogger)
+        assert not hasattr(bound, "__dict__")
+        logger._logger.bind.assert_called_once_with(request_id="r1")
+        assert bound._logger is logger._logger.bind.return_value
+
+
+class TestConfigureTelemetry:
+    """Tests for configure_telemetry."""
+
+    def test_reconfigures_structlog_only_on_level_change(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated calls with the same level leave structlog alone."""
+        configure = MagicMock()
+        monkeypatch.setattr(telemetry.structlog, "configure", configure)
+        monkeypatch.setattr(telemetry, "_state", telemetry._TelemetryState())
+
+        telemetry.configure_telemetry(TelemetryConfig(log_level="INFO"))
+        telemetry.configure_telemetry(TelemetryConfig(log_level="info"))
+        assert configure.call_count == 1
+
+        telemetry.configure_telemetry(TelemetryConfig(log_level="DEBUG"))
+        assert configure.call_count == 2
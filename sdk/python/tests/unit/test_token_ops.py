@@ -0,0 +1,186 @@
+"""Unit tests for centralized token operations."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from auth_platform_sdk import AsyncAuthPlatformClient
+from auth_platform_sdk.config import AuthPlatformConfig
+from auth_platform_sdk.core import RefreshCoalescer, TokenOperations, refresh_coalescer
+from auth_platform_sdk.models import TokenData, TokenResponse
+
+
+def _make_ops(**overrides: object) -> TokenOperations:
+    config = AuthPlatformConfig(
+        base_url="https://auth.example.com",
+        client_id="test-client",
+        **overrides,
+    )
+    return TokenOperations(config)
+
+
+class TestRequestBuilders:
+    """Tests for grant payload construction."""
+
+    def test_client_credentials_includes_secret_and_scope(self) -> None:
+        """Client credentials payload carries the secret and default scope."""
+        ops = _make_ops(client_secret="s3cret", scopes=["read", "write"])
+
+        data = ops.build_client_credentials_request()
+
+        assert data == {
+            "grant_type": "client_credentials",
+            "client_id": "test-client",
+            "client_secret": "s3cret",
+            "scope": "read write",
+        }
+
+    def test_client_credentials_requires_secret(self) -> None:
+        """Client credentials flow fails without a configured secret."""
+        with pytest.raises(ValueError):
+            _make_ops().build_client_credentials_request()
+
+    def test_payloads_do_not_share_state(self) -> None:
+        """Mutating a returned payload must not leak into later ones."""
+        ops = _make_ops(client_secret="s3cret")
+
+        first = ops.build_refresh_token_request("rt-1")
+        first["extra"] = "value"
+        second = ops.build_refresh_token_request("rt-2")
+
+        assert "extra" not in second
+        assert second["refresh_token"] == "rt-2"
+
+    def test_authorization_code_without_secret(self) -> None:
+        """Public clients omit client_secret from the code exchange."""
+        data = _make_ops().build_authorization_code_request(
+            "code", "https://app.example.com/cb", code_verifier="verifier"
+        )
+
+        assert "client_secret" not in data
+        assert data["code_verifier"] == "verifier"
+
+
+class TestRefreshCoalescer:
+    """Tests for single-flight token refresh."""
+
+    async def test_concurrent_async_callers_share_one_refresh(self) -> None:
+        """Concurrent tasks trigger exactly one refresh call."""
+        coalescer: RefreshCoalescer[str] = RefreshCoalescer()
+        calls = 0
+        release = asyncio.Event()
+
+        async def do_refresh() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "new-token"
+
+        tasks = [asyncio.create_task(coalescer.run(do_refresh)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert results == ["new-token"] * 10
+
+    async def test_async_failure_propagates_and_resets(self) -> None:
+        """A failed refresh reaches every waiter and the next call retries."""
+        coalescer: RefreshCoalescer[str] = RefreshCoalescer()
+
+        async def fail() -> str:
+            raise RuntimeError("refresh failed")
+
+        with pytest.raises(RuntimeError):
+            await coalescer.run(fail)
+
+        async def succeed() -> str:
+            return "token"
+
+        assert await coalescer.run(succeed) == "token"
+
+    def test_concurrent_threads_share_one_refresh(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Concurrent threads trigger exactly one refresh call."""
+        waiting = threading.Semaphore(0)
+
+        class WaitSignallingEvent(threading.Event):
+            """Event that signals each thread about to block on it."""
+
+            def wait(self, timeout: float | None = None) -> bool:
+                waiting.release()
+                return super().wait(timeout)
+
+        monkeypatch.setattr(
+            refresh_coalescer,
+            "threading",
+            SimpleNamespace(Event=WaitSignallingEvent, Lock=threading.Lock),
+        )
+        coalescer: RefreshCoalescer[str] = RefreshCoalescer()
+        calls = 0
+        started = threading.Event()
+        release = threading.Event()
+
+        def do_refresh() -> str:
+            nonlocal calls
+            calls += 1
+            started.set()
+            release.wait()
+            return "new-token"
+
+        results: list[str] = []
+        leader = threading.Thread(
+            target=lambda: results.append(coalescer.run_sync(do_refresh))
+        )
+        leader.start()
+        started.wait()
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(coalescer.run_sync(do_refresh))
+            )
+            for _ in range(5)
+        ]
+        for thread in followers:
+            thread.start()
+        # Release the leader only once every follower waits on its flight
+        for _ in followers:
+            assert waiting.acquire(timeout=5)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert calls == 1
+        assert results == ["new-token"] * 6
+
+    async def test_client_coalesces_expired_token_refresh(self) -> None:
+        """Concurrent callers on an expired token share one token request."""
+        client = AsyncAuthPlatformClient(
+            AuthPlatformConfig(
+                base_url="https://auth.example.com", client_id="test-client"
+            )
+        )
+        client._tokens = TokenData(
+            access_token="old",
+            token_type="Bearer",
+            expires_at=datetime.now(UTC) - timedelta(seconds=1),
+            refresh_token="refresh",
+        )
+        calls = 0
+
+        async def token_request(_data: dict[str, object]) -> TokenResponse:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return TokenResponse(
+                access_token="new", token_type="Bearer", expires_in=3600
+            )
+
+        client._token_request = token_request  # type: ignore[method-assign]
+
+        tokens = await asyncio.gather(*(client.get_access_token() for _ in range(10)))
+
+        assert calls == 1
+        assert tokens == ["new"] * 10
+        await client.close()